@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from .extractors import (
@@ -12,103 +13,87 @@ from .extractors import (
     extract_role,
     extract_sender,
     extract_subject,
+    has_description_marker,
+    html_to_text,
     normalize_email,
+    scan_headers,
 )
 from .models import ParsedJob
 from .stage_detector import detect_email_type, detect_stage
 from .translator import translate_to_ru
 
 
-def _read_file(file_path: Path) -> str:
-    try:
-        return file_path.read_text(encoding="utf-8", errors="ignore")
-    except Exception:
-        try:
-            return file_path.read_text(errors="ignore")
-        except Exception:
-            return ""
-
-
-def parse_email(file_path: str | Path) -> ParsedJob:
-    path = Path(file_path)
-    raw_text = _read_file(path)
-    normalized = normalize_email(raw_text)
+_READ_BLOCK = 1 << 20
+# Extractors only need the head of an email; bloated files (inline CSS,
+# base64 parts) are read in full only when the cap hides the description.
+_READ_LIMIT = 64 * 1024
 
-    subject = None
-    sender = None
-    email_type = "unknown"
-    stage = "Applied"
-    company = None
-    role = None
-    location = None
-    job_link = None
-    description_en = None
-    description_ru = None
-    extracted_date = None
 
+def _read_file(file_path: Path, limit: int | None = _READ_LIMIT) -> tuple[str, bool]:
+    """Return the decoded file text and whether it was cut at ``limit`` bytes."""
+    truncated = False
     try:
-        subject = extract_subject(raw_text, normalized)
-    except Exception:
-        pass
-    if not subject:
+        fd = os.open(file_path, os.O_RDONLY)
         try:
-            stem = path.stem
-            if " - " in stem:
-                subject = stem.split(" - ", 1)[1].strip()
-        except Exception:
-            pass
-
-    try:
-        sender = extract_sender(raw_text)
-    except Exception:
-        pass
-
-    try:
-        email_type = detect_email_type(normalized)
-        stage = detect_stage(email_type)
-    except Exception:
-        stage = "Applied"
-
-    try:
-        company = extract_company(subject, normalized, sender)
-    except Exception:
-        company = None
-
-    try:
-        role = extract_role(subject, normalized)
+            blocks: list[bytes] = []
+            total = 0
+            while True:
+                size = _READ_BLOCK if limit is None else min(_READ_BLOCK, limit - total)
+                if size <= 0:
+                    truncated = bool(os.read(fd, 1))
+                    break
+                block = os.read(fd, size)
+                if not block:
+                    break
+                blocks.append(block)
+                total += len(block)
+        finally:
+            os.close(fd)
+        text = b"".join(blocks).decode("utf-8", errors="ignore")
     except Exception:
-        role = None
-
-    try:
-        location = extract_location(normalized)
-    except Exception:
-        location = None
-
-    try:
-        job_link = extract_job_link(normalized)
-    except Exception:
-        job_link = None
-
+        return "", False
+    # Match the universal-newline translation of text-mode reads.
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if file_path.suffix.lower() == ".html":
+        # Parse markup properly so script/style bodies and comments are dropped.
+        text = html_to_text(text)
+    return text, truncated
+
+
+def _subject_from_stem(path: Path) -> str | None:
+    stem = path.stem
+    if " - " in stem:
+        return stem.split(" - ", 1)[1].strip()
+    return None
+
+
+def parse_email(file_path: str | Path, translate: bool = True) -> ParsedJob:
+    # Every extractor catches its own failures and returns None (or a safe
+    # default), so the pipeline below runs without per-step try blocks.
+    path = Path(file_path)
+    raw_text, truncated = _read_file(path)
+    normalized = normalize_email(raw_text)
+    # Lowercased once and shared by the case-insensitive body scans.
+    normalized_lower = normalized.lower()
+    if truncated and not has_description_marker(normalized_lower):
+        raw_text, _ = _read_file(path, limit=None)
+        normalized = normalize_email(raw_text)
+        normalized_lower = normalized.lower()
+
+    headers = scan_headers(raw_text)
+    subject = extract_subject(raw_text, normalized, headers) or _subject_from_stem(path)
+    sender = extract_sender(raw_text, headers)
+    stage = detect_stage(detect_email_type(normalized, normalized_lower))
+    company = extract_company(subject, normalized, sender)
+    role = extract_role(subject, normalized, normalized_lower)
+    location = extract_location(normalized)
+    job_link = extract_job_link(normalized)
     if not company:
-        try:
-            company = detect_domain_name_from_url(job_link)
-        except Exception:
-            company = None
-
-    try:
-        description_en = extract_description(normalized)
-    except Exception:
-        description_en = normalized[:2000] if normalized else None
-
-    try:
-        description_ru = translate_to_ru(description_en)
-    except Exception:
-        description_ru = description_en
-
-    try:
-        extracted_date = extract_date(raw_text, path)
-    except Exception:
-        extracted_date = None
+        company = detect_domain_name_from_url(job_link)
+    description_en = extract_description(normalized, normalized_lower)
+    description_ru = translate_to_ru(description_en) if translate else description_en
+    extracted_date = extract_date(raw_text, path, headers)
 
     return ParsedJob(
         company=company,
@@ -2,36 +2,197 @@ from __future__ import annotations
 
 import html
 import re
+from functools import lru_cache
 from datetime import datetime
 from email.utils import parsedate_to_datetime
+from html.parser import HTMLParser
 from pathlib import Path
 from urllib.parse import urlparse
 
+_RE_TAGS = re.compile(r"<[^>]+>")
+_RE_WS = re.compile(r"[ \t]+")
+_RE_NL = re.compile(r"\n{3,}")
+_RE_SUBJECT = re.compile(r"^(?:subject|тема):\s*(.+)$", re.IGNORECASE | re.MULTILINE)
+_RE_SENDER = re.compile(r"^(?:from|от):\s*(.+)$", re.IGNORECASE | re.MULTILINE)
+_RE_DATE = re.compile(r"^(?:date|дата):\s*(.+)$", re.IGNORECASE | re.MULTILINE)
+# Zero-width so a header line swallowed by another field's ``\s*`` (an empty
+# value followed by the next header) is still seen by its own field.
+_RE_HEADER_FIELDS = re.compile(
+    r"^(?=(subject|тема|from|от|date|дата):\s*(.+)$)", re.IGNORECASE | re.MULTILINE
+)
+_HEADER_FIELD_KEYS = {
+    "subject": "subject",
+    "тема": "subject",
+    "from": "sender",
+    "от": "sender",
+    "date": "date",
+    "дата": "date",
+}
+_RE_HEADER = re.compile(r"^(from|to|date|subject|от|кому|дата|тема):")
+_RE_URL = re.compile(r"https?://[^\s]+")
+_RE_URL_OR_AT = re.compile(r"https?://|@")
+_RE_NON_ALNUM = re.compile(r"[^a-zA-Z0-9]+")
+_RE_EMAIL = re.compile(r"([A-Za-z0-9._%+-]+)@([A-Za-z0-9.-]+\.[A-Za-z]{2,})")
+_RE_MONTH = re.compile(r"\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\b")
+_RE_SUBJECT_AT = re.compile(r"(?i)\bat\s+([A-Z][A-Za-z0-9&.\- ]{2,80})")
+_RE_SUBJECT_NO_ROLE = re.compile(r"(?i)your application was sent to|ваша заявка на вакансию")
+_RE_SUBJECT_PREFIX = re.compile(r"\s*([^:]{2,120}):")
+_RE_SUBJECT_QUOTED = re.compile(r"[\"“”«»]([^\"“”«»]{2,120})[\"“”«»]")
+
+# Each pattern is paired with literals at least one of which must occur in
+# the haystack (lowercased for the case-insensitive role patterns); patterns
+# whose literals are absent are skipped without running the regex engine.
+_COMPANY_PATS = [
+    ((), re.compile(r"(?:sent to|at|from)\s+([A-Z][A-Za-z0-9&.\- ]{2,60})")),
+    (("sent",), re.compile(r"(?:application(?:\s+was)?\s+sent\s+to)\s+([A-Z][A-Za-z0-9&.\- ]{2,60})")),
+    (("компани",), re.compile(r"(?:в\s+компани(?:ю|и)|компания)\s+([A-ZА-Я][A-Za-zА-Яа-я0-9&.\- ]{2,80})")),
+]
+_ROLE_PATS = [
+    (("position", "role"), re.compile(r"(?:position|role|for the position)\s+(.+?)(?:\n| at | in )", re.IGNORECASE)),
+    (("position",), re.compile(r"(?i)for\s+the\s+(.+?)\s+position")),
+    (("thank you for applying for the",), re.compile(r"(?i)thank you for applying for the\s+(.+?)\s+position")),
+    (("application for",), re.compile(r"(?i)application for\s+(.+?)(?:\n| at | in )")),
+    (("ваканси",), re.compile(r"(?i)ваканси(?:я|ю)\s+[«\"]?(.+?)[»\"]?(?:\s+в|\n|$)")),
+    (("apply now to",), re.compile(r"(?i)apply now to\s+[‘'\"]?(.+?)[’'\"]?(?:$|\n)")),
+]
+_LOC_PATS = [
+    re.compile(p)
+    for p in (
+        r"\b(Remote|Hybrid)\b",
+        r"\b([A-Z][a-z]+(?:\s[A-Z][a-z]+),\sIsrael)\b",
+        r"\b(Tel Aviv|Israel)\b",
+    )
+]
+
+_DIGITS_DEL = str.maketrans("", "", "0123456789")
+
+_URL_NOISE_FRAGMENTS = (
+    "/help/",
+    "unsubscribe",
+    "email-unsubscribe",
+    "/mypreferences/",
+    "/psettings/",
+    "/share?",
+    "/feed/",
+    "trkemail=",
+    "securityhelp",
+)
+
+_DESCRIPTION_MARKERS = (
+    "job description",
+    "about the role",
+    "responsibilities",
+    "what you'll do",
+    "about this job",
+)
+
+_HTML_SKIP_TAGS = frozenset({"script", "style"})
+_HTML_BLOCK_TAGS = frozenset(
+    {
+        "br", "p", "div", "li", "tr", "table", "ul", "ol", "hr",
+        "h1", "h2", "h3", "h4", "h5", "h6",
+        "section", "article", "header", "footer", "blockquote", "pre",
+    }
+)
+
+
+class _HTMLTextExtractor(HTMLParser):
+    """Collect visible text, breaking lines at block-level tags only."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if tag in _HTML_SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in _HTML_BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_startendtag(self, tag: str, attrs: list) -> None:
+        if tag in _HTML_BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _HTML_SKIP_TAGS:
+            if self._skip_depth:
+                self._skip_depth -= 1
+        elif tag in _HTML_BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+def html_to_text(raw_html: str) -> str:
+    try:
+        extractor = _HTMLTextExtractor()
+        extractor.feed(raw_html or "")
+        extractor.close()
+        return "".join(extractor.parts)
+    except Exception:
+        return raw_html or ""
+
 
 def normalize_email(text: str) -> str:
     try:
-        clean = html.unescape(text or "")
-        clean = re.sub(r"<[^>]+>", " ", clean)
+        clean = _RE_TAGS.sub(" ", html.unescape(text or ""))
         clean = clean.replace("\r\n", "\n").replace("\r", "\n")
-        clean = re.sub(r"[ \t]+", " ", clean)
-        clean = re.sub(r"\n{3,}", "\n\n", clean)
-        lines = [line.strip() for line in clean.split("\n")]
+
+        # Single pass over lines: strip, collapse space/tab runs and keep at
+        # most one empty line per run of consecutive line breaks.
+        lines: list[str] = []
+        blank_run = False
+        for line in clean.split("\n"):
+            if not line:
+                if not blank_run:
+                    lines.append("")
+                    blank_run = True
+                continue
+            blank_run = False
+            line = line.strip()
+            if "  " in line or "\t" in line:
+                line = _RE_WS.sub(" ", line)
+            lines.append(line)
         return "\n".join(lines).strip()
     except Exception:
         return (text or "").strip()
 
 
-def extract_subject(raw_text: str, normalized_text: str) -> str | None:
+def scan_headers(raw_text: str) -> dict[str, str]:
+    """Collect the first subject/sender/date header values in a single pass."""
+    headers: dict[str, str] = {}
     try:
-        match = re.search(r"(?im)^(?:subject|тема):\s*(.+)$", raw_text or "")
-        if match:
-            return match.group(1).strip()
+        for match in _RE_HEADER_FIELDS.finditer(raw_text or ""):
+            key = _HEADER_FIELD_KEYS[match.group(1).lower()]
+            if key not in headers:
+                headers[key] = match.group(2)
+                if len(headers) == 3:
+                    break
+    except Exception:
+        pass
+    return headers
+
+
+def extract_subject(
+    raw_text: str, normalized_text: str, headers: dict[str, str] | None = None
+) -> str | None:
+    try:
+        if headers is None:
+            match = _RE_SUBJECT.search(raw_text or "")
+            value = match.group(1) if match else None
+        else:
+            value = headers.get("subject")
+        if value is not None:
+            return value.strip()
 
         # Fallback to first meaningful line
         for line in (normalized_text or "").split("\n")[:40]:
             stripped = line.strip()
             low = stripped.lower()
-            if re.match(r"^(from|to|date|subject|от|кому|дата|тема):", low):
+            if _RE_HEADER.match(low):
                 continue
             if stripped in {"-----", "----------------------------------------"}:
                 continue
@@ -42,29 +203,34 @@ def extract_subject(raw_text: str, normalized_text: str) -> str | None:
     return None
 
 
-def extract_sender(raw_text: str) -> str | None:
+def extract_sender(raw_text: str, headers: dict[str, str] | None = None) -> str | None:
     try:
-        match = re.search(r"(?im)^(?:from|от):\s*(.+)$", raw_text or "")
+        if headers is not None:
+            value = headers.get("sender")
+            return value.strip() if value is not None else None
+        match = _RE_SENDER.search(raw_text or "")
         return match.group(1).strip() if match else None
     except Exception:
         return None
 
 
+@lru_cache(maxsize=1024)
 def _titleize_domain(domain: str) -> str:
     base = domain.split(".")[0]
-    base = re.sub(r"[^a-zA-Z0-9]+", " ", base)
+    base = _RE_NON_ALNUM.sub(" ", base)
     return " ".join(part.capitalize() for part in base.split() if part) or None
 
 
+@lru_cache(maxsize=1024)
 def _company_from_sender(sender: str | None) -> str | None:
     if not sender:
         return None
-    sender_name = re.sub(r"<[^>]+>", "", sender).strip().strip("\"'")
+    sender_name = _RE_TAGS.sub("", sender).strip().strip("\"'")
     if sender_name and "@" in sender_name:
         sender_name = ""
     if sender_name and len(sender_name) > 2 and "linkedin" not in sender_name.lower():
         return sender_name
-    m = re.search(r"([A-Za-z0-9._%+-]+)@([A-Za-z0-9.-]+\.[A-Za-z]{2,})", sender)
+    m = _RE_EMAIL.search(sender)
     if not m:
         return None
     domain = m.group(2).lower()
@@ -73,18 +239,24 @@ def _company_from_sender(sender: str | None) -> str | None:
     return _titleize_domain(domain)
 
 
+def _count_digits(value: str) -> int:
+    if value.isascii():
+        return len(value) - len(value.translate(_DIGITS_DEL))
+    return sum(ch.isdigit() for ch in value)
+
+
 def _cleanup_company(value: str | None) -> str | None:
     if not value:
         return None
-    value = re.sub(r"\s+", " ", value).strip(" -:;,.\t")
+    value = " ".join(value.split()).strip(" -:;,.\t")
     if len(value) < 2:
         return None
     low = value.lower()
-    if re.search(r"\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\b", low):
+    if _RE_MONTH.search(low):
         return None
     if low in {"linkedin", "дата", "от", "subject"}:
         return None
-    if sum(ch.isdigit() for ch in value) >= 4:
+    if _count_digits(value) >= 4:
         return None
     return value
 
@@ -92,16 +264,12 @@ def _cleanup_company(value: str | None) -> str | None:
 def extract_company(subject: str | None, text: str, sender: str | None = None) -> str | None:
     haystacks = [subject or "", text or ""]
 
-    patterns = [
-        r"(?:sent to|at|from)\s+([A-Z][A-Za-z0-9&.\- ]{2,60})",
-        r"(?:application(?:\s+was)?\s+sent\s+to)\s+([A-Z][A-Za-z0-9&.\- ]{2,60})",
-        r"(?:в\s+компани(?:ю|и)|компания)\s+([A-ZА-Я][A-Za-zА-Яа-я0-9&.\- ]{2,80})",
-    ]
-
     try:
         for source in haystacks:
-            for pat in patterns:
-                m = re.search(pat, source)
+            for literals, pat in _COMPANY_PATS:
+                if literals and not any(literal in source for literal in literals):
+                    continue
+                m = pat.search(source)
                 if m:
                     candidate = _cleanup_company(m.group(1))
                     if candidate:
@@ -118,7 +286,7 @@ def extract_company(subject: str | None, text: str, sender: str | None = None) -
                     return candidate
 
         if subject:
-            m = re.search(r"(?i)\bat\s+([A-Z][A-Za-z0-9&.\- ]{2,80})", subject)
+            m = _RE_SUBJECT_AT.search(subject)
             if m:
                 candidate = _cleanup_company(m.group(1))
                 if candidate and "linkedin" not in candidate.lower():
@@ -136,7 +304,7 @@ def extract_company(subject: str | None, text: str, sender: str | None = None) -
 def _cleanup_role(role: str | None) -> str | None:
     if not role:
         return None
-    role = re.sub(r"\s+", " ", role).strip(" -:;,.\t")
+    role = " ".join(role.split()).strip(" -:;,.\t")
     if len(role) < 2:
         return None
     if role.lower() in {"от", "дата", "тема", "from", "date", "subject"}:
@@ -162,21 +330,17 @@ def _cleanup_role(role: str | None) -> str | None:
     return role
 
 
-def extract_role(subject: str | None, text: str) -> str | None:
+def extract_role(subject: str | None, text: str, lowered: str | None = None) -> str | None:
     source = "\n".join(filter(None, [subject or "", text or ""]))
-
-    patterns = [
-        r"(?:position|role|for the position)\s+(.+?)(?:\n| at | in )",
-        r"(?i)for\s+the\s+(.+?)\s+position",
-        r"(?i)thank you for applying for the\s+(.+?)\s+position",
-        r"(?i)application for\s+(.+?)(?:\n| at | in )",
-        r"(?i)ваканси(?:я|ю)\s+[«\"]?(.+?)[»\"]?(?:\s+в|\n|$)",
-        r"(?i)apply now to\s+[‘'\"]?(.+?)[’'\"]?(?:$|\n)",
-    ]
+    if lowered is None:
+        lowered = (text or "").lower()
+    source_lower = "\n".join(filter(None, [(subject or "").lower(), lowered]))
 
     try:
-        for pat in patterns:
-            m = re.search(pat, source, flags=re.IGNORECASE)
+        for literals, pat in _ROLE_PATS:
+            if not any(literal in source_lower for literal in literals):
+                continue
+            m = pat.search(source)
             if m:
                 candidate = _cleanup_role(m.group(1))
                 if candidate:
@@ -184,15 +348,15 @@ def extract_role(subject: str | None, text: str) -> str | None:
 
         # Subject fallback: text before colon often role in digest emails
         if subject:
-            if re.search(r"(?i)your application was sent to|ваша заявка на вакансию", subject):
+            if _RE_SUBJECT_NO_ROLE.search(subject):
                 return None
-            m = re.match(r"\s*([^:]{2,120}):", subject)
+            m = _RE_SUBJECT_PREFIX.match(subject)
             if m:
                 role = _cleanup_role(m.group(1))
                 if role:
                     return role
             # Quoted role fallback
-            m2 = re.search(r"[\"“”«»]([^\"“”«»]{2,120})[\"“”«»]", subject)
+            m2 = _RE_SUBJECT_QUOTED.search(subject)
             if m2:
                 role = _cleanup_role(m2.group(1))
                 if role:
@@ -202,11 +366,11 @@ def extract_role(subject: str | None, text: str) -> str | None:
         for line in (text or "").split("\n"):
             stripped = line.strip()
             low = stripped.lower()
-            if re.match(r"^(from|to|date|subject|от|кому|дата|тема):", low):
+            if _RE_HEADER.match(low):
                 continue
             if stripped in {"-----", "----------------------------------------"}:
                 continue
-            if len(stripped) >= 6 and not re.search(r"https?://|@", stripped):
+            if len(stripped) >= 6 and not _RE_URL_OR_AT.search(stripped):
                 if stripped.lower() not in {
                     "job description",
                     "about the role",
@@ -226,13 +390,8 @@ def extract_role(subject: str | None, text: str) -> str | None:
 
 def extract_location(text: str) -> str | None:
     try:
-        patterns = [
-            r"\b(Remote|Hybrid)\b",
-            r"\b([A-Z][a-z]+(?:\s[A-Z][a-z]+),\sIsrael)\b",
-            r"\b(Tel Aviv|Israel)\b",
-        ]
-        for pat in patterns:
-            m = re.search(pat, text or "")
+        for pat in _LOC_PATS:
+            m = pat.search(text or "")
             if m:
                 return m.group(1).strip()
     except Exception:
@@ -240,71 +399,62 @@ def extract_location(text: str) -> str | None:
     return None
 
 
+def _job_link_tier(lower: str) -> int:
+    if "linkedin.com" in lower and ("/jobs/view/" in lower or "/company/" in lower or "/jobs/search/" in lower):
+        return 0
+    if "greenhouse.io" in lower or "greenhouse" in lower:
+        return 1
+    if "lever.co" in lower or "lever" in lower:
+        return 2
+    if "workday" in lower:
+        return 3
+    return 4
+
+
 def extract_job_link(text: str) -> str | None:
     try:
-        urls = re.findall(r"https?://[^\s]+", text or "")
-        if not urls:
-            return None
-
-        noise_fragments = [
-            "/help/",
-            "unsubscribe",
-            "email-unsubscribe",
-            "/mypreferences/",
-            "/psettings/",
-            "/share?",
-            "/feed/",
-            "trkemail=",
-            "securityhelp",
-        ]
-
-        filtered: list[str] = []
-        for url in urls:
-            lower = url.lower().rstrip(".,;)")
-            if any(fragment in lower for fragment in noise_fragments):
+        # Single pass keeping the best (tier, length) candidate; noisy URLs
+        # are only used when nothing else was found. Ties keep the first URL.
+        best: tuple[tuple[int, int], str] | None = None
+        best_noise: tuple[tuple[int, int], str] | None = None
+        for match in _RE_URL.finditer(text or ""):
+            url = match.group(0).rstrip(".,;)")
+            lower = url.lower()
+            key = (_job_link_tier(lower), len(url))
+            if any(fragment in lower for fragment in _URL_NOISE_FRAGMENTS):
+                if best_noise is None or key < best_noise[0]:
+                    best_noise = (key, url)
                 continue
-            filtered.append(url.rstrip(".,;)"))
-
-        if not filtered:
-            filtered = [u.rstrip(".,;)") for u in urls]
+            if best is None or key < best[0]:
+                best = (key, url)
 
-        def rank(url: str) -> tuple[int, int]:
-            lower = url.lower()
-            if "linkedin.com" in lower and ("/jobs/view/" in lower or "/company/" in lower or "/jobs/search/" in lower):
-                return (0, len(url))
-            if "greenhouse.io" in lower or "greenhouse" in lower:
-                return (1, len(url))
-            if "lever.co" in lower or "lever" in lower:
-                return (2, len(url))
-            if "workday" in lower:
-                return (3, len(url))
-            return (4, len(url))
-
-        ranked = sorted(filtered, key=rank)
-        return ranked[0]
+        chosen = best or best_noise
+        return chosen[1] if chosen else None
     except Exception:
         return None
 
 
-def extract_description(text: str) -> str | None:
+def has_description_marker(lowered: str) -> bool:
+    return any(marker in lowered for marker in _DESCRIPTION_MARKERS)
+
+
+def extract_description(text: str, lowered: str | None = None) -> str | None:
     if not text:
         return None
 
     try:
-        lowered = text.lower()
-        markers = [
-            "job description",
-            "about the role",
-            "responsibilities",
-            "what you'll do",
-            "about this job",
-        ]
-
-        for marker in markers:
+        if lowered is None:
+            lowered = text.lower()
+
+        # Markers are tried in priority order over the whole body, not the
+        # leftmost hit in a prefix window: parse_email re-reads truncated
+        # emails precisely to reach markers that sit deep in the file. Plain
+        # str.find also beats a compiled alternation for these five literals.
+        for marker in _DESCRIPTION_MARKERS:
             idx = lowered.find(marker)
             if idx >= 0:
                 chunk = text[idx : idx + 5000]
-                chunk = re.sub(r"\n{3,}", "\n\n", chunk).strip()
+                chunk = _RE_NL.sub("\n\n", chunk).strip()
                 return chunk[:5000]
 
         fallback = text[:2000].strip()
@@ -313,11 +463,17 @@ def extract_description(text: str) -> str | None:
         return (text[:2000] if text else None)
 
 
-def extract_date(raw_text: str, file_path: Path) -> str | None:
+def extract_date(
+    raw_text: str, file_path: Path, headers: dict[str, str] | None = None
+) -> str | None:
     try:
-        date_match = re.search(r"(?im)^(?:date|дата):\s*(.+)$", raw_text or "")
-        if date_match:
-            parsed = parsedate_to_datetime(date_match.group(1).strip())
+        if headers is None:
+            date_match = _RE_DATE.search(raw_text or "")
+            value = date_match.group(1) if date_match else None
+        else:
+            value = headers.get("date")
+        if value is not None:
+            parsed = parsedate_to_datetime(value.strip())
             if parsed:
                 return parsed.isoformat()
     except Exception:
@@ -330,6 +486,7 @@ def extract_date(raw_text: str, file_path: Path) -> str | None:
         return None
 
 
+@lru_cache(maxsize=1024)
 def detect_domain_name_from_url(url: str | None) -> str | None:
     if not url:
         return None
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 
 
 @dataclass
@@ -16,4 +16,15 @@ class ParsedJob:
     source_file: str
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Every field is a str or None, so asdict()'s deepcopy is pure overhead.
+        return {
+            "company": self.company,
+            "role": self.role,
+            "location": self.location,
+            "stage": self.stage,
+            "job_link": self.job_link,
+            "description_en": self.description_en,
+            "description_ru": self.description_ru,
+            "date": self.date,
+            "source_file": self.source_file,
+        }
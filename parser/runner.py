@@ -2,52 +2,108 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional: the stdlib encoder is used when missing.
+    orjson = None
+
 if __package__:
     from .email_parser import parse_email
 else:  # pragma: no cover
-    import sys
-
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
     from parser.email_parser import parse_email
 
 
-def parse_folder(folder: str | Path) -> list[dict]:
+def _parse_one(file_path: Path, translate: bool = True) -> dict | None:
+    try:
+        return parse_email(file_path, translate=translate).to_dict()
+    except Exception:
+        # Keep parser resilient and continue processing all files.
+        return None
+
+
+_EMAIL_SUFFIXES = (".txt", ".html")
+
+
+def _iter_email_files(base: Path):
+    # One traversal for both suffixes instead of a separate rglob per suffix.
+    for dirpath, _dirnames, filenames in os.walk(base):
+        for name in filenames:
+            if name.endswith(_EMAIL_SUFFIXES):
+                yield Path(dirpath, name)
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def parse_folder(folder: str | Path, translate: bool = True) -> list[dict]:
     base = Path(folder)
     if not base.exists() or not base.is_dir():
         raise NotADirectoryError(str(base))
 
-    files = sorted(
-        [*base.rglob("*.txt"), *base.rglob("*.html")],
-        key=lambda p: p.name.lower(),
-    )
+    files = sorted(_iter_email_files(base), key=lambda p: p.name.lower())
+    # Dispatch the largest files first so one big email does not run alone at
+    # the tail of the pool; results are still emitted in name order.
+    order = sorted(range(len(files)), key=lambda i: _file_size(files[i]), reverse=True)
 
     parsed: list[dict] = []
-    for file_path in files:
-        try:
-            job = parse_email(file_path)
-            payload = job.to_dict()
-            parsed.append(payload)
-            print(f"{payload.get('company') or 'Unknown'} | {payload.get('role') or 'Unknown'} | {payload.get('stage')}")
-        except Exception:
-            # Keep parser resilient and continue processing all files.
-            continue
+    results: list[dict | None] = [None] * len(files)
+    done = [False] * len(files)
+    next_index = 0
+    # parse_email is a pure per-file function, so files are spread across
+    # worker processes.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        payloads = executor.map(partial(_parse_one, translate=translate), [files[i] for i in order], chunksize=16)
+        for index, payload in zip(order, payloads):
+            results[index] = payload
+            done[index] = True
+            while next_index < len(files) and done[next_index]:
+                payload = results[next_index]
+                results[next_index] = None
+                next_index += 1
+                if payload is None:
+                    continue
+                parsed.append(payload)
+                sys.stdout.write(
+                    f"{payload.get('company') or 'Unknown'} | {payload.get('role') or 'Unknown'} | {payload.get('stage')}\n"
+                )
 
     output_path = base / "parsed_jobs.json"
-    output_path.write_text(json.dumps(parsed, ensure_ascii=False, indent=2), encoding="utf-8")
+    if orjson is not None:
+        # orjson encodes straight to UTF-8 bytes in C.
+        output_path.write_bytes(orjson.dumps(parsed, option=orjson.OPT_INDENT_2))
+    else:
+        # Stream through a large buffer instead of building the whole document
+        # as one str and then again as encoded bytes.
+        with output_path.open("w", encoding="utf-8", buffering=1024 * 1024) as fh:
+            json.dump(parsed, fh, ensure_ascii=False, indent=2)
     return parsed
 
 
 def _build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Parse job-related emails into structured JSON.")
     parser.add_argument("folder", help="Folder containing .txt/.html email files")
+    parser.add_argument(
+        "--no-translate",
+        action="store_true",
+        help="Skip Russian translation (description_ru repeats description_en).",
+    )
     return parser
 
 
 def main() -> None:
     args = _build_arg_parser().parse_args()
-    parse_folder(args.folder)
+    parse_folder(args.folder, translate=not args.no_translate)
 
 
 if __name__ == "__main__":
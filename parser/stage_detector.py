@@ -1,36 +1,47 @@
 from __future__ import annotations
 
+# Checked in priority order; the first type with any marker present wins.
+_EMAIL_TYPE_MARKERS = (
+    (
+        "applied",
+        (
+            "your application was sent",
+            "application submitted",
+        ),
+    ),
+    (
+        "auto_reply",
+        (
+            "we received your application",
+            "thank you for applying",
+        ),
+    ),
+    (
+        "interview",
+        (
+            "interview",
+            "schedule a call",
+            "invite you to",
+        ),
+    ),
+    (
+        "reject",
+        (
+            "we regret",
+            "not moving forward",
+            "unfortunately",
+        ),
+    ),
+)
 
-def detect_email_type(text: str) -> str:
-    lowered = (text or "").lower()
 
-    applied_markers = [
-        "your application was sent",
-        "application submitted",
-    ]
-    auto_reply_markers = [
-        "we received your application",
-        "thank you for applying",
-    ]
-    interview_markers = [
-        "interview",
-        "schedule a call",
-        "invite you to",
-    ]
-    reject_markers = [
-        "we regret",
-        "not moving forward",
-        "unfortunately",
-    ]
+def detect_email_type(text: str, lowered: str | None = None) -> str:
+    if lowered is None:
+        lowered = (text or "").lower()
 
-    if any(marker in lowered for marker in applied_markers):
-        return "applied"
-    if any(marker in lowered for marker in auto_reply_markers):
-        return "auto_reply"
-    if any(marker in lowered for marker in interview_markers):
-        return "interview"
-    if any(marker in lowered for marker in reject_markers):
-        return "reject"
+    for email_type, markers in _EMAIL_TYPE_MARKERS:
+        if any(marker in lowered for marker in markers):
+            return email_type
     return "unknown"
 
 
@@ -1,21 +1,30 @@
 from __future__ import annotations
 
+import hashlib
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import List
 import warnings
 
 warnings.filterwarnings("ignore", message=".*NotOpenSSLWarning.*")
 warnings.filterwarnings("ignore", module=r"urllib3.*")
 
-try:
-    from urllib3.exceptions import NotOpenSSLWarning
-
-    warnings.filterwarnings("ignore", category=NotOpenSSLWarning)
-except Exception:
-    pass
+GOOGLE_TRANSLATE_URL = "https://translate.googleapis.com/translate_a/single"
+MAX_PARALLEL_CHUNKS = 8
 
-import requests
+# Shared keep-alive session so chunks and emails reuse TCP/TLS connections.
+# Created on the first cache miss: requests/urllib3 are costly to import and
+# runs served from the cache (or with translation off) never need them.
+_session = None
+_session_lock = threading.Lock()
 
-GOOGLE_TRANSLATE_URL = "https://translate.googleapis.com/translate_a/single"
+_cache_path = Path("~/.cache/linkinjob/xl8.sqlite").expanduser()
+_cache_conn: sqlite3.Connection | None = None
+_cache_pid: int | None = None
+_cache_lock = threading.Lock()
 
 
 def _chunk_text(text: str, max_chars: int = 4000) -> List[str]:
@@ -35,7 +44,83 @@ def _chunk_text(text: str, max_chars: int = 4000) -> List[str]:
     return [chunk for chunk in chunks if chunk]
 
 
+def _get_session():
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            try:
+                from urllib3.exceptions import NotOpenSSLWarning
+
+                warnings.filterwarnings("ignore", category=NotOpenSSLWarning)
+            except Exception:
+                pass
+
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+            _session = session
+    return _session
+
+
+def _cache_connection() -> sqlite3.Connection | None:
+    """Return this process's translation cache connection, or None if unavailable."""
+    global _cache_conn, _cache_pid
+
+    # Connections must not cross fork() into parse_folder worker processes.
+    if _cache_conn is not None and _cache_pid == os.getpid():
+        return _cache_conn
+    try:
+        _cache_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(_cache_path), isolation_level=None, check_same_thread=False, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS xl8 (k TEXT PRIMARY KEY, v TEXT)")
+    except Exception:
+        return None
+    _cache_conn = conn
+    _cache_pid = os.getpid()
+    return conn
+
+
+def _cache_get(key: str) -> str | None:
+    with _cache_lock:
+        conn = _cache_connection()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute("SELECT v FROM xl8 WHERE k = ?", (key,)).fetchone()
+        except Exception:
+            return None
+    return row[0] if row else None
+
+
+def _cache_put(key: str, value: str) -> None:
+    with _cache_lock:
+        conn = _cache_connection()
+        if conn is None:
+            return
+        try:
+            conn.execute("INSERT OR IGNORE INTO xl8 (k, v) VALUES (?, ?)", (key, value))
+        except Exception:
+            pass
+
+
 def _translate_chunk(chunk: str, timeout: int = 20) -> str:
+    key = hashlib.sha1(chunk.encode("utf-8")).hexdigest()
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    translated = _fetch_translation(chunk, timeout=timeout)
+    # Untranslated fallbacks are not cached so a later run can retry them.
+    if translated != chunk:
+        _cache_put(key, translated)
+    return translated
+
+
+def _fetch_translation(chunk: str, timeout: int = 20) -> str:
     params = {
         "client": "gtx",
         "sl": "auto",
@@ -43,7 +128,7 @@ def _translate_chunk(chunk: str, timeout: int = 20) -> str:
         "dt": "t",
         "q": chunk,
     }
-    response = requests.get(GOOGLE_TRANSLATE_URL, params=params, timeout=timeout)
+    response = _get_session().get(GOOGLE_TRANSLATE_URL, params=params, timeout=timeout)
     response.raise_for_status()
 
     payload = response.json()
@@ -72,7 +157,11 @@ def translate_to_ru(text: str | None) -> str | None:
 
     try:
         chunks = _chunk_text(clean, max_chars=4000)
-        translated = [_translate_chunk(chunk) for chunk in chunks]
+        if len(chunks) == 1:
+            translated = [_translate_chunk(chunks[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_CHUNKS, len(chunks))) as executor:
+                translated = list(executor.map(_translate_chunk, chunks))
         return "\n".join(part for part in translated if part).strip() or clean
     except Exception:
         return clean
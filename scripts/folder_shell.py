@@ -5,18 +5,29 @@ from __future__ import annotations
 
 import argparse
 import os
-import tkinter as tk
-from tkinter import filedialog, ttk
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import tkinter as tk
+    from tkinter import filedialog, ttk
 
 DUMMY_NODE = "__dummy__"
 
 
-class FolderShell(tk.Tk):
+def _import_tk() -> None:
+    # Tk is imported on first window creation so `--help` stays fast.
+    global tk, filedialog, ttk
+    import tkinter as tk
+    from tkinter import filedialog, ttk
+
+
+class FolderShell:
     def __init__(self, root_path: str, show_files: bool) -> None:
-        super().__init__()
-        self.title("Folder Shell")
-        self.geometry("1000x650")
-        self.minsize(720, 480)
+        _import_tk()
+        self.window = tk.Tk()
+        self.window.title("Folder Shell")
+        self.window.geometry("1000x650")
+        self.window.minsize(720, 480)
 
         self.root_path = os.path.abspath(root_path)
         self.show_files_var = tk.BooleanVar(value=show_files)
@@ -26,7 +37,7 @@ class FolderShell(tk.Tk):
         self._load_root()
 
     def _build_ui(self) -> None:
-        top = ttk.Frame(self, padding=10)
+        top = ttk.Frame(self.window, padding=10)
         top.pack(fill="x")
 
         ttk.Label(top, text="Root:").pack(side="left")
@@ -45,7 +56,7 @@ class FolderShell(tk.Tk):
             command=self._reload,
         ).pack(side="left", padx=(14, 0))
 
-        main = ttk.Frame(self, padding=(10, 0, 10, 10))
+        main = ttk.Frame(self.window, padding=(10, 0, 10, 10))
         main.pack(fill="both", expand=True)
 
         self.tree = ttk.Treeview(main, columns=("type", "path"), show="tree headings")
@@ -71,14 +82,17 @@ class FolderShell(tk.Tk):
         self.tree.bind("<<TreeviewSelect>>", self._on_select)
 
         self.status_var = tk.StringVar(value="Ready")
-        status = ttk.Label(self, textvariable=self.status_var, anchor="w", padding=10)
+        status = ttk.Label(self.window, textvariable=self.status_var, anchor="w", padding=10)
         status.pack(fill="x")
 
+    def mainloop(self) -> None:
+        self.window.mainloop()
+
     def _set_status(self, text: str) -> None:
         self.status_var.set(text)
 
     def _browse_root(self) -> None:
-        selected = filedialog.askdirectory(initialdir=self.root_path)
+        selected = filedialog.askdirectory(parent=self.window, initialdir=self.root_path)
         if not selected:
             return
         self.path_var.set(selected)
@@ -164,11 +178,13 @@ class FolderShell(tk.Tk):
             self.tree.insert(parent_node, "end", text="<not found>", values=("error", parent_path))
             return
 
-        entries.sort(key=lambda e: (not e.is_dir(follow_symlinks=False), e.name.lower()))
+        # is_dir() is evaluated once per entry and reused for sorting and insertion.
+        keyed = [(not entry.is_dir(follow_symlinks=False), entry.name.lower(), entry) for entry in entries]
+        keyed.sort(key=lambda item: (item[0], item[1]))
 
-        for entry in entries:
+        for is_file, _name_lower, entry in keyed:
             full_path = entry.path
-            if entry.is_dir(follow_symlinks=False):
+            if not is_file:
                 node = self.tree.insert(
                     parent_node,
                     "end",
@@ -6,20 +6,136 @@ from __future__ import annotations
 import argparse
 import os
 import sqlite3
+from contextlib import contextmanager
+from functools import partial
+from itertools import chain, islice
 from pathlib import Path
+from typing import Callable, Iterator, NamedTuple
+
+_NODE_COLUMNS = "id, source_id, parent_id, name, name_lower, full_path, node_type, size_bytes, modified_at"
+_NODE_PLACEHOLDERS = "(?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_INSERT_NODE_SQL = f"INSERT INTO nodes({_NODE_COLUMNS}) VALUES {_NODE_PLACEHOLDERS}"
+# Full batches go through one multi-row INSERT (9 x 500 = 4500 bound
+# variables, well under SQLite's limit); the remainder uses _INSERT_NODE_SQL.
+_INSERT_ROWS_PER_STATEMENT = 500
+_INSERT_NODES_SQL = f"INSERT INTO nodes({_NODE_COLUMNS}) VALUES " + ", ".join(
+    [_NODE_PLACEHOLDERS] * _INSERT_ROWS_PER_STATEMENT
+)
+
+# nodes.node_type is stored as an integer; directories sort before files.
+NODE_DIR = 0
+NODE_FILE = 1
+
+# Secondary indexes on nodes. idx_nodes_children matches get_children's
+# ORDER BY, so listings are read in index order without a sort; source_id
+# lookups use the UNIQUE(source_id, full_path) index.
+_NODE_INDEXES = {
+    "idx_nodes_children": "CREATE INDEX IF NOT EXISTS idx_nodes_children ON nodes(parent_id, node_type, name_lower)",
+    "idx_nodes_root": "CREATE INDEX IF NOT EXISTS idx_nodes_root ON nodes(source_id) WHERE parent_id IS NULL",
+}
+
+
+class Node(NamedTuple):
+    id: int
+    parent_id: int | None
+    name: str
+    full_path: str
+    node_type: int
+
+    @property
+    def is_dir(self) -> bool:
+        return self.node_type == NODE_DIR
+
+
+class SubtreeNode(NamedTuple):
+    id: int
+    name: str
+    node_type: int
+    level: int
+
+    @property
+    def is_dir(self) -> bool:
+        return self.node_type == NODE_DIR
+
+
+_DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_CLOEXEC", 0)
+
+
+def _scan_dir(
+    directory: str, include_files: bool
+) -> tuple[float, list[tuple[bool, str, str, os.stat_result | None]]] | None:
+    """Return the directory's mtime and ``(is_file, lowered name, name, lstat)``
+    per entry, or None if it cannot be read.
+
+    The directory is opened once and listed through that descriptor, and its
+    own mtime comes from fstat on it. Only files are stat'ed (relative to the
+    descriptor, so the kernel does not re-resolve each full path): a
+    subdirectory's mtime is read when it is scanned in turn, and files are
+    skipped entirely when they are not stored. is_dir() is evaluated once.
+    """
+    try:
+        dir_fd = os.open(directory, _DIR_OPEN_FLAGS)
+    except (PermissionError, FileNotFoundError):
+        return None
+    result: list[tuple[bool, str, str, os.stat_result | None]] = []
+    try:
+        mtime = os.fstat(dir_fd).st_mtime
+        with os.scandir(dir_fd) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    result.append((False, entry.name.lower(), entry.name, None))
+                elif include_files:
+                    try:
+                        stat = entry.stat(follow_symlinks=False)
+                    except (PermissionError, FileNotFoundError):
+                        continue
+                    result.append((True, entry.name.lower(), entry.name, stat))
+    except (PermissionError, FileNotFoundError):
+        return None
+    finally:
+        os.close(dir_fd)
+    return mtime, result
 
 
 class HierarchyDB:
+    # Source root paths must already be absolute: FolderShellSQLProgram
+    # normalizes them once where they enter the program.
     def __init__(self, db_path: str) -> None:
         self.db_path = os.path.abspath(db_path)
         parent_dir = os.path.dirname(self.db_path)
         if parent_dir:
             os.makedirs(parent_dir, exist_ok=True)
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.execute("PRAGMA foreign_keys = ON")
+        # Autocommit mode: sync_source manages its own explicit transaction.
+        # A roomy statement cache keeps every query string prepared once.
+        self.conn = sqlite3.connect(self.db_path, isolation_level=None, cached_statements=256)
+        self._configure_pragmas()
         self._init_schema()
+        # Browsing queries use their own read-only connection, so under WAL
+        # they never queue behind a sync holding the write lock.
+        self.read_conn = sqlite3.connect(
+            f"{Path(self.db_path).as_uri()}?mode=ro",
+            uri=True,
+            isolation_level=None,
+            cached_statements=256,
+        )
+        self.read_conn.execute("PRAGMA query_only = ON")
+        self.read_conn.execute("PRAGMA busy_timeout = 5000")
+        self.read_conn.execute("PRAGMA mmap_size = 268435456")
+
+    def _configure_pragmas(self) -> None:
+        # WAL + NORMAL sync avoids an fsync per statement during sync_source
+        # and lets readers proceed while a sync is writing.
+        if self.db_path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute("PRAGMA busy_timeout = 5000")
+        self.conn.execute("PRAGMA cache_size = -20000")
+        self.conn.execute("PRAGMA temp_store = MEMORY")
+        self.conn.execute("PRAGMA mmap_size = 268435456")
+        self.conn.execute("PRAGMA foreign_keys = ON")
 
     def _init_schema(self) -> None:
+        self._drop_legacy_nodes()
         self.conn.executescript(
             """
             CREATE TABLE IF NOT EXISTS sources (
@@ -34,8 +150,12 @@ class HierarchyDB:
                 source_id INTEGER NOT NULL,
                 parent_id INTEGER,
                 name TEXT NOT NULL,
+                -- Sort key, lowered in Python at insert time (full Unicode
+                -- folding, same order as the walk and folder_shell.py).
+                -- COLLATE NOCASE on name would only fold ASCII letters.
+                name_lower TEXT NOT NULL,
                 full_path TEXT NOT NULL,
-                node_type TEXT NOT NULL CHECK(node_type IN ('dir', 'file')),
+                node_type INTEGER NOT NULL CHECK(node_type IN (0, 1)),
                 size_bytes INTEGER,
                 modified_at REAL,
                 FOREIGN KEY(source_id) REFERENCES sources(id) ON DELETE CASCADE,
@@ -43,103 +163,196 @@ class HierarchyDB:
                 UNIQUE(source_id, full_path)
             );
 
-            CREATE INDEX IF NOT EXISTS idx_nodes_source_parent
-                ON nodes(source_id, parent_id, node_type, name);
+            DROP INDEX IF EXISTS idx_nodes_source_parent;
             """
         )
+        self._create_node_indexes(self.conn.cursor())
         self.conn.commit()
 
+    def _create_node_indexes(self, cur: sqlite3.Cursor) -> None:
+        for sql in _NODE_INDEXES.values():
+            cur.execute(sql)
+
+    def _drop_node_indexes(self, cur: sqlite3.Cursor) -> None:
+        for name in _NODE_INDEXES:
+            cur.execute(f"DROP INDEX IF EXISTS {name}")
+
+    def _drop_legacy_nodes(self) -> None:
+        # Older databases stored node_type as 'dir'/'file' text and had no
+        # name_lower column. Nodes are a snapshot of the file system, so the
+        # table is simply rebuilt by the next sync instead of being migrated.
+        columns = {str(row[1]): str(row[2]).upper() for row in self.conn.execute("PRAGMA table_info(nodes)")}
+        if columns and (columns.get("node_type") == "TEXT" or "name_lower" not in columns):
+            self.conn.execute("DROP TABLE nodes")
+
     def close(self) -> None:
+        self.read_conn.close()
         self.conn.close()
 
-    def upsert_source(self, root_path: str) -> int:
-        root_path = os.path.abspath(root_path)
+    @contextmanager
+    def _write_transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Run the block in one BEGIN IMMEDIATE transaction on the writer.
+
+        Taking the write lock up front avoids SQLITE_BUSY from upgrading a
+        deferred read transaction; nested uses join the outer transaction.
+        """
         cur = self.conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO sources(root_path, updated_at)
-            VALUES (?, CURRENT_TIMESTAMP)
-            ON CONFLICT(root_path)
-            DO UPDATE SET updated_at = CURRENT_TIMESTAMP
-            """,
-            (root_path,),
-        )
-        self.conn.commit()
+        if self.conn.in_transaction:
+            yield cur
+            return
+        cur.execute("BEGIN IMMEDIATE")
+        try:
+            yield cur
+        except BaseException:
+            cur.execute("ROLLBACK")
+            raise
+        cur.execute("COMMIT")
 
-        cur.execute("SELECT id FROM sources WHERE root_path = ?", (root_path,))
-        row = cur.fetchone()
+    def upsert_source(self, root_path: str) -> int:
+        with self._write_transaction() as cur:
+            cur.execute(
+                """
+                INSERT INTO sources(root_path, updated_at)
+                VALUES (?, CURRENT_TIMESTAMP)
+                ON CONFLICT(root_path)
+                DO UPDATE SET updated_at = CURRENT_TIMESTAMP
+                """,
+                (root_path,),
+            )
+            cur.execute("SELECT id FROM sources WHERE root_path = ?", (root_path,))
+            row = cur.fetchone()
         if row is None:
             raise RuntimeError("Failed to create source in database")
         return int(row[0])
 
     def clear_source_nodes(self, source_id: int) -> None:
-        self.conn.execute("DELETE FROM nodes WHERE source_id = ?", (source_id,))
-        self.conn.commit()
+        with self._write_transaction() as cur:
+            other = cur.execute(
+                """
+                SELECT EXISTS(SELECT 1 FROM nodes WHERE source_id < ?)
+                    OR EXISTS(SELECT 1 FROM nodes WHERE source_id > ?)
+                """,
+                (source_id, source_id),
+            ).fetchone()[0]
+            if other:
+                cur.execute("DELETE FROM nodes WHERE source_id = ?", (source_id,))
+            else:
+                # Sole source: an unqualified DELETE lets SQLite truncate the table
+                # (when foreign keys are off) instead of deleting row by row.
+                cur.execute("DELETE FROM nodes")
 
     def sync_source(self, root_path: str, include_files: bool = True) -> tuple[int, int]:
-        root_path = os.path.abspath(root_path)
         if not os.path.isdir(root_path):
             raise NotADirectoryError(root_path)
 
-        source_id = self.upsert_source(root_path)
-        self.clear_source_nodes(source_id)
-
-        dir_count = 0
-        file_count = 0
         cur = self.conn.cursor()
-
-        def insert_node(
-            parent_id: int | None,
-            name: str,
-            full_path: str,
-            node_type: str,
-            size_bytes: int | None,
-            modified_at: float | None,
-        ) -> int:
-            cur.execute(
-                """
-                INSERT INTO nodes(source_id, parent_id, name, full_path, node_type, size_bytes, modified_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (source_id, parent_id, name, full_path, node_type, size_bytes, modified_at),
-            )
-            return int(cur.lastrowid)
-
+        # The sync deletes and rebuilds the source's whole subtree itself, so
+        # the per-row cascade checks are redundant; with them off, clearing a
+        # sole source truncates the table. foreign_keys cannot change inside
+        # a transaction, so the pragmas wrap it.
+        secure_delete = cur.execute("PRAGMA secure_delete").fetchone()[0]
+        cur.execute("PRAGMA foreign_keys = OFF")
+        cur.execute("PRAGMA secure_delete = OFF")
+        try:
+            # One write transaction for the upsert, the delete and every
+            # insert: a single fsync at COMMIT. Indexes are dropped first and
+            # rebuilt once at the end rather than updated row by row.
+            with self._write_transaction() as cur:
+                source_id = self.upsert_source(root_path)
+                self._drop_node_indexes(cur)
+                self.clear_source_nodes(source_id)
+                counts = self._insert_tree(cur, source_id, root_path, include_files)
+                self._create_node_indexes(cur)
+        finally:
+            cur.execute(f"PRAGMA secure_delete = {int(secure_delete)}")
+            cur.execute("PRAGMA foreign_keys = ON")
+        return counts
+
+    def _insert_tree(
+        self,
+        cur: sqlite3.Cursor,
+        source_id: int,
+        root_path: str,
+        include_files: bool,
+    ) -> tuple[int, int]:
+        counts = [0, 0]
+        # Ids are assigned by the walk rather than read back through
+        # lastrowid, so rows can be streamed into multi-row INSERTs; only one
+        # batch is held in memory regardless of the tree size.
+        cur.execute("SELECT COALESCE(MAX(id), 0) FROM nodes")
+        rows = self._iter_tree_rows(int(cur.fetchone()[0]) + 1, source_id, root_path, include_files, counts)
+        while True:
+            batch = list(islice(rows, _INSERT_ROWS_PER_STATEMENT))
+            if len(batch) < _INSERT_ROWS_PER_STATEMENT:
+                if batch:
+                    cur.executemany(_INSERT_NODE_SQL, batch)
+                break
+            cur.execute(_INSERT_NODES_SQL, list(chain.from_iterable(batch)))
+        return counts[0], counts[1]
+
+    @staticmethod
+    def _iter_tree_rows(
+        next_id: int,
+        source_id: int,
+        root_path: str,
+        include_files: bool,
+        counts: list[int],
+    ) -> Iterator[tuple]:
+        """Yield node rows for the tree under ``root_path``; ``counts`` tallies [dirs, files].
+
+        A directory's row is yielded when the directory itself is scanned, so
+        its mtime can come from the open descriptor; that is always after its
+        parent's row and before its children's rows.
+        """
         root_name = os.path.basename(root_path) or root_path
-        root_stat = os.stat(root_path)
-        root_id = insert_node(None, root_name, root_path, "dir", None, root_stat.st_mtime)
-        dir_count += 1
-
-        def walk(parent_node_id: int, directory: str) -> None:
-            nonlocal dir_count, file_count
-            try:
-                entries = list(os.scandir(directory))
-            except (PermissionError, FileNotFoundError):
-                return
-
-            entries.sort(key=lambda e: (not e.is_dir(follow_symlinks=False), e.name.lower()))
-            for entry in entries:
-                full_path = entry.path
+        # Explicit stack instead of recursion: no frame per directory and no
+        # recursion limit on deep trees. Subdirectories are pushed in reverse
+        # so they are still visited in sorted order.
+        stack = [(next_id, None, root_name, root_name.lower(), root_path)]
+        next_id += 1
+        while stack:
+            node_id, parent_id, dir_name, dir_name_lower, directory = stack.pop()
+            scanned = _scan_dir(directory, include_files)
+            if scanned is None:
                 try:
-                    stat = entry.stat(follow_symlinks=False)
-                except (PermissionError, FileNotFoundError):
-                    continue
-
-                if entry.is_dir(follow_symlinks=False):
-                    child_id = insert_node(parent_node_id, entry.name, full_path, "dir", None, stat.st_mtime)
-                    dir_count += 1
-                    walk(child_id, full_path)
-                elif include_files:
-                    insert_node(parent_node_id, entry.name, full_path, "file", stat.st_size, stat.st_mtime)
-                    file_count += 1
-
-        walk(root_id, root_path)
-        self.conn.commit()
-        return dir_count, file_count
+                    dir_mtime = os.stat(directory).st_mtime
+                except OSError:
+                    dir_mtime = None
+            else:
+                dir_mtime = scanned[0]
+            yield (node_id, source_id, parent_id, dir_name, dir_name_lower, directory, NODE_DIR, None, dir_mtime)
+            counts[0] += 1
+            if scanned is None:
+                continue
 
-    def get_root_node(self, root_path: str) -> dict | None:
-        root_path = os.path.abspath(root_path)
-        cur = self.conn.cursor()
+            entries = scanned[1]
+            entries.sort(key=lambda item: (item[0], item[1]))
+            prefix = directory if directory.endswith(os.sep) else directory + os.sep
+            subdirs: list[tuple] = []
+            for is_file, name_lower, name, stat in entries:
+                full_path = prefix + name
+                if not is_file:
+                    subdirs.append((next_id, node_id, name, name_lower, full_path))
+                else:
+                    yield (
+                        next_id,
+                        source_id,
+                        node_id,
+                        name,
+                        name_lower,
+                        full_path,
+                        NODE_FILE,
+                        stat.st_size,
+                        stat.st_mtime,
+                    )
+                    counts[1] += 1
+                next_id += 1
+            stack.extend(reversed(subdirs))
+
+    # Rows map straight onto Node/SubtreeNode tuples; the SQLite column types
+    # already match the fields, so no per-row dict or conversions are built.
+    def get_root_node(self, root_path: str) -> Node | None:
+        cur = self.read_conn.cursor()
         cur.execute(
             """
             SELECT n.id, n.parent_id, n.name, n.full_path, n.node_type
@@ -151,18 +364,10 @@ class HierarchyDB:
             (root_path,),
         )
         row = cur.fetchone()
-        if row is None:
-            return None
-        return {
-            "id": int(row[0]),
-            "parent_id": None,
-            "name": str(row[2]),
-            "full_path": str(row[3]),
-            "node_type": str(row[4]),
-        }
+        return Node._make(row) if row is not None else None
 
-    def get_node(self, node_id: int) -> dict | None:
-        cur = self.conn.cursor()
+    def get_node(self, node_id: int) -> Node | None:
+        cur = self.read_conn.cursor()
         cur.execute(
             """
             SELECT id, parent_id, name, full_path, node_type
@@ -173,25 +378,17 @@ class HierarchyDB:
             (node_id,),
         )
         row = cur.fetchone()
-        if row is None:
-            return None
-        return {
-            "id": int(row[0]),
-            "parent_id": int(row[1]) if row[1] is not None else None,
-            "name": str(row[2]),
-            "full_path": str(row[3]),
-            "node_type": str(row[4]),
-        }
+        return Node._make(row) if row is not None else None
 
-    def get_children(self, parent_id: int, show_files: bool) -> list[dict]:
-        cur = self.conn.cursor()
+    def get_children(self, parent_id: int, show_files: bool) -> list[Node]:
+        cur = self.read_conn.cursor()
         if show_files:
             cur.execute(
                 """
                 SELECT id, parent_id, name, full_path, node_type
                 FROM nodes
                 WHERE parent_id = ?
-                ORDER BY CASE node_type WHEN 'dir' THEN 0 ELSE 1 END, lower(name)
+                ORDER BY node_type, name_lower
                 """,
                 (parent_id,),
             )
@@ -200,23 +397,43 @@ class HierarchyDB:
                 """
                 SELECT id, parent_id, name, full_path, node_type
                 FROM nodes
-                WHERE parent_id = ? AND node_type = 'dir'
-                ORDER BY lower(name)
+                WHERE parent_id = ? AND node_type = ?
+                ORDER BY name_lower
                 """,
-                (parent_id,),
+                (parent_id, NODE_DIR),
+            )
+
+        return list(map(Node._make, cur.fetchall()))
+
+    def iter_subtree(self, node_id: int, depth: int, show_files: bool) -> Iterator[SubtreeNode]:
+        """Iterate over a node and its descendants down to ``depth`` levels, depth-first.
+
+        Siblings come in get_children order. Ordering the CTE queue by level
+        DESC makes SQLite expand the most recently reached node first, so the
+        whole subtree is produced by one statement in print order.
+        """
+        cur = self.read_conn.cursor()
+        cur.execute(
+            """
+            WITH RECURSIVE sub(id, name, node_type, name_lower, level) AS (
+                SELECT id, name, node_type, name_lower, 0
+                FROM nodes
+                WHERE id = ?
+                UNION ALL
+                SELECT n.id, n.name, n.node_type, n.name_lower, sub.level + 1
+                FROM sub
+                JOIN nodes n ON n.parent_id = sub.id
+                WHERE sub.level < ? AND sub.node_type = ? AND (? OR n.node_type = ?)
+                ORDER BY 5 DESC, 3, 4
             )
+            SELECT id, name, node_type, level FROM sub
+            """,
+            (node_id, depth, NODE_DIR, bool(show_files), NODE_DIR),
+        )
+        return map(SubtreeNode._make, cur)
 
-        rows = cur.fetchall()
-        return [
-            {
-                "id": int(r[0]),
-                "parent_id": int(r[1]) if r[1] is not None else None,
-                "name": str(r[2]),
-                "full_path": str(r[3]),
-                "node_type": str(r[4]),
-            }
-            for r in rows
-        ]
+
+_QUIT_COMMANDS = frozenset({"q", "quit", "exit"})
 
 
 class FolderShellSQLProgram:
@@ -224,7 +441,22 @@ class FolderShellSQLProgram:
         self.db = HierarchyDB(db_path)
         self.source_path = os.path.abspath(source_path)
         self.show_files = show_files
-        self.current_node: dict | None = None
+        self.current_node: Node | None = None
+        # Exact commands are looked up directly; prefixed ones are tried in
+        # order only when that lookup misses.
+        self._commands: dict[str, Callable[[], None]] = {
+            "help": self.print_help,
+            "pwd": self._cmd_pwd,
+            "root": self._cmd_root,
+            "..": self._cmd_parent,
+            "sync": self.sync,
+            "files on": partial(self._cmd_files, True),
+            "files off": partial(self._cmd_files, False),
+        }
+        self._prefix_commands: tuple[tuple[str, Callable[[str], None]], ...] = (
+            ("source ", self._cmd_source),
+            ("tree", self._cmd_tree),
+        )
 
     def sync(self) -> None:
         dir_count, file_count = self.db.sync_source(self.source_path, include_files=True)
@@ -265,33 +497,24 @@ class FolderShellSQLProgram:
         print("  help       show this help")
         print("  q          quit")
 
-    def list_current(self) -> list[dict]:
+    def list_current(self) -> list[Node]:
         if self.current_node is None:
             return []
-        children = self.db.get_children(self.current_node["id"], self.show_files)
-        print(f"\nCurrent: {self.current_node['full_path']}")
+        children = self.db.get_children(self.current_node.id, self.show_files)
+        print(f"\nCurrent: {self.current_node.full_path}")
         if not children:
             print("  (empty)")
             return children
 
         for idx, child in enumerate(children, start=1):
-            icon = "[D]" if child["node_type"] == "dir" else "[F]"
-            print(f"  {idx:>2}. {icon} {child['name']}")
+            icon = "[D]" if child.is_dir else "[F]"
+            print(f"  {idx:>2}. {icon} {child.name}")
         return children
 
     def print_tree(self, node_id: int, depth: int, prefix: str = "") -> None:
-        node = self.db.get_node(node_id)
-        if node is None:
-            return
-
-        icon = "[D]" if node["node_type"] == "dir" else "[F]"
-        print(f"{prefix}{icon} {node['name']}")
-        if depth <= 0 or node["node_type"] != "dir":
-            return
-
-        children = self.db.get_children(node_id, self.show_files)
-        for child in children:
-            self.print_tree(child["id"], depth - 1, prefix + "  ")
+        for node in self.db.iter_subtree(node_id, depth, self.show_files):
+            icon = "[D]" if node.is_dir else "[F]"
+            print(f"{prefix}{'  ' * node.level}{icon} {node.name}")
 
     def run(self) -> None:
         if not os.path.isdir(self.source_path):
@@ -309,72 +532,73 @@ class FolderShellSQLProgram:
             if not raw:
                 continue
 
-            if raw in {"q", "quit", "exit"}:
+            if raw in _QUIT_COMMANDS:
                 break
-            if raw == "help":
-                self.print_help()
-                continue
-            if raw == "pwd":
-                if self.current_node:
-                    print(self.current_node["full_path"])
-                continue
-            if raw == "root":
-                root = self.db.get_root_node(self.source_path)
-                if root:
-                    self.current_node = root
-                continue
-            if raw == "..":
-                if self.current_node and self.current_node["parent_id"] is not None:
-                    parent = self.db.get_node(int(self.current_node["parent_id"]))
-                    if parent:
-                        self.current_node = parent
-                continue
-            if raw == "sync":
-                self.sync()
-                continue
-            if raw == "files on":
-                self.show_files = True
-                continue
-            if raw == "files off":
-                self.show_files = False
-                continue
-            if raw.startswith("source "):
-                new_source = os.path.abspath(raw[7:].strip())
-                if not os.path.isdir(new_source):
-                    print(f"Not a directory: {new_source}")
-                    continue
-                self.source_path = new_source
-                self.sync()
-                continue
-            if raw.startswith("tree"):
-                depth = 3
-                parts = raw.split()
-                if len(parts) > 1:
-                    try:
-                        depth = max(0, int(parts[1]))
-                    except ValueError:
-                        print("Depth must be a number")
-                        continue
-                if self.current_node:
-                    print()
-                    self.print_tree(self.current_node["id"], depth)
-                continue
-            if raw.isdigit():
-                index = int(raw)
-                if index < 1 or index > len(children):
-                    print("Invalid index")
-                    continue
-                selected = children[index - 1]
-                if selected["node_type"] != "dir":
-                    print("Selected item is a file, not a directory")
-                    continue
-                self.current_node = selected
+            handler = self._commands.get(raw)
+            if handler is not None:
+                handler()
                 continue
-
-            print("Unknown command. Type 'help'.")
+            for prefix, prefix_handler in self._prefix_commands:
+                if raw.startswith(prefix):
+                    prefix_handler(raw)
+                    break
+            else:
+                if raw.isdigit():
+                    self._cmd_open(int(raw), children)
+                else:
+                    print("Unknown command. Type 'help'.")
 
         self.db.close()
 
+    def _cmd_pwd(self) -> None:
+        if self.current_node:
+            print(self.current_node.full_path)
+
+    def _cmd_root(self) -> None:
+        root = self.db.get_root_node(self.source_path)
+        if root:
+            self.current_node = root
+
+    def _cmd_parent(self) -> None:
+        if self.current_node and self.current_node.parent_id is not None:
+            parent = self.db.get_node(self.current_node.parent_id)
+            if parent:
+                self.current_node = parent
+
+    def _cmd_files(self, show_files: bool) -> None:
+        self.show_files = show_files
+
+    def _cmd_source(self, raw: str) -> None:
+        new_source = os.path.abspath(raw[7:].strip())
+        if not os.path.isdir(new_source):
+            print(f"Not a directory: {new_source}")
+            return
+        self.source_path = new_source
+        self.sync()
+
+    def _cmd_tree(self, raw: str) -> None:
+        depth = 3
+        parts = raw.split()
+        if len(parts) > 1:
+            try:
+                depth = max(0, int(parts[1]))
+            except ValueError:
+                print("Depth must be a number")
+                return
+        if self.current_node:
+            print()
+            self.print_tree(self.current_node.id, depth)
+
+    def _cmd_open(self, index: int, children: list[Node]) -> None:
+        if index < 1 or index > len(children):
+            print("Invalid index")
+            return
+        selected = children[index - 1]
+        if not selected.is_dir:
+            print("Selected item is a file, not a directory")
+            return
+        self.current_node = selected
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="SQL-backed visual shell for folder hierarchy.")
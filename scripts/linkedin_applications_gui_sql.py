@@ -4,7 +4,12 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import html
+import http.client
+import io
+import itertools
 import json
 import os
 import re
@@ -12,19 +17,22 @@ import shutil
 import sqlite3
 import subprocess
 import sys
+import threading
 import time
 import urllib.parse
-import urllib.request
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from urllib.error import HTTPError
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Collection, Iterable, Iterator, Optional
 
 try:
-    from PySide6.QtCore import Qt
-    from PySide6.QtGui import QAction
+    from PySide6.QtCore import QAbstractItemModel, QModelIndex, QObject, Qt, Signal
+    from PySide6.QtGui import QAction, QCloseEvent
     from PySide6.QtWidgets import (
+        QAbstractItemView,
         QApplication,
         QFormLayout,
         QFrame,
@@ -38,8 +46,7 @@ try:
         QSplitter,
         QTextEdit,
         QToolBar,
-        QTreeWidget,
-        QTreeWidgetItem,
+        QTreeView,
         QVBoxLayout,
         QWidget,
     )
@@ -59,6 +66,9 @@ from update_linkedin_applications import (
 
 
 STATUS_ORDER = ["incoming", "applied", "rejected", "interview", "manual_sort", "archive"]
+# Membership sets; STATUS_ORDER stays a list for the tree's section order.
+_STATUS_SET = frozenset(STATUS_ORDER)
+_PINNABLE_STATUSES = _STATUS_SET - {"incoming"}
 STATUS_TITLE = {
     "incoming": "Входящие",
     "applied": "Applied",
@@ -76,6 +86,375 @@ GOOGLE_TRANSLATE_API_KEY = (
     or os.getenv("GOOGLE_TRANSLATE_API_KEY", "")
 ).strip()
 
+# Hot statements are kept as constants so the connection's statement cache
+# can reuse the prepared form instead of re-parsing per call.
+_TABLE_EXISTS_SQL = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ? LIMIT 1"
+_INDEX_EXISTS_SQL = "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ? LIMIT 1"
+_SELECT_PINS_SQL = "SELECT record_key, pinned_status FROM status_pins"
+_DELETE_PIN_SQL = "DELETE FROM status_pins WHERE record_key = ?"
+_UPSERT_PIN_SQL = """
+    INSERT INTO status_pins(record_key, pinned_status, updated_at)
+    VALUES (?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(record_key) DO UPDATE SET
+        pinned_status = excluded.pinned_status,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+_SELECT_TRANSLATIONS_SQL = "SELECT hash, translated FROM translations WHERE target_lang = 'ru'"
+_INSERT_TRANSLATION_SQL = """
+    INSERT OR REPLACE INTO translations(hash, source_lang, target_lang, translated)
+    VALUES (?, 'auto', 'ru', ?)
+"""
+# Column list for ApplicationsDB._application_row.
+_APPLICATION_ROW_COLUMNS = """
+    id, source_file, file_name, email_date, subject, company, role, link_url,
+    location, auto_status, manual_status, current_status, body,
+    COALESCE(NULLIF(about_job_text_ru, ''), NULLIF(about_job_text, ''), NULLIF(about_job_text_en, '')) AS about_job_text,
+    COALESCE(NULLIF(about_job_text_en, ''), NULLIF(about_job_text, '')) AS about_job_text_en,
+    COALESCE(NULLIF(about_job_text_ru, ''), NULLIF(about_job_text, '')) AS about_job_text_ru
+"""
+# Column list for ApplicationsDB._tree_row.
+_TREE_ROW_COLUMNS = "id, company, role, location, subject, file_name, auto_status, current_status"
+_UPDATE_APPLICATION_SQL = """
+    UPDATE applications
+    SET source_file = ?, file_name = ?, email_date = ?, subject = ?,
+        company = ?, role = ?, location = ?, link_url = ?, about_job_text = ?, about_job_text_en = ?, about_job_text_ru = ?,
+        auto_status = ?, manual_status = ?, current_status = ?, body = ?,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE record_key = ?
+"""
+_INSERT_APPLICATION_SQL = """
+    INSERT INTO applications(
+        record_key, source_file, file_name, email_date, subject, company, role, location, link_url, about_job_text,
+        about_job_text_en, about_job_text_ru,
+        auto_status, manual_status, current_status, body, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(record_key) DO UPDATE SET
+        source_file = excluded.source_file,
+        file_name = excluded.file_name,
+        email_date = excluded.email_date,
+        subject = excluded.subject,
+        company = excluded.company,
+        role = excluded.role,
+        location = excluded.location,
+        link_url = excluded.link_url,
+        about_job_text = excluded.about_job_text,
+        about_job_text_en = excluded.about_job_text_en,
+        about_job_text_ru = excluded.about_job_text_ru,
+        auto_status = excluded.auto_status,
+        current_status = COALESCE(applications.manual_status, excluded.auto_status),
+        body = excluded.body,
+        updated_at = CURRENT_TIMESTAMP
+"""
+# SQLite's default limit on bound parameters is 999 on older builds.
+_EXISTING_LOOKUP_CHUNK = 500
+_POSTING_MAX_AGE_DAYS = 30
+_SELECT_POSTINGS_SQL = f"""
+    SELECT job_id, about FROM job_postings
+    WHERE fetched_at >= datetime('now', '-{_POSTING_MAX_AGE_DAYS} days')
+"""
+_INSERT_POSTING_SQL = "INSERT OR REPLACE INTO job_postings(job_id, about) VALUES (?, ?)"
+# Parsed status and offer records per source email, reused while the file's
+# (mtime_ns, size) is unchanged. Bump the version when the email parsing
+# changes so every file is parsed again.
+_SOURCE_PARSE_VERSION = 1
+_SELECT_SOURCE_FILES_SQL = "SELECT path, mtime_ns, size, parse_version, status, records FROM source_files"
+_UPSERT_SOURCE_FILE_SQL = """
+    INSERT INTO source_files(path, mtime_ns, size, parse_version, status, records) VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(path) DO UPDATE SET
+        mtime_ns = excluded.mtime_ns,
+        size = excluded.size,
+        parse_version = excluded.parse_version,
+        status = excluded.status,
+        records = excluded.records
+"""
+
+_JOB_LINK_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"https?://(?:[a-z]{1,3}\.)?linkedin\.com/jobs/view/\d+[^\s)>\]\"']*",
+        r"https?://(?:[a-z]{1,3}\.)?linkedin\.com/comm/jobs/view/\d+[^\s)>\]\"']*",
+        r"https?://(?:[a-z]{1,3}\.)?linkedin\.com/(?:comm/)?company/[^/\s)>\]\"']+/jobs[^\s)>\]\"']*",
+        r"https?://(?:[a-z]{1,3}\.)?linkedin\.com/(?:comm/)?company/[^/\s)>\]\"']+[^\s)>\]\"']*",
+        r"https?://(?:[a-z]{1,3}\.)?linkedin\.com/jobs/search/[^\s)>\]\"']*",
+        r"https?://(?:[a-z]{1,3}\.)?linkedin\.com/[^\s)>\]\"']*currentJobId=\d+[^\s)>\]\"']*",
+        r"linkedin\.com/(?:comm/)?jobs%2Fview%2F\d+",
+    )
+)
+# One literal scan finds every "linkedin.com/"; the path group names the
+# _JOB_LINK_PATTERNS entries that can match there (or at the scheme before it).
+# Stdlib re stays: the scan is a literal-prefix search already, and re2's
+# case folding and match(pos) semantics differ from re's on this input.
+_RE_JOB_LINK_HOST = re.compile(
+    r"linkedin\.com/(?:(?P<view>jobs/view/)|(?P<comm_view>comm/jobs/view/)|(?P<company>(?:comm/)?company/)"
+    r"|(?P<search>jobs/search/)|(?P<encoded>(?:comm/)?jobs%2Fview%2F))?",
+    re.IGNORECASE,
+)
+_RE_JOB_LINK_SCHEME = re.compile(r"https?://(?:[a-z]{1,3}\.)?", re.IGNORECASE)
+_JOB_LINK_CANDIDATES = {"view": (0,), "comm_view": (1,), "company": (2, 3), "search": (4,)}
+_CURRENT_JOB_ID_PATTERN = 5
+_ENCODED_JOB_VIEW_PATTERN = 6
+_RE_COMPANY_PROFILE_PATH = re.compile(r"^/(comm/)?company/[^/]+/?$")
+_RE_ROLE_OPENINGS_CONTEXT = re.compile(r"view\s+roles|view\s+jobs|ваканси|jobs\s+for\s+your\s+role")
+_RE_CURRENT_JOB_ID = re.compile(r"currentJobId=(\d+)", re.IGNORECASE)
+_RE_ENCODED_JOB_VIEW = re.compile(r"jobs%2[fF]view%2[fF](\d+)", re.IGNORECASE)
+# A company page and its /jobs listing canonicalize to the same URL.
+_RE_COMPANY_PAGE = re.compile(r"^/(comm/)?company/([^/]+)(?:/jobs)?/?$", re.IGNORECASE)
+_RE_COMPANY_JOBS_LINK = re.compile(r"/(?:comm/)?company/([^/]+)/jobs/?(?:$|\?)", re.IGNORECASE)
+_RE_WHITESPACE = re.compile(r"\s+")
+_RE_VIEW_JOB_LINE = re.compile(r"(?i)(?:View job|См\.\s*вакансию)\s*:\s*(https?://\S+)")
+_RE_SLUG_SEPARATORS = re.compile(r"[-_]+")
+_RE_SUBJECT_ROLE = re.compile(r"^\s*([^:]{2,120})\s*:")
+_RE_HIRED_THIS_WEEK = re.compile(r"(?i)\broles?\s+were\s+hired\s+this\s+week\s+in\s+([^\r\n]+)")
+_RE_COMPANY_PAGE_STATS = re.compile(r"\b(new hire|followers|employees)\b")
+_INLINE_OFFER_PATTERNS = (
+    re.compile(r"(?i)^jobs similar to\s+(.+?)\s+at\s+(.+?)\s+https?://"),
+    re.compile(r"(?i)^new jobs similar to\s+(.+?)\s+at\s+(.+?)\s+https?://"),
+    re.compile(r"(?i)^вакансии, похожие на\s+(.+?)\s+в\s+(.+?)\s+https?://"),
+)
+_RE_OFFER_PART_SEPARATOR = re.compile(r"\s[-–—|]\s")
+# Markers that are substrings of another entry are left out: "actively hiring"
+# also covers "this company is actively hiring", and so on.
+_NOISE_MARKERS = (
+    "view job",
+    "ссылка",
+    "см. вакансию",
+    "apply now",
+    "apply with resume",
+    "apply with profile",
+    "linkedin",
+    "jobs similar",
+    "job alert",
+    "оповещени",
+    "unsubscribe",
+    "notifications",
+    "компания активно нанимает",
+    "החברה מגייסת עובדים",
+    "actively hiring",
+)
+_NON_LOCATION_MARKERS = (
+    "engineer",
+    "developer",
+    "administrator",
+    "specialist",
+    "manager",
+    "support",
+    "resume",
+    "profile",
+    "hiring",
+    "нанимает",
+    "вакан",
+    "позици",
+    "должност",
+    "компания",
+    "this company",
+)
+# One alternation scans a line once instead of one substring pass per marker.
+_RE_NOISE_MARKER = re.compile("|".join(map(re.escape, _NOISE_MARKERS)))
+_RE_NON_LOCATION_MARKER = re.compile("|".join(map(re.escape, _NON_LOCATION_MARKERS)))
+# Folds every Latin letter to "a" and every Russian letter to "я", so one
+# translate plus two str.count calls replace a pair of findall scans.
+_LETTER_CLASS_TABLE = str.maketrans(
+    {
+        **dict.fromkeys("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz", "a"),
+        **dict.fromkeys(map(chr, range(ord("А"), ord("я") + 1)), "я"),
+        "Ё": "я",
+        "ё": "я",
+    }
+)
+_RE_HEBREW_OR_ARABIC = re.compile(r"[\u0590-\u05FF\u0600-\u06FF]")
+_RE_LEADING_SPACE = re.compile(r"^\s*")
+_RE_TRAILING_SPACE = re.compile(r"\s*$")
+# Both Google endpoints accept about 5000 characters per text; the former
+# 1100-character chunks remain the fallback when a long chunk is rejected.
+_TRANSLATE_CHUNK_CHARS = 4500
+_TRANSLATE_RETRY_CHUNK_CHARS = 1100
+# Break points for _split_chunks, strongest first.
+_CHUNK_BREAKS = (("\n",), (". ", "! ", "? "), ("; ", ", "), (" ",))
+# Per-request limits for batched translation calls (Cloud Translation caps a
+# request at 128 texts and recommends staying under 5000 characters).
+_TRANSLATE_BATCH_SIZE = 50
+_TRANSLATE_BATCH_CHARS = 5000
+# Translation batches of a single text sent concurrently; kept small to stay
+# under provider rate limits.
+_TRANSLATE_WORKERS = 4
+# Parallel LinkedIn posting downloads during a sync; database writes stay on
+# the calling thread.
+_JOB_FETCH_WORKERS = 8
+_LINE_BREAK_TOKEN = "__LINKINJOB_LB_9F4C__"
+_RE_LINE_BREAK_TOKEN = re.compile(rf"\s*{re.escape(_LINE_BREAK_TOKEN)}\s*", re.IGNORECASE)
+_RE_DEFORMED_LINE_BREAK_TOKEN = re.compile(
+    r"\s*[_\-–—•·]*\s*LINKINJOB[\s_\-]+LB[\s_\-]+9F4C\s*[_\-–—•·]*\s*",
+    re.IGNORECASE,
+)
+_CHUNK_BREAK_TOKEN = "__LINKINJOB_CB_7A1E__"
+_RE_CHUNK_BREAK_TOKEN = re.compile(r"\s*[_\-–—•·]*\s*LINKINJOB[\s_\-]+CB[\s_\-]+7A1E\s*[_\-–—•·]*\s*", re.IGNORECASE)
+_RE_PARAGRAPH_BREAK = re.compile(r"(\n\s*\n+)")
+_RE_PARAGRAPH_BREAK_ONLY = re.compile(r"\n\s*\n+")
+# The body is "anything up to the first </div>", written as runs of non-'<'
+# text so the scan does not test for the closing tag at every character.
+_RE_ABOUT_JOB_MARKUP = re.compile(
+    r'(?is)<div class="show-more-less-html__markup[^>]*>([^<]*(?:<(?!/div>)[^<]*)*)</div>'
+)
+# Byte form of the same block; once it matches, the rest of the posting cannot
+# change what _RE_ABOUT_JOB_MARKUP finds, so the download can stop there.
+_RE_ABOUT_JOB_MARKUP_END = re.compile(
+    rb'(?is)<div class="show-more-less-html__markup[^>]*>[^<]*(?:<(?!/div>)[^<]*)*</div>'
+)
+
+
+class _KeyPartTable(dict):
+    """str.translate table keeping only record-key characters.
+
+    Entries are filled on first lookup, so the table never enumerates all of
+    Unicode up front.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        keep = (
+            "0" <= char <= "9"
+            or "a" <= char <= "z"
+            or "а" <= char <= "я"
+            or char == "ё"
+            or "\u0590" <= char <= "\u05ff"
+            or char in " ./-"
+        )
+        result = codepoint if keep else None
+        self[codepoint] = result
+        return result
+
+
+_KEY_PART_TABLE = _KeyPartTable()
+
+
+_TRANSLATE_HEADERS = {
+    "User-Agent": "Mozilla/5.0",
+    "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+}
+_GET_HEADERS = {"User-Agent": "Mozilla/5.0"}
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 5
+_HTTP_READ_BLOCK = 64 * 1024
+# Bodies abandoned by _read_body with at most this much left are read to the
+# end anyway, which is cheaper than a new TLS handshake for the next request.
+_HTTP_DRAIN_LIMIT = 64 * 1024
+# Keep-alive connections per (thread, host); About-job loads fetch and
+# translate from worker threads and http.client connections are not thread-safe.
+_HTTP_LOCAL = threading.local()
+
+
+def _read_text_fast(path: Path) -> str:
+    """Read a UTF-8 file like ``read_text(errors="ignore")``, without the text I/O stack."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+    text = data.decode("utf-8", errors="ignore")
+    if "\r" in text:
+        # read_text() applies universal newlines.
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _pack_body(text: str) -> bytes:
+    """Compress an email body for the ``applications.body`` column."""
+    return zlib.compress(text.encode("utf-8"))
+
+
+def _unpack_body(value: object) -> str:
+    # Rows written before bodies were compressed still hold plain TEXT.
+    if isinstance(value, bytes):
+        return zlib.decompress(value).decode("utf-8")
+    return str(value)
+
+
+def _read_body(response: http.client.HTTPResponse, until: Optional[re.Pattern[bytes]]) -> bytes:
+    """Read the response body, stopping early once ``until`` matches the bytes read so far.
+
+    A short remainder is still drained so the connection stays reusable.
+    """
+    if until is None:
+        return response.read()
+    body = bytearray()
+    while True:
+        block = response.read(_HTTP_READ_BLOCK)
+        if not block:
+            break
+        body += block
+        if until.search(body):
+            if response.length is not None and response.length <= _HTTP_DRAIN_LIMIT:
+                response.read()
+            break
+    return bytes(body)
+
+
+def _http_request(
+    method: str,
+    url: str,
+    payload: Optional[bytes],
+    headers: dict[str, str],
+    timeout: float,
+    until: Optional[re.Pattern[bytes]] = None,
+) -> tuple[int, http.client.HTTPMessage, bytes]:
+    """Send one request over this thread's keep-alive connection to the host."""
+    parts = urllib.parse.urlsplit(url)
+    path = f"{parts.path or '/'}?{parts.query}" if parts.query else parts.path or "/"
+    key = f"{parts.scheme}://{parts.netloc}"
+    connections: dict[str, http.client.HTTPConnection] = _HTTP_LOCAL.__dict__.setdefault("connections", {})
+    while True:
+        conn = connections.pop(key, None)
+        reused = conn is not None
+        if conn is None:
+            conn_class = http.client.HTTPConnection if parts.scheme == "http" else http.client.HTTPSConnection
+            conn = conn_class(parts.netloc, timeout=timeout)
+        elif conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        try:
+            conn.request(method, path, body=payload, headers=headers)
+            response = conn.getresponse()
+            body = _read_body(response, until)
+        except (http.client.HTTPException, OSError) as exc:
+            conn.close()
+            # The server may have dropped an idle connection; retry once fresh.
+            if reused and not isinstance(exc, TimeoutError):
+                continue
+            raise
+        if response.will_close or not response.isclosed():
+            # Closed by the server, or abandoned mid-body by ``until``.
+            conn.close()
+        else:
+            connections[key] = conn
+        return response.status, response.headers, body
+
+
+def _http_post(url: str, payload: bytes, timeout: float) -> bytes:
+    """POST a form to ``url`` reusing this thread's connection to the host.
+
+    Error statuses raise ``HTTPError`` like ``urllib.request.urlopen`` does.
+    """
+    status, headers, body = _http_request("POST", url, payload, _TRANSLATE_HEADERS, timeout)
+    if status >= 400:
+        raise HTTPError(url, status, http.client.responses.get(status, ""), headers, io.BytesIO(body))
+    return body
+
+
+def _http_get(url: str, timeout: float, until: Optional[re.Pattern[bytes]] = None) -> bytes:
+    """GET ``url`` over a keep-alive connection, following redirects like urlopen.
+
+    With ``until`` the body may be cut short once that pattern has matched.
+    """
+    for _ in range(_MAX_REDIRECTS + 1):
+        status, headers, body = _http_request("GET", url, None, _GET_HEADERS, timeout, until)
+        location = headers.get("Location") if status in _REDIRECT_STATUSES else None
+        if not location:
+            break
+        url = urllib.parse.urljoin(url, location)
+    if status >= 400 or status in _REDIRECT_STATUSES:
+        raise HTTPError(url, status, http.client.responses.get(status, ""), headers, io.BytesIO(body))
+    return body
+
 
 @dataclass
 class ApplicationRow:
@@ -97,32 +476,114 @@ class ApplicationRow:
     about_job_text_ru: str
 
 
+@dataclass
+class TreeRow:
+    """The columns the applications tree shows; details come from get_by_id."""
+
+    id: int
+    company: str
+    role: str
+    location: str
+    subject: str
+    file_name: str
+    auto_status: str
+    current_status: str
+
+
+@dataclass
+class AboutJobSource:
+    link_url: str
+    company: str
+    role: str
+    location: str
+    about_en: str
+    about_ru: str
+
+
 class ApplicationsDB:
     def __init__(self, db_path: str) -> None:
         self.db_path = os.path.abspath(db_path)
         parent = os.path.dirname(self.db_path)
         if parent:
             os.makedirs(parent, exist_ok=True)
-        self.conn = sqlite3.connect(self.db_path)
+        self.conn = sqlite3.connect(self.db_path, cached_statements=256)
         self.job_cache: dict[str, tuple[str, str, str, str]] = {}
+        # job id -> About-the-job text downloaded ahead of a sync's inserts,
+        # including failure notes; cleared when the sync ends.
+        self._prefetched_about: dict[str, str] = {}
+        # job id -> parsed About-the-job text, backed by the job_postings
+        # table (entries younger than _POSTING_MAX_AGE_DAYS).
+        self.posting_cache: dict[str, str] = {}
+        self._pending_postings: list[tuple[str, str]] = []
+        # sha256(source chunk) -> Russian text. Backed by the translations
+        # table. New entries of both caches may come from worker threads, so
+        # they are queued and written by the GUI thread in _flush_caches().
         self.translation_cache: dict[str, str] = {}
+        self._pending_translations: list[tuple[str, str]] = []
+        self._cache_lock = threading.Lock()
         self.google_translate_blocked = False
+        # record_key -> pinned_status, loaded on first lookup and kept in step
+        # with every status_pins write made through this object.
+        self._pin_cache: Optional[dict[str, str]] = None
         self.translate_provider = (
             TRANSLATE_PROVIDER
             if TRANSLATE_PROVIDER in {"google_unofficial", "google_api"}
             else "google_unofficial"
         )
         self.google_translate_api_key = GOOGLE_TRANSLATE_API_KEY
+        self._configure_pragmas()
         self._init_schema()
+        self.translation_cache.update(self.conn.execute(_SELECT_TRANSLATIONS_SQL))
+        self.posting_cache.update(self.conn.execute(_SELECT_POSTINGS_SQL))
+        # Tree and detail reads go through a separate read-only connection; in
+        # WAL mode it never waits on the writer. Every write path commits
+        # before the GUI re-reads, so it always sees current data.
+        self.read_conn = sqlite3.connect(
+            f"{Path(self.db_path).as_uri()}?mode=ro", uri=True, cached_statements=256
+        )
+        self.read_conn.execute("PRAGMA mmap_size = 268435456")
 
     def close(self) -> None:
+        self._flush_caches()
+        self.conn.commit()
+        self.read_conn.close()
         self.conn.close()
 
+    def _flush_caches(self) -> None:
+        with self._cache_lock:
+            translations, self._pending_translations = self._pending_translations, []
+            postings, self._pending_postings = self._pending_postings, []
+        if translations:
+            self.conn.executemany(_INSERT_TRANSLATION_SQL, translations)
+        if postings:
+            self.conn.executemany(_INSERT_POSTING_SQL, postings)
+
     def reset_all(self) -> None:
         self.conn.execute("DELETE FROM applications")
         self.conn.commit()
 
+    def _configure_pragmas(self) -> None:
+        # WAL + NORMAL sync drops the per-commit fsync of the many small
+        # status/translation commits and keeps readers off the writer's lock.
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute("PRAGMA busy_timeout = 5000")
+        self.conn.execute("PRAGMA cache_size = -65536")
+        self.conn.execute("PRAGMA temp_store = MEMORY")
+        self.conn.execute("PRAGMA mmap_size = 268435456")
+
     def _init_schema(self) -> None:
+        # The legacy copy, DDL and description migration share one IMMEDIATE
+        # transaction, so a failed bootstrap never leaves a dropped table.
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._bootstrap_schema()
+        except BaseException:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+
+    def _bootstrap_schema(self) -> None:
         legacy_rows: list[tuple] = []
         if self._table_exists("applications"):
             cols = self._table_columns("applications")
@@ -138,7 +599,8 @@ class ApplicationsDB:
                 ).fetchall()
                 self.conn.execute("DROP TABLE applications")
 
-        self.conn.executescript(
+        # Plain execute() calls: executescript() would commit the open transaction.
+        self.conn.execute(
             """
             CREATE TABLE IF NOT EXISTS applications (
                 id INTEGER PRIMARY KEY,
@@ -160,18 +622,84 @@ class ApplicationsDB:
                 body TEXT NOT NULL,
                 created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
                 updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-            );
-
-            CREATE INDEX IF NOT EXISTS idx_applications_status
-                ON applications(current_status, company, email_date);
+            )
+            """
+        )
+        # Leads with get_by_status's ORDER BY (collations and direction
+        # included) so a status tab is read in index order without a sort
+        # step. id comes next so ties keep their rowid order, and the trailing
+        # columns make it covering for _TREE_ROW_COLUMNS, so building the tree
+        # never touches the table and its bodies. It
+        # replaces idx_applications_status and idx_applications_status_order.
+        self.conn.execute("DROP INDEX IF EXISTS idx_applications_status")
+        self.conn.execute("DROP INDEX IF EXISTS idx_applications_status_order")
+        new_tree_index = not self._index_exists("idx_applications_tree")
+        self.conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_applications_tree
+                ON applications(
+                    current_status, company COLLATE NOCASE, email_date DESC, file_name COLLATE NOCASE,
+                    id, role, location, subject, auto_status
+                )
+            """
+        )
+        self.conn.execute(
+            """
             CREATE INDEX IF NOT EXISTS idx_applications_source_file
-                ON applications(source_file);
-
+                ON applications(source_file)
+            """
+        )
+        # Partial covering index for snapshot_non_incoming_statuses: the scan
+        # never touches the table or the (usually dominant) incoming rows.
+        new_pin_index = not self._index_exists("idx_applications_pinnable")
+        self.conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_applications_pinnable
+                ON applications(current_status, record_key)
+                WHERE current_status != 'incoming'
+            """
+        )
+        if new_tree_index or new_pin_index:
+            self.conn.execute("ANALYZE applications")
+        self.conn.execute(
+            """
             CREATE TABLE IF NOT EXISTS status_pins (
                 record_key TEXT PRIMARY KEY,
                 pinned_status TEXT NOT NULL,
                 updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-            );
+            )
+            """
+        )
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS job_postings (
+                job_id TEXT PRIMARY KEY,
+                about TEXT NOT NULL,
+                fetched_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS translations (
+                hash TEXT PRIMARY KEY,
+                source_lang TEXT NOT NULL,
+                target_lang TEXT NOT NULL,
+                translated TEXT NOT NULL,
+                created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS source_files (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                parse_version INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                records TEXT NOT NULL
+            )
             """
         )
         self._ensure_column("applications", "location", "TEXT")
@@ -179,60 +707,59 @@ class ApplicationsDB:
         self._ensure_column("applications", "about_job_text_ru", "TEXT")
 
         if legacy_rows:
-            cur = self.conn.cursor()
-            for row in legacy_rows:
-                source_file = str(row[0])
-                record_key = f"{source_file}::legacy"
-                cur.execute(
-                    """
-                    INSERT OR IGNORE INTO applications(
-                        record_key, source_file, file_name, email_date, subject, company, role, location, link_url, about_job_text,
-                        about_job_text_en, about_job_text_ru, auto_status, manual_status, current_status, body
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (record_key, *row),
-                )
+            # Already inside the bootstrap transaction, so one executemany
+            # reuses a single prepared statement for every legacy row.
+            self.conn.executemany(
+                """
+                INSERT OR IGNORE INTO applications(
+                    record_key, source_file, file_name, email_date, subject, company, role, location, link_url, about_job_text,
+                    about_job_text_en, about_job_text_ru, auto_status, manual_status, current_status, body
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                ((f"{row[0]}::legacy", *row) for row in legacy_rows),
+            )
         self._migrate_description_columns()
-        self.conn.commit()
 
     def _migrate_description_columns(self) -> None:
-        cur = self.conn.cursor()
-        cur.execute(
+        # One set-based UPDATE; the Python helpers keep str.strip() and the
+        # Cyrillic-ratio check identical to the former per-row loop.
+        self.conn.create_function("clean_text", 1, self._clean_text, deterministic=True)
+        self.conn.create_function("looks_russian", 1, self._looks_russian, deterministic=True)
+        self.conn.execute(
             """
-            SELECT id, COALESCE(about_job_text, ''), COALESCE(about_job_text_en, ''), COALESCE(about_job_text_ru, '')
-            FROM applications
+            UPDATE applications
+            SET about_job_text_en = CASE
+                    WHEN clean_text(about_job_text_en) = '' AND NOT looks_russian(clean_text(about_job_text))
+                    THEN clean_text(about_job_text)
+                    ELSE clean_text(about_job_text_en)
+                END,
+                about_job_text_ru = CASE
+                    WHEN clean_text(about_job_text_ru) = '' AND looks_russian(clean_text(about_job_text))
+                    THEN clean_text(about_job_text)
+                    ELSE clean_text(about_job_text_ru)
+                END
+            WHERE clean_text(about_job_text) <> ''
+              AND (
+                  about_job_text_en IS NOT clean_text(about_job_text_en)
+                  OR about_job_text_ru IS NOT clean_text(about_job_text_ru)
+                  OR about_job_text_en = ''
+                  OR about_job_text_ru = ''
+              )
             """
         )
-        for app_id, legacy_text, text_en, text_ru in cur.fetchall():
-            legacy = str(legacy_text or "").strip()
-            en_val = str(text_en or "").strip()
-            ru_val = str(text_ru or "").strip()
-            if not legacy:
-                continue
-            if not en_val and not ru_val:
-                if self._looks_russian(legacy):
-                    ru_val = legacy
-                else:
-                    en_val = legacy
-            elif not en_val and not self._looks_russian(legacy):
-                en_val = legacy
-            elif not ru_val and self._looks_russian(legacy):
-                ru_val = legacy
-            cur.execute(
-                """
-                UPDATE applications
-                SET about_job_text_en = ?, about_job_text_ru = ?
-                WHERE id = ?
-                """,
-                (en_val, ru_val, int(app_id)),
-            )
+
+    @staticmethod
+    def _clean_text(value: object) -> str:
+        return str(value or "").strip()
 
     def _table_exists(self, table: str) -> bool:
         cur = self.conn.cursor()
-        cur.execute(
-            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ? LIMIT 1",
-            (table,),
-        )
+        cur.execute(_TABLE_EXISTS_SQL, (table,))
+        return cur.fetchone() is not None
+
+    def _index_exists(self, index: str) -> bool:
+        cur = self.conn.cursor()
+        cur.execute(_INDEX_EXISTS_SQL, (index,))
         return cur.fetchone() is not None
 
     def _table_columns(self, table: str) -> set[str]:
@@ -241,40 +768,36 @@ class ApplicationsDB:
         return {str(row[1]) for row in cur.fetchall()}
 
     def _ensure_column(self, table: str, column: str, definition: str) -> None:
-        cur = self.conn.cursor()
-        cur.execute(f"PRAGMA table_info({table})")
-        cols = {row[1] for row in cur.fetchall()}
-        if column not in cols:
-            cur.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+        if column not in self._table_columns(table):
+            self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    def _pins(self) -> dict[str, str]:
+        if self._pin_cache is None:
+            self._pin_cache = {
+                str(record_key): str(status or "") for record_key, status in self.conn.execute(_SELECT_PINS_SQL)
+            }
+        return self._pin_cache
 
     def get_pinned_status(self, record_key: str) -> Optional[str]:
-        cur = self.conn.cursor()
-        cur.execute("SELECT pinned_status FROM status_pins WHERE record_key = ?", (record_key,))
-        row = cur.fetchone()
-        if not row:
+        status = self._pins().get(record_key)
+        if status is None:
             return None
-        status = str(row[0] or "")
-        if status not in STATUS_ORDER or status == "incoming":
+        if status not in _PINNABLE_STATUSES:
             return None
         return status
 
     def set_pinned_status(self, record_key: str, status: Optional[str]) -> None:
         cur = self.conn.cursor()
         if status is None or status == "incoming":
-            cur.execute("DELETE FROM status_pins WHERE record_key = ?", (record_key,))
+            cur.execute(_DELETE_PIN_SQL, (record_key,))
+            if self._pin_cache is not None:
+                self._pin_cache.pop(record_key, None)
             return
-        if status not in STATUS_ORDER:
+        if status not in _STATUS_SET:
             raise ValueError(f"Invalid status: {status}")
-        cur.execute(
-            """
-            INSERT INTO status_pins(record_key, pinned_status, updated_at)
-            VALUES (?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(record_key) DO UPDATE SET
-                pinned_status = excluded.pinned_status,
-                updated_at = CURRENT_TIMESTAMP
-            """,
-            (record_key, status),
-        )
+        cur.execute(_UPSERT_PIN_SQL, (record_key, status))
+        if self._pin_cache is not None:
+            self._pin_cache[record_key] = status
 
     def snapshot_non_incoming_statuses(self) -> int:
         cur = self.conn.cursor()
@@ -285,63 +808,84 @@ class ApplicationsDB:
             WHERE current_status != 'incoming'
             """
         )
-        rows = cur.fetchall()
-        changed = 0
-        for record_key, current_status in rows:
-            if not record_key:
-                continue
-            status = str(current_status or "")
-            if status not in STATUS_ORDER or status == "incoming":
-                continue
-            self.set_pinned_status(str(record_key), status)
-            changed += 1
+        rows = [
+            (str(record_key), str(current_status))
+            for record_key, current_status in cur.fetchall()
+            if record_key and current_status in _PINNABLE_STATUSES
+        ]
+        cur.executemany(_UPSERT_PIN_SQL, rows)
         self.conn.commit()
-        return changed
+        if self._pin_cache is not None:
+            self._pin_cache.update(rows)
+        return len(rows)
+
+    @staticmethod
+    def _job_link_matches(text: str) -> list[re.Match[str]]:
+        """Return the matches of every job-link pattern, pattern by pattern.
+
+        One scan locates candidate offsets; only the patterns that can start
+        there are matched, skipping offsets inside their own previous match.
+        That reproduces one finditer() pass per pattern, nested links included.
+        """
+        found: list[tuple[int, int, re.Match[str]]] = []
+        last_end = [0] * len(_JOB_LINK_PATTERNS)
+        has_current_job_id = _RE_CURRENT_JOB_ID.search(text) is not None
+        for hit in _RE_JOB_LINK_HOST.finditer(text):
+            host = hit.start()
+            attempts: list[tuple[int, int]] = []
+            # "http://" is 7 chars and "https://abc." 12; at most one fits.
+            for start in range(max(0, host - 12), host - 6):
+                if _RE_JOB_LINK_SCHEME.fullmatch(text, start, host):
+                    attempts.extend((index, start) for index in _JOB_LINK_CANDIDATES.get(hit.lastgroup or "", ()))
+                    if has_current_job_id:
+                        attempts.append((_CURRENT_JOB_ID_PATTERN, start))
+                    break
+            if hit.lastgroup == "encoded":
+                attempts.append((_ENCODED_JOB_VIEW_PATTERN, host))
+            for index, start in attempts:
+                if start < last_end[index]:
+                    continue
+                match = _JOB_LINK_PATTERNS[index].match(text, start)
+                if match:
+                    found.append((index, start, match))
+                    last_end[index] = match.end()
+        found.sort(key=lambda item: (item[0], item[1]))
+        return [match for _index, _start, match in found]
 
     @staticmethod
     def extract_job_links(text: str) -> list[str]:
         normalized_text = html.unescape(text or "")
-        patterns = [
-            r"https?://(?:[a-z]{1,3}\.)?linkedin\.com/jobs/view/\d+[^\s)>\]\"']*",
-            r"https?://(?:[a-z]{1,3}\.)?linkedin\.com/comm/jobs/view/\d+[^\s)>\]\"']*",
-            r"https?://(?:[a-z]{1,3}\.)?linkedin\.com/(?:comm/)?company/[^/\s)>\]\"']+/jobs[^\s)>\]\"']*",
-            r"https?://(?:[a-z]{1,3}\.)?linkedin\.com/(?:comm/)?company/[^/\s)>\]\"']+[^\s)>\]\"']*",
-            r"https?://(?:[a-z]{1,3}\.)?linkedin\.com/jobs/search/[^\s)>\]\"']*",
-            r"https?://(?:[a-z]{1,3}\.)?linkedin\.com/[^\s)>\]\"']*currentJobId=\d+[^\s)>\]\"']*",
-            r"linkedin\.com/(?:comm/)?jobs%2Fview%2F\d+",
-        ]
         raw_by_canonical: dict[str, str] = {}
         by_job_id: dict[str, str] = {}
-        for pattern in patterns:
-            for match in re.finditer(pattern, normalized_text, flags=re.IGNORECASE):
-                url = match.group(0).strip().rstrip(".,;)")
-                if not url.lower().startswith("http"):
-                    url = f"https://www.{url.lstrip('/')}"
-
-                # Accept plain company profile links only when context indicates role openings.
-                parsed_candidate = urllib.parse.urlparse(url)
-                path_candidate = (parsed_candidate.path or "").lower()
-                is_company_profile = bool(re.match(r"^/(comm/)?company/[^/]+/?$", path_candidate))
-                if is_company_profile:
-                    ctx_start = max(0, match.start() - 180)
-                    ctx_end = min(len(normalized_text), match.end() + 80)
-                    context = normalized_text[ctx_start:ctx_end].lower()
-                    if not re.search(r"view\s+roles|view\s+jobs|ваканси|jobs\s+for\s+your\s+role", context):
-                        continue
-
-                canonical = ApplicationsDB.canonicalize_job_url(url)
-                if not ApplicationsDB._is_supported_job_link(canonical):
-                    continue
-                job_id = extract_job_id(canonical) or extract_job_id(url)
-                if job_id:
-                    by_job_id[job_id] = canonical
+        for match in ApplicationsDB._job_link_matches(normalized_text):
+            url = match.group(0).strip().rstrip(".,;)")
+            if not url.lower().startswith("http"):
+                url = f"https://www.{url.lstrip('/')}"
+
+            # Accept plain company profile links only when context indicates role openings.
+            parsed_candidate = urllib.parse.urlparse(url)
+            path_candidate = (parsed_candidate.path or "").lower()
+            is_company_profile = bool(_RE_COMPANY_PROFILE_PATH.match(path_candidate))
+            if is_company_profile:
+                ctx_start = max(0, match.start() - 180)
+                ctx_end = min(len(normalized_text), match.end() + 80)
+                context = normalized_text[ctx_start:ctx_end].lower()
+                if not _RE_ROLE_OPENINGS_CONTEXT.search(context):
                     continue
-                raw_by_canonical.setdefault(canonical, url)
 
-        for job_id in re.findall(r"currentJobId=(\d+)", normalized_text, flags=re.IGNORECASE):
+            canonical = ApplicationsDB.canonicalize_job_url(url)
+            if not ApplicationsDB._is_supported_job_link(canonical):
+                continue
+            job_id = extract_job_id(canonical) or extract_job_id(url)
+            if job_id:
+                by_job_id[job_id] = canonical
+                continue
+            raw_by_canonical.setdefault(canonical, url)
+
+        for job_id in _RE_CURRENT_JOB_ID.findall(normalized_text):
             by_job_id[job_id] = f"https://www.linkedin.com/jobs/view/{job_id}/"
 
-        for job_id in re.findall(r"jobs%2[fF]view%2[fF](\d+)", normalized_text, flags=re.IGNORECASE):
+        for job_id in _RE_ENCODED_JOB_VIEW.findall(normalized_text):
             by_job_id[job_id] = f"https://www.linkedin.com/jobs/view/{job_id}/"
 
         # For job-id links keep canonical form (stable and concise).
@@ -352,27 +896,24 @@ class ApplicationsDB:
         return list(raw_by_canonical.values())
 
     @staticmethod
+    @functools.lru_cache(maxsize=16384)
     def canonicalize_job_url(link_url: str) -> str:
-        try:
-            parsed = urllib.parse.urlparse(link_url)
-        except Exception:
-            parsed = None
+        # Follow-ups and reminders repeat the same links, so results are
+        # memoized. Job view links (the common case) skip urlparse: a
+        # company path always contains "company/".
+        if "company/" in link_url.lower():
+            try:
+                parsed = urllib.parse.urlparse(link_url)
+            except Exception:
+                parsed = None
 
-        if parsed and parsed.netloc:
-            host = parsed.netloc.lower()
-            path = parsed.path or ""
-            if "linkedin.com" in host:
+            if parsed and parsed.netloc and "linkedin.com" in parsed.netloc.lower():
                 # Canonicalize company jobs pages and drop tracking query params.
-                m = re.match(r"^/(comm/)?company/([^/]+)/jobs/?$", path, flags=re.IGNORECASE)
+                m = _RE_COMPANY_PAGE.match(parsed.path or "")
                 if m:
                     comm = "comm/" if m.group(1) else ""
                     slug = m.group(2)
                     return f"https://www.linkedin.com/{comm}company/{slug}/jobs"
-                m_company = re.match(r"^/(comm/)?company/([^/]+)/?$", path, flags=re.IGNORECASE)
-                if m_company:
-                    comm = "comm/" if m_company.group(1) else ""
-                    slug = m_company.group(2)
-                    return f"https://www.linkedin.com/{comm}company/{slug}/jobs"
 
         job_id = extract_job_id(link_url)
         if not job_id:
@@ -386,14 +927,31 @@ class ApplicationsDB:
         if not link_url:
             return False
         lower = link_url.lower()
-        if "/jobs/view/" in lower:
-            return True
-        if re.search(r"/(?:comm/)?company/[^/]+/jobs/?(?:$|\?)", lower):
-            return True
-        if re.search(r"/(?:comm/)?company/[^/]+/?(?:$|\?)", lower):
-            return True
-        if "/jobs/search/" in lower:
+        if "/jobs/view/" in lower or "/jobs/search/" in lower:
             return True
+        return ApplicationsDB._has_company_path(lower)
+
+    @staticmethod
+    def _has_company_path(lower: str) -> bool:
+        """str.find form of /(?:comm/)?company/<slug>(?:/jobs)?/?(?:$|\\?) for URLs."""
+
+        def at_path_end(tail: str) -> bool:
+            return tail in ("", "/") or tail.startswith(("?", "/?"))
+
+        start = lower.find("/company/")
+        while start != -1:
+            rest = lower[start + 9:]
+            slug_end = rest.find("/")
+            if slug_end == -1:
+                slug_end = len(rest)
+            # The slug may end at a query string, the end, or an optional "/jobs" segment.
+            if slug_end and (
+                "?" in rest[1:slug_end]
+                or at_path_end(rest[slug_end:])
+                or (rest.startswith("/jobs", slug_end) and at_path_end(rest[slug_end + 5:]))
+            ):
+                return True
+            start = lower.find("/company/", start + 1)
         return False
 
     @staticmethod
@@ -405,8 +963,7 @@ class ApplicationsDB:
 
     @staticmethod
     def _key_part(value: str) -> str:
-        cleaned = re.sub(r"\s+", " ", (value or "").strip().lower())
-        return re.sub(r"[^0-9a-zа-яё\u0590-\u05ff ./-]+", "", cleaned)
+        return " ".join((value or "").lower().split()).translate(_KEY_PART_TABLE)
 
     def record_key_for_offer(self, company: str, role: str, location: str, link_url: str) -> str:
         company_k = self._key_part(company)
@@ -419,36 +976,14 @@ class ApplicationsDB:
 
     @staticmethod
     def _clean_offer_line(line: str) -> str:
-        cleaned = re.sub(r"\s+", " ", line).strip()
-        cleaned = cleaned.strip("-–—|•:;,.")
-        return cleaned
+        return " ".join(line.split()).strip("-–—|•:;,.")
 
     @staticmethod
     def _is_noise_line(line: str) -> bool:
         lowered = line.lower()
         if not lowered:
             return True
-        markers = [
-            "view job",
-            "ссылка",
-            "см. вакансию",
-            "apply now",
-            "apply with resume",
-            "apply with profile",
-            "linkedin",
-            "jobs similar",
-            "job alert",
-            "оповещени",
-            "unsubscribe",
-            "notifications",
-            "this company is actively hiring",
-            "эта компания активно нанимает новых сотрудников",
-            "эта компания активно нанимает",
-            "компания активно нанимает",
-            "החברה מגייסת עובדים",
-            "actively hiring",
-        ]
-        return any(marker in lowered for marker in markers) or "http" in lowered
+        return "http" in lowered or _RE_NOISE_MARKER.search(lowered) is not None
 
     @staticmethod
     def _looks_like_location(line: str) -> bool:
@@ -458,28 +993,11 @@ class ApplicationsDB:
         lowered = text.lower()
 
         # Obvious non-location phrases.
-        bad_markers = [
-            "engineer",
-            "developer",
-            "administrator",
-            "specialist",
-            "manager",
-            "support",
-            "resume",
-            "profile",
-            "hiring",
-            "нанимает",
-            "вакан",
-            "позици",
-            "должност",
-            "компания",
-            "this company",
-        ]
-        if any(m in lowered for m in bad_markers):
+        if _RE_NON_LOCATION_MARKER.search(lowered):
             return False
 
         # Reasonable location line is usually short and noun-like.
-        tokens = re.findall(r"\S+", text)
+        tokens = text.split()
         if len(tokens) > 7:
             return False
         if len(tokens) == 1 and len(tokens[0]) <= 2:
@@ -488,10 +1006,15 @@ class ApplicationsDB:
 
     def extract_offers_from_email(self, text: str) -> dict[str, tuple[str, str, str]]:
         offers: dict[str, tuple[str, str, str]] = {}
+        # Every "View job" match carries a URL, so lines without "://" are
+        # skipped before the case-insensitive regex runs.
+        if "://" not in text:
+            return offers
         lines = text.splitlines()
-        view_job_re = re.compile(r"(?i)(?:View job|См\.\s*вакансию)\s*:\s*(https?://\S+)")
         for idx, line in enumerate(lines):
-            match = view_job_re.search(line)
+            if "://" not in line:
+                continue
+            match = _RE_VIEW_JOB_LINE.search(line)
             if not match:
                 continue
             raw_url = match.group(1).strip().rstrip(".,;)")
@@ -530,38 +1053,55 @@ class ApplicationsDB:
             offers[url] = (role, company, location)
         return offers
 
+    @staticmethod
+    def _lines_before(text: str, end: int) -> Iterator[str]:
+        """Yield the lines of ``text[:end].splitlines()`` from last to first.
+
+        The prefix is split in growing windows from ``end`` backward, so a link
+        near the bottom of a long digest does not split the whole email.
+        """
+        window = 4096
+        emitted = 0
+        while True:
+            start = max(0, end - window)
+            lines = text[start:end].splitlines()
+            if start:
+                # The first line of a window may be cut; it is re-read whole next round.
+                del lines[0]
+            yield from reversed(lines[: len(lines) - emitted])
+            if not start:
+                return
+            emitted = len(lines)
+            window *= 4
+
     def extract_company_role_location_for_link(
         self, text: str, link_url: str, fallback_company: str, raw_link_url: Optional[str] = None
     ) -> tuple[str, str, str]:
-        company_jobs_match = re.search(r"/(?:comm/)?company/([^/]+)/jobs/?(?:$|\?)", link_url, flags=re.IGNORECASE)
+        company_jobs_match = _RE_COMPANY_JOBS_LINK.search(link_url)
         if company_jobs_match:
             slug = company_jobs_match.group(1).strip()
-            company_from_slug = re.sub(r"[-_]+", " ", slug).strip() or fallback_company
+            company_from_slug = _RE_SLUG_SEPARATORS.sub(" ", slug).strip() or fallback_company
             subject = extract_subject(text) or ""
-            subject_role_match = re.match(r"^\s*([^:]{2,120})\s*:", subject)
+            subject_role_match = _RE_SUBJECT_ROLE.match(subject)
             role_from_subject = subject_role_match.group(1).strip() if subject_role_match else ""
-            location_match = re.search(
-                r"(?i)\broles?\s+were\s+hired\s+this\s+week\s+in\s+([^\r\n]+)",
-                text,
-            )
+            location_match = _RE_HIRED_THIS_WEEK.search(text)
             location_from_text = self._clean_offer_line(location_match.group(1)) if location_match else ""
 
             company_from_text = ""
             for candidate in [raw_link_url, link_url]:
                 if not candidate:
                     continue
-                m = re.search(re.escape(candidate), text)
-                if not m:
+                link_start = text.find(candidate)
+                if link_start == -1:
                     continue
-                before = text[:m.start()]
-                lines = [self._clean_offer_line(x) for x in before.splitlines()]
-                for line in reversed(lines[-12:]):
+                for raw in itertools.islice(self._lines_before(text, link_start), 12):
+                    line = self._clean_offer_line(raw)
                     if not line:
                         continue
                     lower = line.lower()
                     if lower in {"view roles", "view", "follow"}:
                         continue
-                    if re.search(r"\b(new hire|followers|employees)\b", lower):
+                    if _RE_COMPANY_PAGE_STATS.search(lower):
                         continue
                     if line.startswith("?") or "=" in line:
                         continue
@@ -575,32 +1115,27 @@ class ApplicationsDB:
             location = location_from_text or ""
             return role, company, location
 
-        match = None
+        link_start = -1
         matched_link = ""
         for candidate in [raw_link_url, link_url]:
             if not candidate:
                 continue
-            escaped = re.escape(candidate)
-            match = re.search(escaped, text)
-            if match:
+            link_start = text.find(candidate)
+            if link_start != -1:
                 matched_link = candidate
                 break
-        if not match:
+        if link_start == -1:
             return "", fallback_company, ""
+        link_end = link_start + len(matched_link)
 
         # Inline pattern: "Jobs similar to <role> at <company> <url>"
-        full_line_start = text.rfind("\n", 0, match.start()) + 1
-        full_line_end = text.find("\n", match.end())
+        full_line_start = text.rfind("\n", 0, link_start) + 1
+        full_line_end = text.find("\n", link_end)
         if full_line_end == -1:
             full_line_end = len(text)
         full_line = text[full_line_start:full_line_end].strip()
-        inline_patterns = [
-            r"(?i)^jobs similar to\s+(.+?)\s+at\s+(.+?)\s+https?://",
-            r"(?i)^new jobs similar to\s+(.+?)\s+at\s+(.+?)\s+https?://",
-            r"(?i)^вакансии, похожие на\s+(.+?)\s+в\s+(.+?)\s+https?://",
-        ]
-        for pattern in inline_patterns:
-            m = re.search(pattern, full_line)
+        for pattern in _INLINE_OFFER_PATTERNS:
+            m = pattern.search(full_line)
             if m:
                 role = self._clean_offer_line(m.group(1))
                 company = self._clean_offer_line(m.group(2))
@@ -617,16 +1152,15 @@ class ApplicationsDB:
         ):
             same_line_text = ""
         if same_line_text and not self._is_noise_line(same_line_text):
-            parts = [self._clean_offer_line(p) for p in re.split(r"\s[-–—|]\s", same_line_text) if self._clean_offer_line(p)]
+            parts = [self._clean_offer_line(p) for p in _RE_OFFER_PART_SEPARATOR.split(same_line_text) if self._clean_offer_line(p)]
             if len(parts) >= 2:
                 return parts[1], parts[0], ""
             if len(parts) == 1:
                 return parts[0], fallback_company, ""
 
         # Fallback: two non-empty lines before the link line.
-        before = text[:match.start()]
         candidates: list[str] = []
-        for raw in reversed(before.splitlines()):
+        for raw in self._lines_before(text, link_start):
             cleaned = self._clean_offer_line(raw)
             if not cleaned or self._is_noise_line(cleaned):
                 continue
@@ -659,42 +1193,42 @@ class ApplicationsDB:
 
     @staticmethod
     def _normalize_inline(value: str) -> str:
-        return re.sub(r"\s+", " ", value or "").strip()
+        return _RE_WHITESPACE.sub(" ", value or "").strip()
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _looks_russian(text: str) -> bool:
+        # The same descriptions are checked again by sync, the About-job view
+        # and the translation passes, so results are memoized.
         if not text:
             return False
-        letters = re.findall(r"[A-Za-zА-Яа-яЁё]", text)
+        folded = text.translate(_LETTER_CLASS_TABLE)
+        cyr = folded.count("я")
+        letters = folded.count("a") + cyr
         if not letters:
             return False
-        cyr = re.findall(r"[А-Яа-яЁё]", text)
-        return (len(cyr) / max(1, len(letters))) >= 0.2
+        return (cyr / letters) >= 0.2
 
     def _translate_chunk_google_api(self, chunk: str) -> str:
+        return self._translate_chunks_google_api([chunk])[0]
+
+    def _translate_chunks_google_api(self, chunks: list[str]) -> list[str]:
         if not self.google_translate_api_key:
             raise RuntimeError("Google Cloud Translate API key is missing.")
 
+        # The v2 API takes repeated q parameters and answers in the same order.
         payload = urllib.parse.urlencode(
-            {
-                "q": chunk,
-                "target": "ru",
-                "format": "text",
-                "key": self.google_translate_api_key,
-            }
+            [("q", chunk) for chunk in chunks]
+            + [
+                ("target", "ru"),
+                ("format", "text"),
+                ("key", self.google_translate_api_key),
+            ]
         ).encode("utf-8")
-        req = urllib.request.Request(
-            "https://translation.googleapis.com/language/translate/v2",
-            data=payload,
-            headers={
-                "User-Agent": "Mozilla/5.0",
-                "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-            },
-            method="POST",
-        )
         try:
-            with urllib.request.urlopen(req, timeout=15) as response:
-                payload_text = response.read().decode("utf-8", errors="ignore")
+            payload_text = _http_post(
+                "https://translation.googleapis.com/language/translate/v2", payload, timeout=15
+            ).decode("utf-8", errors="ignore")
         except HTTPError as exc:
             details = ""
             try:
@@ -703,16 +1237,20 @@ class ApplicationsDB:
                 details = str(exc)
             raise RuntimeError(f"Google API error {exc.code}: {details[:400]}") from exc
         data = json.loads(payload_text)
-        translated = (
-            data.get("data", {}).get("translations", [{}])[0].get("translatedText", "")
-            if isinstance(data, dict) else ""
-        )
-        translated_text = html.unescape(str(translated)).strip()
-        return translated_text or chunk
+        if not isinstance(data, dict):
+            return list(chunks)
+        translations = data.get("data", {}).get("translations", [])
+        if len(translations) != len(chunks):
+            raise RuntimeError(f"Google API returned {len(translations)} translations for {len(chunks)} texts")
+        results: list[str] = []
+        for chunk, item in zip(chunks, translations):
+            translated_text = html.unescape(str(item.get("translatedText", ""))).strip()
+            results.append(translated_text or chunk)
+        return results
 
     @staticmethod
     def _contains_hebrew_or_arabic(text: str) -> bool:
-        return bool(re.search(r"[\u0590-\u05FF\u0600-\u06FF]", text or ""))
+        return bool(_RE_HEBREW_OR_ARABIC.search(text or ""))
 
     def _translation_looks_successful(self, source: str, translated: str) -> bool:
         src = self._normalize_inline(source)
@@ -743,17 +1281,9 @@ class ApplicationsDB:
             for attempt in range(3):
                 try:
                     time.sleep(0.08)
-                    req = urllib.request.Request(
-                        "https://translate.googleapis.com/translate_a/single",
-                        data=payload,
-                        headers={
-                            "User-Agent": "Mozilla/5.0",
-                            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-                        },
-                        method="POST",
-                    )
-                    with urllib.request.urlopen(req, timeout=8) as response:
-                        payload_text = response.read().decode("utf-8", errors="ignore")
+                    payload_text = _http_post(
+                        "https://translate.googleapis.com/translate_a/single", payload, timeout=8
+                    ).decode("utf-8", errors="ignore")
                     data = json.loads(payload_text)
                     chunks_data = data[0] if isinstance(data, list) and data else []
                     translated = "".join(
@@ -771,48 +1301,76 @@ class ApplicationsDB:
                     break
         raise last_error if last_error else RuntimeError("Google unofficial translate failed")
 
-    def _translate_fragment_to_russian(self, fragment: str, strict: bool = False) -> str:
-        if not fragment or not TRANSLATE_TO_RU:
-            return fragment
+    def _translate_chunks_google_unofficial(self, chunks: list[str]) -> list[str]:
+        # The public endpoint takes one text, so chunks travel joined by a
+        # marker and are split apart again; a mangled marker fails the batch.
+        if len(chunks) == 1:
+            return [self._translate_chunk_google_unofficial(chunks[0])]
+        joined = f" {_CHUNK_BREAK_TOKEN} ".join(chunks)
+        parts = [part.strip() for part in _RE_CHUNK_BREAK_TOKEN.split(self._translate_chunk_google_unofficial(joined))]
+        if len(parts) != len(chunks):
+            raise RuntimeError(f"Google unofficial returned {len(parts)} parts for {len(chunks)} texts")
+        return [part or chunk for part, chunk in zip(parts, chunks)]
+
+    def _prepare_fragment(self, fragment: str) -> Optional[tuple[str, str]]:
+        """Return ``(fragment_with_lf, prepared_fragment)``, or None to keep it as is."""
         fragment_with_lf = fragment.replace("\r\n", "\n").replace("\r", "\n")
-        line_break_token = "__LINKINJOB_LB_9F4C__"
         prepared_fragment = (
-            fragment_with_lf.replace("\n", f" {line_break_token} ")
+            fragment_with_lf.replace("\n", f" {_LINE_BREAK_TOKEN} ")
             if "\n" in fragment_with_lf
             else fragment_with_lf
         )
         stripped_fragment = prepared_fragment.strip()
         if not stripped_fragment:
-            return fragment
+            return None
         if self._looks_russian(stripped_fragment):
-            return fragment
+            return None
         if "http://" in stripped_fragment.lower() or "https://" in stripped_fragment.lower():
-            return fragment
+            return None
+        return fragment_with_lf, prepared_fragment
 
-        def split_chunks(text: str, max_len: int = 1100) -> list[str]:
-            if len(text) <= max_len:
-                return [text]
-            chunks: list[str] = []
-            start = 0
-            while start < len(text):
-                end = min(start + max_len, len(text))
-                if end < len(text):
-                    split_at = max(
-                        text.rfind("\n", start, end),
-                        text.rfind(". ", start, end),
-                        text.rfind("; ", start, end),
-                        text.rfind(", ", start, end),
-                        text.rfind(" ", start, end),
-                    )
-                    if split_at <= start + max_len // 3:
-                        split_at = end
-                else:
-                    split_at = end
-                chunk = text[start:split_at]
-                if chunk:
-                    chunks.append(chunk)
-                start = split_at
-            return chunks or [text]
+    @staticmethod
+    def _split_chunks(text: str, max_len: int = _TRANSLATE_CHUNK_CHARS) -> list[str]:
+        if len(text) <= max_len:
+            return [text]
+        chunks: list[str] = []
+        start = 0
+        while start < len(text):
+            end = min(start + max_len, len(text))
+            if end < len(text):
+                # Cut at the strongest break in the window: a line, then a
+                # sentence, then a clause, then a word. Punctuation stays with
+                # the chunk it ends; the following whitespace starts the next.
+                floor = start + max_len // 3
+                split_at = end
+                for separators in _CHUNK_BREAKS:
+                    candidate = max(text.rfind(sep, start, end) + len(sep) - 1 for sep in separators)
+                    if candidate > floor:
+                        split_at = candidate
+                        break
+            else:
+                split_at = end
+            chunk = text[start:split_at]
+            if chunk:
+                chunks.append(chunk)
+            start = split_at
+        return chunks or [text]
+
+    @staticmethod
+    def _split_chunk_core(chunk: str) -> tuple[str, str, str]:
+        """Split ``chunk`` into leading whitespace, translatable core and trailing whitespace."""
+        leading = _RE_LEADING_SPACE.match(chunk).group(0)
+        trailing = _RE_TRAILING_SPACE.search(chunk).group(0)
+        core = chunk[len(leading):len(chunk) - len(trailing) if trailing else len(chunk)]
+        return leading, core, trailing
+
+    def _translate_fragment_to_russian(self, fragment: str, strict: bool = False) -> str:
+        if not fragment or not TRANSLATE_TO_RU:
+            return fragment
+        prepared = self._prepare_fragment(fragment)
+        if prepared is None:
+            return fragment
+        fragment_with_lf, prepared_fragment = prepared
 
         def translate_chunk(chunk: str) -> str:
             errors: list[Exception] = []
@@ -852,39 +1410,45 @@ class ApplicationsDB:
                 raise errors[-1]
             raise RuntimeError("Translation failed")
 
+        def translate_core(core: str) -> str:
+            try:
+                return translate_chunk(core)
+            except Exception:
+                if len(core) <= _TRANSLATE_RETRY_CHUNK_CHARS:
+                    raise
+            # A provider rejected the long chunk; retry it in smaller pieces.
+            pieces: list[str] = []
+            for piece in self._split_chunks(core, _TRANSLATE_RETRY_CHUNK_CHARS):
+                leading, piece_core, trailing = self._split_chunk_core(piece)
+                if piece_core.strip():
+                    piece_core = translate_chunk(piece_core)
+                pieces.append(f"{leading}{piece_core}{trailing}")
+            return "".join(pieces)
+
         try:
             translated_parts: list[str] = []
-            for chunk in split_chunks(prepared_fragment):
+            for chunk in self._split_chunks(prepared_fragment):
                 # Preserve original separators/indentation around translated content.
-                leading = re.match(r"^\s*", chunk).group(0)
-                trailing = re.search(r"\s*$", chunk).group(0)
-                core = chunk[len(leading):len(chunk) - len(trailing) if trailing else len(chunk)]
+                leading, core, trailing = self._split_chunk_core(chunk)
 
                 if not core.strip():
                     translated_parts.append(chunk)
                     continue
 
-                cached = self.translation_cache.get(core)
+                key = hashlib.sha256(core.encode("utf-8")).hexdigest()
+                cached = self.translation_cache.get(key)
                 if cached is None:
-                    cached = translate_chunk(core)
-                    self.translation_cache[core] = cached
+                    cached = translate_core(core)
+                    self.translation_cache[key] = cached
+                    with self._cache_lock:
+                        self._pending_translations.append((key, cached))
                 translated_parts.append(f"{leading}{cached}{trailing}")
 
             result = "".join(translated_parts) or fragment_with_lf
             # Some providers may mutate marker punctuation/underscores.
             # Restore both canonical and deformed marker variants back to newlines.
-            result = re.sub(
-                rf"\s*{re.escape(line_break_token)}\s*",
-                "\n",
-                result,
-                flags=re.IGNORECASE,
-            )
-            result = re.sub(
-                r"\s*[_\-–—•·]*\s*LINKINJOB[\s_\-]+LB[\s_\-]+9F4C\s*[_\-–—•·]*\s*",
-                "\n",
-                result,
-                flags=re.IGNORECASE,
-            )
+            result = _RE_LINE_BREAK_TOKEN.sub("\n", result)
+            result = _RE_DEFORMED_LINE_BREAK_TOKEN.sub("\n", result)
         except Exception as exc:
             if strict:
                 raise RuntimeError(f"Translation failed: {exc}") from exc
@@ -892,6 +1456,73 @@ class ApplicationsDB:
 
         return result
 
+    def _prefetch_translations(self, parts: list[str]) -> None:
+        """Translate the uncached chunks of ``parts`` in batched API requests.
+
+        Accepted results land in the translation cache, so the per-chunk pass
+        afterwards only sends what a batch failed to translate, with the usual
+        provider fallback.
+        """
+        if self.translate_provider == "google_api":
+            if not self.google_translate_api_key:
+                return
+            translate_batch = self._translate_chunks_google_api
+        else:
+            if self.google_translate_blocked:
+                return
+            translate_batch = self._translate_chunks_google_unofficial
+        cores: dict[str, str] = {}
+        for part in parts:
+            if not part or _RE_PARAGRAPH_BREAK_ONLY.fullmatch(part):
+                continue
+            prepared = self._prepare_fragment(part)
+            if prepared is None:
+                continue
+            for chunk in self._split_chunks(prepared[1]):
+                core = self._split_chunk_core(chunk)[1]
+                if not core.strip():
+                    continue
+                key = hashlib.sha256(core.encode("utf-8")).hexdigest()
+                if key not in self.translation_cache:
+                    cores.setdefault(key, core)
+        if len(cores) < 2:
+            # A lone chunk gains nothing from batching.
+            return
+
+        batches: list[list[tuple[str, str]]] = []
+        batch_chars = 0
+        for key, core in cores.items():
+            if batches and len(batches[-1]) < _TRANSLATE_BATCH_SIZE and batch_chars + len(core) <= _TRANSLATE_BATCH_CHARS:
+                batches[-1].append((key, core))
+                batch_chars += len(core)
+            else:
+                batches.append([(key, core)])
+                batch_chars = len(core)
+
+        def send(batch: list[tuple[str, str]]) -> Optional[list[str]]:
+            try:
+                return translate_batch([core for _, core in batch])
+            except Exception:
+                return None
+
+        if len(batches) == 1:
+            results: Iterable[Optional[list[str]]] = [send(batches[0])]
+        else:
+            # Batches are independent round trips; the small pool also caps
+            # how many requests hit the provider at once.
+            with ThreadPoolExecutor(
+                max_workers=min(_TRANSLATE_WORKERS, len(batches)), thread_name_prefix="translate"
+            ) as pool:
+                results = list(pool.map(send, batches))
+        for batch, translated in zip(batches, results):
+            if translated is None:
+                continue
+            for (key, core), candidate in zip(batch, translated):
+                if self._translation_looks_successful(core, candidate):
+                    self.translation_cache[key] = candidate
+                    with self._cache_lock:
+                        self._pending_translations.append((key, candidate))
+
     def translate_to_russian(self, text: str, strict: bool = False) -> str:
         if not text or not TRANSLATE_TO_RU:
             return text
@@ -902,12 +1533,13 @@ class ApplicationsDB:
             return text
 
         # Preserve original paragraph boundaries and empty lines.
-        parts = re.split(r"(\n\s*\n+)", text)
+        parts = _RE_PARAGRAPH_BREAK.split(text)
+        self._prefetch_translations(parts)
         translated_parts: list[str] = []
         for part in parts:
             if not part:
                 continue
-            if re.fullmatch(r"\n\s*\n+", part):
+            if _RE_PARAGRAPH_BREAK_ONLY.fullmatch(part):
                 translated_parts.append(part)
                 continue
             translated_parts.append(self._translate_fragment_to_russian(part, strict=strict))
@@ -926,7 +1558,7 @@ class ApplicationsDB:
         job_id = extract_job_id(link_url)
         if not job_id:
             lower = link_url.lower()
-            if re.search(r"/(?:comm/)?company/[^/]+/jobs/?(?:$|\?)", lower):
+            if _RE_COMPANY_JOBS_LINK.search(lower):
                 result = (
                     fallback_company,
                     fallback_role,
@@ -945,40 +1577,73 @@ class ApplicationsDB:
             self.job_cache[link_url] = result
             return result
 
+        about = self.posting_cache.get(job_id) or self._prefetched_about.get(job_id)
+        if about is None:
+            about, cacheable = self._fetch_job_about(job_id)
+            if cacheable:
+                self._remember_posting(job_id, about)
+        result = (fallback_company, fallback_role, fallback_location, about)
+        self.job_cache[link_url] = result
+        return result
+
+    @staticmethod
+    def _fetch_job_about(job_id: str) -> tuple[str, bool]:
+        """Download a job posting; return its About-the-job text and whether it parsed.
+
+        On failure the text is a note for the user and should not be cached.
+        Touches neither the database nor shared caches, so it is safe to run
+        from worker threads.
+        """
         api_url = f"https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
-        req = urllib.request.Request(api_url, headers={"User-Agent": "Mozilla/5.0"})
         try:
-            with urllib.request.urlopen(req, timeout=30) as response:
-                raw = response.read().decode("utf-8", errors="ignore")
+            raw = _http_get(api_url, timeout=30, until=_RE_ABOUT_JOB_MARKUP_END).decode("utf-8", errors="ignore")
         except Exception as exc:  # pragma: no cover - network dependent
-            result = (fallback_company, fallback_role, fallback_location, f"Failed to load About the job: {exc}")
-            self.job_cache[link_url] = result
-            return result
-
-        role = fallback_role
-        company = fallback_company
-        location = fallback_location
-        about = "About the job section not found."
+            return f"Failed to load About the job: {exc}", False
 
-        about_match = re.search(r'(?is)<div class="show-more-less-html__markup[^>]*>(.*?)</div>', raw)
-        if about_match:
+        about_match = _RE_ABOUT_JOB_MARKUP.search(raw)
+        # A blank block would strip to "" anyway; skip the regex passes.
+        if about_match and not about_match.group(1).isspace():
             parsed_about = strip_html_to_text(about_match.group(1))
             if parsed_about:
-                about = parsed_about
-
-        result = (company, role, location, about)
-        self.job_cache[link_url] = result
-        return result
+                return parsed_about, True
+        return "About the job section not found.", False
+
+    def _remember_posting(self, job_id: str, about: str) -> None:
+        self.posting_cache[job_id] = about
+        with self._cache_lock:
+            self._pending_postings.append((job_id, about))
+
+    def _prefetch_job_postings(
+        self, records: Iterable[tuple[str, str, str, str, str, str]], known: Collection[str]
+    ) -> None:
+        """Download the postings that syncing ``records`` will insert, in parallel.
+
+        Only new records fetch a posting, so links whose record already exists
+        are skipped, as are postings already in ``posting_cache``. Results wait
+        in the caches for parse_from_job_link, which keeps its sequential
+        job_cache behaviour.
+        """
+        job_ids: set[str] = set()
+        for _stored_link, _role, _company, _location, key_link_url, record_key in records:
+            if record_key in known or not key_link_url or key_link_url in self.job_cache:
+                continue
+            job_id = extract_job_id(key_link_url)
+            if job_id and job_id not in self.posting_cache and job_id not in self._prefetched_about:
+                job_ids.add(job_id)
+        if not job_ids:
+            return
+        ordered = sorted(job_ids)
+        with ThreadPoolExecutor(max_workers=_JOB_FETCH_WORKERS, thread_name_prefix="job-fetch") as pool:
+            for job_id, (about, cacheable) in zip(ordered, pool.map(self._fetch_job_about, ordered)):
+                if cacheable:
+                    self._remember_posting(job_id, about)
+                else:
+                    self._prefetched_about[job_id] = about
 
-    def upsert_from_file(self, path: Path) -> set[str]:
-        text = path.read_text(encoding="utf-8", errors="ignore")
-        date_match = path.name.split("_", 1)[0]
-        email_date = date_match if len(date_match) == 10 and date_match.count("-") == 2 else ""
-        subject = extract_subject(text)
+    def _link_records(self, path: Path, text: str, links: list[str]) -> list[tuple[str, str, str, str, str, str]]:
+        """Return ``(stored_link, role, company, location, key_link_url, record_key)`` per offer in ``text``."""
         company_fallback = extract_company(text, path.name) or "Unknown"
-        links = self.extract_job_links(text)
         offers_from_blocks = self.extract_offers_from_email(text)
-        status = self.infer_status(text, links)
         records: list[tuple[str, str]] = []
         if links:
             for link in links:
@@ -987,8 +1652,7 @@ class ApplicationsDB:
         else:
             records.append(("", ""))
 
-        touched_keys: set[str] = set()
-        cur = self.conn.cursor()
+        result: list[tuple[str, str, str, str, str, str]] = []
         for raw_link_url, canonical_link in records:
             if canonical_link and canonical_link in offers_from_blocks:
                 role_text, company_text, location_text = offers_from_blocks[canonical_link]
@@ -996,21 +1660,73 @@ class ApplicationsDB:
                 role_text, company_text, location_text = self.extract_company_role_location_for_link(
                     text, canonical_link, company_fallback, raw_link_url=raw_link_url
                 )
-            stored_link_url = raw_link_url or canonical_link
             key_link_url = canonical_link or raw_link_url
             if key_link_url:
                 record_key = self.record_key_for_offer(company_text, role_text, location_text, key_link_url)
             else:
                 record_key = f"{str(path)}::0::no-link"
-            cur.execute(
-                "SELECT manual_status, about_job_text_en, about_job_text_ru, about_job_text FROM applications WHERE record_key = ?",
-                (record_key,),
-            )
-            row = cur.fetchone()
+            result.append((raw_link_url or canonical_link, role_text, company_text, location_text, key_link_url, record_key))
+        return result
+
+    def _existing_records(self, record_keys: Optional[set[str]] = None) -> dict[str, tuple[Optional[str], str, str, str]]:
+        """Map record_key to ``(manual_status, about_en, about_ru, about_legacy)``.
+
+        Without ``record_keys`` every row is loaded; otherwise the keys are
+        looked up in IN-lists of _EXISTING_LOOKUP_CHUNK.
+        """
+        select = "SELECT record_key, manual_status, about_job_text_en, about_job_text_ru, about_job_text FROM applications"
+        if record_keys is None:
+            rows = self.conn.execute(select).fetchall()
+        else:
+            keys = sorted(record_keys)
+            rows = []
+            for start in range(0, len(keys), _EXISTING_LOOKUP_CHUNK):
+                chunk = keys[start:start + _EXISTING_LOOKUP_CHUNK]
+                placeholders = ", ".join("?" * len(chunk))
+                rows.extend(self.conn.execute(f"{select} WHERE record_key IN ({placeholders})", chunk))
+        return {
+            str(row[0]): (str(row[1]) if row[1] else None, str(row[2] or ""), str(row[3] or ""), str(row[4] or ""))
+            for row in rows
+        }
+
+    def upsert_from_file(self, path: Path) -> set[str]:
+        text = _read_text_fast(path)
+        links = self.extract_job_links(text)
+        records = self._link_records(path, text, links)
+        existing = self._existing_records({record[5] for record in records})
+        inserts: list[tuple] = []
+        updates: list[tuple] = []
+        status = self.infer_status(text, links)
+        touched_keys = self._stage_upserts(path, text, status, records, existing, inserts, updates)
+        self._write_upserts(inserts, updates)
+        return touched_keys
+
+    def _stage_upserts(
+        self,
+        path: Path,
+        text: str,
+        status: str,
+        records: list[tuple[str, str, str, str, str, str]],
+        existing: dict[str, tuple[Optional[str], str, str, str]],
+        inserts: list[tuple],
+        updates: list[tuple],
+    ) -> set[str]:
+        """Queue the INSERT/UPDATE parameters for one email's records.
+
+        ``existing`` stands in for the rows a per-record SELECT would see and is
+        updated with every queued write, so later emails in the same sync see
+        earlier ones exactly as if each write had already run.
+        """
+        date_match = path.name.split("_", 1)[0]
+        email_date = date_match if len(date_match) == 10 and date_match.count("-") == 2 else ""
+        subject = extract_subject(text)
+        body = _pack_body(text)
+
+        touched_keys: set[str] = set()
+        for stored_link_url, role_text, company_text, location_text, key_link_url, record_key in records:
+            row = existing.get(record_key)
             if row is not None:
-                existing_about_en = str(row[1] or "")
-                existing_about_ru = str(row[2] or "")
-                legacy_about = str(row[3] or "")
+                existing_manual_status, existing_about_en, existing_about_ru, legacy_about = row
                 if not existing_about_en and not existing_about_ru and legacy_about:
                     if self._looks_russian(legacy_about):
                         existing_about_ru = legacy_about
@@ -1024,19 +1740,10 @@ class ApplicationsDB:
                 about_legacy = about_ru or about_en or legacy_about
 
                 # Existing record: refresh data from new source file while preserving manual/pinned status.
-                existing_manual_status = str(row[0]) if row[0] else None
                 pinned_status = self.get_pinned_status(record_key)
                 manual_status = existing_manual_status or pinned_status
                 current_status = manual_status or status
-                cur.execute(
-                    """
-                    UPDATE applications
-                    SET source_file = ?, file_name = ?, email_date = ?, subject = ?,
-                        company = ?, role = ?, location = ?, link_url = ?, about_job_text = ?, about_job_text_en = ?, about_job_text_ru = ?,
-                        auto_status = ?, manual_status = ?, current_status = ?, body = ?,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE record_key = ?
-                    """,
+                updates.append(
                     (
                         str(path),
                         path.name,
@@ -1052,10 +1759,11 @@ class ApplicationsDB:
                         status,
                         manual_status,
                         current_status,
-                        text,
+                        body,
                         record_key,
-                    ),
+                    )
                 )
+                existing[record_key] = (manual_status, about_en, about_ru, about_legacy)
                 touched_keys.add(record_key)
                 continue
 
@@ -1068,31 +1776,7 @@ class ApplicationsDB:
             pinned_status = self.get_pinned_status(record_key)
             manual_status = pinned_status
             current_status = manual_status or status
-
-            cur.execute(
-                """
-                INSERT INTO applications(
-                    record_key, source_file, file_name, email_date, subject, company, role, location, link_url, about_job_text,
-                    about_job_text_en, about_job_text_ru,
-                    auto_status, manual_status, current_status, body, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                ON CONFLICT(record_key) DO UPDATE SET
-                    source_file = excluded.source_file,
-                    file_name = excluded.file_name,
-                    email_date = excluded.email_date,
-                    subject = excluded.subject,
-                    company = excluded.company,
-                    role = excluded.role,
-                    location = excluded.location,
-                    link_url = excluded.link_url,
-                    about_job_text = excluded.about_job_text,
-                    about_job_text_en = excluded.about_job_text_en,
-                    about_job_text_ru = excluded.about_job_text_ru,
-                    auto_status = excluded.auto_status,
-                    current_status = COALESCE(applications.manual_status, excluded.auto_status),
-                    body = excluded.body,
-                    updated_at = CURRENT_TIMESTAMP
-                """,
+            inserts.append(
                 (
                     record_key,
                     str(path),
@@ -1109,12 +1793,22 @@ class ApplicationsDB:
                     status,
                     manual_status,
                     current_status,
-                    text,
-                ),
+                    body,
+                )
             )
+            existing[record_key] = (manual_status, about_en, about_ru, about_legacy)
             touched_keys.add(record_key)
         return touched_keys
 
+    def _write_upserts(self, inserts: list[tuple], updates: list[tuple]) -> None:
+        # A key is inserted at most once and only before any update of it, so
+        # running every insert first keeps each row's write order (and the
+        # id assignment order) of the per-record statements.
+        if inserts:
+            self.conn.executemany(_INSERT_APPLICATION_SQL, inserts)
+        if updates:
+            self.conn.executemany(_UPDATE_APPLICATION_SQL, updates)
+
     def translate_existing_about_job_texts(self) -> tuple[int, int]:
         cur = self.conn.cursor()
         cur.execute(
@@ -1150,6 +1844,7 @@ class ApplicationsDB:
                     (translated, translated, int(app_id)),
                 )
                 updated += 1
+        self._flush_caches()
         self.conn.commit()
         return checked, updated
 
@@ -1157,97 +1852,161 @@ class ApplicationsDB:
         if not source_dir.exists() or not source_dir.is_dir():
             raise NotADirectoryError(str(source_dir))
 
-        files = sorted(source_dir.glob("*.txt"))
-
-        def file_priority(path: Path) -> tuple[int, str]:
-            try:
-                text = path.read_text(encoding="utf-8", errors="ignore")
-            except Exception:
-                return (99, path.name.lower())
-            links = self.extract_job_links(text)
-            status = self.infer_status(text, links)
-            priority_order = {
-                "incoming": 0,
-                "applied": 1,
-                "rejected": 2,
-                "interview": 3,
-                "manual_sort": 4,
-            }
-            return (priority_order.get(status, 50), path.name.lower())
-
-        files.sort(key=file_priority)
+        # Each email is read and parsed once; the result serves the sort, the
+        # posting prefetch and the upsert pass. Files whose mtime and size
+        # match the source_files manifest reuse their stored parse; the text
+        # is still read for the body and subject.
+        manifest = {
+            row[0]: row[1:] for row in self.conn.execute(_SELECT_SOURCE_FILES_SQL)
+        }
+        manifest_updates: list[tuple[str, int, int, int, str, str]] = []
+        emails: list[tuple[Path, str, str, list[tuple[str, str, str, str, str, str]]]] = []
+        for path in sorted(source_dir.glob("*.txt")):
+            path = path.resolve()
+            stat = path.stat()
+            text = _read_text_fast(path)
+            cached = manifest.pop(str(path), None)
+            if cached is not None and cached[:3] == (stat.st_mtime_ns, stat.st_size, _SOURCE_PARSE_VERSION):
+                status = cached[3]
+                records = [tuple(record) for record in json.loads(cached[4])]
+            else:
+                links = self.extract_job_links(text)
+                status = self.infer_status(text, links)
+                records = self._link_records(path, text, links)
+                manifest_updates.append(
+                    (str(path), stat.st_mtime_ns, stat.st_size, _SOURCE_PARSE_VERSION, status, json.dumps(records))
+                )
+            emails.append((path, text, status, records))
+
+        priority_order = {
+            "incoming": 0,
+            "applied": 1,
+            "rejected": 2,
+            "interview": 3,
+            "manual_sort": 4,
+        }
+        emails.sort(key=lambda email: (priority_order.get(email[2], 50), email[0].name.lower()))
+        existing = self._existing_records()
+        self._prefetch_job_postings(itertools.chain.from_iterable(email[3] for email in emails), existing.keys())
         fresh_keys: set[str] = set()
+        inserts: list[tuple] = []
+        updates: list[tuple] = []
 
-        for path in files:
-            fresh_keys |= self.upsert_from_file(path.resolve())
+        for path, text, status, records in emails:
+            fresh_keys |= self._stage_upserts(path, text, status, records, existing, inserts, updates)
+        self._prefetched_about.clear()
+        self._write_upserts(inserts, updates)
 
         cur = self.conn.cursor()
-        cur.execute("SELECT record_key FROM applications")
-        known = {str(row[0]) for row in cur.fetchall()}
-        to_delete = known - fresh_keys
+        # Staging only adds keys that are also fresh, so this is exactly the
+        # stored keys this sync did not see.
+        to_delete = existing.keys() - fresh_keys
         if to_delete:
             cur.executemany("DELETE FROM applications WHERE record_key = ?", [(k,) for k in to_delete])
+        # What is left in the manifest are files this sync no longer saw.
+        if manifest:
+            cur.executemany("DELETE FROM source_files WHERE path = ?", [(path,) for path in manifest])
+        if manifest_updates:
+            cur.executemany(_UPSERT_SOURCE_FILE_SQL, manifest_updates)
 
+        self._flush_caches()
         self.conn.commit()
-        return len(files), len(to_delete)
+        return len(emails), len(to_delete)
 
     def get_status_counts(self) -> dict[str, int]:
         counts = {k: 0 for k in STATUS_ORDER}
-        cur = self.conn.cursor()
+        cur = self.read_conn.cursor()
         cur.execute("SELECT current_status, COUNT(*) FROM applications GROUP BY current_status")
         for status, n in cur.fetchall():
             if status in counts:
                 counts[status] = int(n)
         return counts
 
+    @staticmethod
+    def _application_row(r: tuple) -> ApplicationRow:
+        return ApplicationRow(
+            id=int(r[0]),
+            source_file=str(r[1]),
+            file_name=str(r[2]),
+            email_date=str(r[3] or ""),
+            subject=str(r[4] or ""),
+            company=str(r[5] or "Unknown"),
+            role=str(r[6] or ""),
+            location=str(r[8] or ""),
+            link_url=str(r[7] or ""),
+            auto_status=str(r[9]),
+            manual_status=str(r[10]) if r[10] else None,
+            current_status=str(r[11]),
+            body=_unpack_body(r[12]),
+            about_job_text=str(r[13] or ""),
+            about_job_text_en=str(r[14] or ""),
+            about_job_text_ru=str(r[15] or ""),
+        )
+
     def get_by_status(self, status: str) -> list[ApplicationRow]:
-        cur = self.conn.cursor()
+        cur = self.read_conn.cursor()
         cur.execute(
-            """
-            SELECT id, source_file, file_name, email_date, subject, company, role, link_url,
-                   location, auto_status, manual_status, current_status, body,
-                   COALESCE(NULLIF(about_job_text_ru, ''), NULLIF(about_job_text, ''), NULLIF(about_job_text_en, '')) AS about_job_text,
-                   COALESCE(NULLIF(about_job_text_en, ''), NULLIF(about_job_text, '')) AS about_job_text_en,
-                   COALESCE(NULLIF(about_job_text_ru, ''), NULLIF(about_job_text, '')) AS about_job_text_ru
+            f"""
+            SELECT {_APPLICATION_ROW_COLUMNS}
             FROM applications
             WHERE current_status = ?
             ORDER BY company COLLATE NOCASE, email_date DESC, file_name COLLATE NOCASE
             """,
             (status,),
         )
-        rows = []
-        for r in cur.fetchall():
-            rows.append(
-                ApplicationRow(
-                    id=int(r[0]),
-                    source_file=str(r[1]),
-                    file_name=str(r[2]),
-                    email_date=str(r[3] or ""),
-                    subject=str(r[4] or ""),
-                    company=str(r[5] or "Unknown"),
-                    role=str(r[6] or ""),
-                    location=str(r[8] or ""),
-                    link_url=str(r[7] or ""),
-                    auto_status=str(r[9]),
-                    manual_status=str(r[10]) if r[10] else None,
-                    current_status=str(r[11]),
-                    body=str(r[12]),
-                    about_job_text=str(r[13] or ""),
-                    about_job_text_en=str(r[14] or ""),
-                    about_job_text_ru=str(r[15] or ""),
-                )
-            )
-        return rows
+        return [self._application_row(r) for r in cur.fetchall()]
 
-    def get_by_id(self, app_id: int) -> Optional[ApplicationRow]:
-        cur = self.conn.cursor()
+    @staticmethod
+    def _tree_row(r: tuple) -> TreeRow:
+        return TreeRow(
+            id=int(r[0]),
+            company=str(r[1] or "Unknown"),
+            role=str(r[2] or ""),
+            location=str(r[3] or ""),
+            subject=str(r[4] or ""),
+            file_name=str(r[5]),
+            auto_status=str(r[6]),
+            current_status=str(r[7]),
+        )
+
+    def get_tree_rows(self, status: str) -> list[TreeRow]:
+        """Like ``get_by_status`` but without bodies and descriptions."""
+        cur = self.read_conn.cursor()
+        cur.execute(
+            f"""
+            SELECT {_TREE_ROW_COLUMNS}
+            FROM applications
+            WHERE current_status = ?
+            ORDER BY company COLLATE NOCASE, email_date DESC, file_name COLLATE NOCASE
+            """,
+            (status,),
+        )
+        return [self._tree_row(r) for r in cur.fetchall()]
+
+    def get_tree_rows_grouped(self) -> dict[str, list[TreeRow]]:
+        """Return ``get_tree_rows(status)`` for every status from a single query."""
+        grouped: dict[str, list[TreeRow]] = {status: [] for status in STATUS_ORDER}
+        cur = self.read_conn.cursor()
+        # Same order as get_tree_rows within each status, so one walk of
+        # idx_applications_tree serves every group.
         cur.execute(
+            f"""
+            SELECT {_TREE_ROW_COLUMNS}
+            FROM applications
+            ORDER BY current_status, company COLLATE NOCASE, email_date DESC, file_name COLLATE NOCASE
             """
-            SELECT id, source_file, file_name, email_date, subject, company, role, link_url,
-                   location, auto_status, manual_status, current_status, body,
-                   COALESCE(NULLIF(about_job_text_ru, ''), NULLIF(about_job_text, ''), NULLIF(about_job_text_en, '')) AS about_job_text,
-                   COALESCE(NULLIF(about_job_text_en, ''), NULLIF(about_job_text, '')) AS about_job_text_en,
-                   COALESCE(NULLIF(about_job_text_ru, ''), NULLIF(about_job_text, '')) AS about_job_text_ru
+        )
+        for r in cur:
+            rows = grouped.get(r[7])
+            if rows is not None:
+                rows.append(self._tree_row(r))
+        return grouped
+
+    def get_by_id(self, app_id: int) -> Optional[ApplicationRow]:
+        cur = self.read_conn.cursor()
+        cur.execute(
+            f"""
+            SELECT {_APPLICATION_ROW_COLUMNS}
             FROM applications
             WHERE id = ?
             """,
@@ -1256,26 +2015,13 @@ class ApplicationsDB:
         r = cur.fetchone()
         if not r:
             return None
-        return ApplicationRow(
-            id=int(r[0]),
-            source_file=str(r[1]),
-            file_name=str(r[2]),
-            email_date=str(r[3] or ""),
-            subject=str(r[4] or ""),
-            company=str(r[5] or "Unknown"),
-            role=str(r[6] or ""),
-            location=str(r[8] or ""),
-            link_url=str(r[7] or ""),
-            auto_status=str(r[9]),
-            manual_status=str(r[10]) if r[10] else None,
-            current_status=str(r[11]),
-            body=str(r[12]),
-            about_job_text=str(r[13] or ""),
-            about_job_text_en=str(r[14] or ""),
-            about_job_text_ru=str(r[15] or ""),
-        )
+        return self._application_row(r)
 
     def ensure_about_job_text(self, app_id: int) -> str:
+        source = self.load_about_job_source(app_id)
+        return self.store_about_job(app_id, source, self.fetch_about_job(source))
+
+    def load_about_job_source(self, app_id: int) -> AboutJobSource:
         cur = self.conn.cursor()
         cur.execute(
             """
@@ -1291,10 +2037,6 @@ class ApplicationsDB:
         if not row:
             raise ValueError("Application not found")
 
-        link_url = str(row[0] or "")
-        company = str(row[1] or "Unknown")
-        role = str(row[2] or "")
-        location = str(row[3] or "")
         existing_en = str(row[4] or "")
         existing_ru = str(row[5] or "")
         legacy = str(row[6] or "")
@@ -1302,23 +2044,47 @@ class ApplicationsDB:
             existing_en = legacy
         if not existing_ru and legacy and self._looks_russian(legacy):
             existing_ru = legacy
+        return AboutJobSource(
+            link_url=str(row[0] or ""),
+            company=str(row[1] or "Unknown"),
+            role=str(row[2] or ""),
+            location=str(row[3] or ""),
+            about_en=existing_en,
+            about_ru=existing_ru,
+        )
+
+    def fetch_about_job(self, source: AboutJobSource) -> tuple[str, str, str, str, str]:
+        """Network half of ensure_about_job_text; touches no SQLite state.
+
+        Returns (company, role, location, about_en, about_ru). Safe to run on a
+        worker thread so the GUI stays responsive during HTTP round-trips.
+        """
+        if source.about_en:
+            translated = source.about_ru or self.translate_to_russian(source.about_en)
+            return source.company, source.role, source.location, source.about_en, translated
+        company, role, location, about_en = self.parse_from_job_link(
+            source.link_url, source.company, source.role, source.location
+        )
+        about_ru = self.translate_to_russian(about_en) if about_en else ""
+        return company, role, location, about_en, about_ru
 
-        if existing_en:
-            translated = existing_ru or self.translate_to_russian(existing_en)
-            if translated and translated != existing_ru:
+    def store_about_job(self, app_id: int, source: AboutJobSource, fetched: tuple[str, str, str, str, str]) -> str:
+        company, role, location, about_en, about_ru = fetched
+        self._flush_caches()
+        cur = self.conn.cursor()
+        if source.about_en:
+            if about_ru and about_ru != source.about_ru:
                 cur.execute(
                     """
                     UPDATE applications
                     SET about_job_text_en = ?, about_job_text_ru = ?, about_job_text = ?, updated_at = CURRENT_TIMESTAMP
                     WHERE id = ?
                     """,
-                    (existing_en, translated, translated or existing_en, app_id),
+                    (about_en, about_ru, about_ru or about_en, app_id),
                 )
-                self.conn.commit()
-            return translated or existing_en
+            self.conn.commit()
+            return about_ru or about_en
 
-        parsed_company, parsed_role, parsed_location, about_en = self.parse_from_job_link(link_url, company, role, location)
-        about_ru = self.translate_to_russian(about_en) if about_en else ""
         display_about = about_ru or about_en
         cur.execute(
             """
@@ -1326,34 +2092,172 @@ class ApplicationsDB:
             SET company = ?, role = ?, location = ?, about_job_text_en = ?, about_job_text_ru = ?, about_job_text = ?, updated_at = CURRENT_TIMESTAMP
             WHERE id = ?
             """,
-            (parsed_company, parsed_role, parsed_location, about_en, about_ru, display_about, app_id),
+            (company, role, location, about_en, about_ru, display_about, app_id),
         )
         self.conn.commit()
         return display_about
 
     def set_manual_status(self, app_id: int, status: Optional[str]) -> None:
-        cur = self.conn.cursor()
-        if status is not None and status not in STATUS_ORDER:
-            raise ValueError(f"Invalid status: {status}")
-
-        cur.execute("SELECT record_key, auto_status FROM applications WHERE id = ?", (app_id,))
-        row = cur.fetchone()
-        if not row:
+        if not self.set_manual_status_many([app_id], status):
             raise ValueError("Application not found")
 
-        record_key = str(row[0])
-        auto_status = str(row[1])
-        current_status = status or auto_status
-        cur.execute(
+    def set_manual_status_many(self, app_ids: Collection[int], status: Optional[str]) -> int:
+        """Set (or, with ``None``, clear) the manual status of several applications.
+
+        All rows and their status pins are written in one transaction. Unknown
+        ids are skipped; returns the number of applications updated.
+        """
+        if status is not None and status not in _STATUS_SET:
+            raise ValueError(f"Invalid status: {status}")
+
+        ids = sorted(set(app_ids))
+        rows: list[tuple] = []
+        for start in range(0, len(ids), _EXISTING_LOOKUP_CHUNK):
+            chunk = ids[start:start + _EXISTING_LOOKUP_CHUNK]
+            placeholders = ", ".join("?" * len(chunk))
+            rows.extend(
+                self.conn.execute(
+                    f"SELECT id, record_key, auto_status FROM applications WHERE id IN ({placeholders})", chunk
+                )
+            )
+        updates = [(status, status or str(auto_status), int(app_id)) for app_id, _record_key, auto_status in rows]
+        self.conn.executemany(
             """
             UPDATE applications
             SET manual_status = ?, current_status = ?, updated_at = CURRENT_TIMESTAMP
             WHERE id = ?
             """,
-            (status, current_status, app_id),
+            updates,
         )
-        self.set_pinned_status(record_key, current_status if current_status != "incoming" else None)
+        for (_app_id, record_key, _auto_status), (_status, current_status, _id) in zip(rows, updates):
+            self.set_pinned_status(str(record_key), current_status if current_status != "incoming" else None)
         self.conn.commit()
+        return len(updates)
+
+
+class AboutJobLoader(QObject):
+    """Delivers worker-thread About-the-job fetches back to the GUI thread."""
+
+    loaded = Signal(int, object, object)
+
+
+class DriveSyncLoader(QObject):
+    """Delivers the worker-thread rclone copy back to the GUI thread."""
+
+    finished = Signal(object, object)
+
+
+class ApplicationsTreeModel(QAbstractItemModel):
+    """Status groups with their applications, for the tree view.
+
+    A group index has internal id 0 and an application index the row of its
+    group plus one, which is all ``parent()`` needs.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._groups: list[tuple[str, list[TreeRow]]] = []
+        self._counts: dict[str, int] = {}
+        # app id -> (group row, row within group)
+        self._positions: dict[int, tuple[int, int]] = {}
+
+    def set_groups(self, groups: list[tuple[str, list[TreeRow]]], counts: dict[str, int]) -> None:
+        self.beginResetModel()
+        self._groups = groups
+        self._counts = counts
+        self._index_positions()
+        self.endResetModel()
+
+    def update_groups(self, rows_by_status: dict[str, list[TreeRow]], counts: dict[str, int]) -> None:
+        """Swap in fresh rows for some groups, keeping selection and expansion."""
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        old_keys = [self._persistent_key(index) for index in old_indexes]
+        self._groups = [(status, rows_by_status.get(status, apps)) for status, apps in self._groups]
+        self._counts = counts
+        self._index_positions()
+        self.changePersistentIndexList(old_indexes, [self._index_for_key(key) for key in old_keys])
+        self.layoutChanged.emit()
+
+    def _index_positions(self) -> None:
+        self._positions = {
+            app.id: (group_row, row)
+            for group_row, (_status, apps) in enumerate(self._groups)
+            for row, app in enumerate(apps)
+        }
+
+    def _persistent_key(self, index: QModelIndex) -> tuple[str, int]:
+        group_id = index.internalId()
+        if group_id == 0:
+            return "group", index.row()
+        return "app", self._groups[group_id - 1][1][index.row()].id
+
+    def _index_for_key(self, key: tuple[str, int]) -> QModelIndex:
+        kind, value = key
+        if kind == "group":
+            return self.createIndex(value, 0, 0)
+        return self.index_for_app(value)
+
+    def app(self, app_id: int) -> Optional[TreeRow]:
+        position = self._positions.get(app_id)
+        if position is None:
+            return None
+        return self._groups[position[0]][1][position[1]]
+
+    def index_for_app(self, app_id: int) -> QModelIndex:
+        position = self._positions.get(app_id)
+        if position is None:
+            return QModelIndex()
+        return self.createIndex(position[1], 0, position[0] + 1)
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+        return self.createIndex(row, column, parent.row() + 1)
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:  # type: ignore[override]
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self._groups)
+        if parent.internalId() == 0:
+            return len(self._groups[parent.row()][1])
+        return 0
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> object:
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return "Applications"
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> object:
+        if not index.isValid():
+            return None
+        group_id = index.internalId()
+        if group_id == 0:
+            status = self._groups[index.row()][0]
+            if role == Qt.DisplayRole:
+                return f"{STATUS_TITLE[status]} ({self._counts[status]})"
+            if role == Qt.UserRole:
+                return ("group", status)
+            return None
+
+        app = self._groups[group_id - 1][1][index.row()]
+        if role == Qt.DisplayRole:
+            # company is never empty (TreeRow falls back to "Unknown").
+            return " | ".join(part for part in (app.company, app.role, app.location) if part)
+        if role == Qt.ToolTipRole:
+            return app.subject or app.file_name
+        if role == Qt.UserRole:
+            return ("app", app.id)
+        return None
 
 
 class MainWindow(QMainWindow):
@@ -1362,6 +2266,14 @@ class MainWindow(QMainWindow):
         self.db = db
         self.source_dir = source_dir
         self.selected_app_id: Optional[int] = None
+        # HTTP fetch + translation run here; SQLite reads/writes stay on the GUI thread.
+        self.about_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="about-job")
+        self.about_loader = AboutJobLoader()
+        self.about_loader.loaded.connect(self.on_about_job_loaded)
+        # rclone runs here so the window stays responsive during the copy.
+        self.drive_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="drive-sync")
+        self.drive_loader = DriveSyncLoader()
+        self.drive_loader.finished.connect(self.on_drive_copy_finished)
 
         self.setWindowTitle("LinkInJob")
         self.resize(1280, 800)
@@ -1383,9 +2295,9 @@ class MainWindow(QMainWindow):
         sync_btn.triggered.connect(self.sync_source)
         toolbar.addAction(sync_btn)
 
-        sync_drive_btn = QAction("Sync Drive + Sync DB", self)
-        sync_drive_btn.triggered.connect(self.sync_drive_and_source)
-        toolbar.addAction(sync_drive_btn)
+        self.sync_drive_btn = QAction("Sync Drive + Sync DB", self)
+        self.sync_drive_btn.triggered.connect(self.sync_drive_and_source)
+        toolbar.addAction(self.sync_drive_btn)
 
         reload_btn = QAction("Reload", self)
         reload_btn.triggered.connect(self.reload_tree)
@@ -1401,13 +2313,17 @@ class MainWindow(QMainWindow):
         left_frame = QFrame()
         left_layout = QVBoxLayout(left_frame)
         left_layout.setContentsMargins(0, 0, 0, 0)
-        self.tree = QTreeWidget()
-        self.tree.setHeaderLabels(["Applications"])
+        self.tree_model = ApplicationsTreeModel(self)
+        self.tree = QTreeView()
+        self.tree.setModel(self.tree_model)
+        self.tree.setUniformRowHeights(True)
+        # Ctrl/Shift-click selects several applications for one status change.
+        self.tree.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.tree.header().setStretchLastSection(False)
         self.tree.header().setSectionResizeMode(0, QHeaderView.Interactive)
         self.tree.setColumnWidth(0, 680)
         self.tree.setMinimumWidth(640)
-        self.tree.itemSelectionChanged.connect(self.on_tree_selection)
+        self.tree.selectionModel().selectionChanged.connect(lambda *_: self.on_tree_selection())
         left_layout.addWidget(self.tree)
         left_frame.setMinimumWidth(640)
 
@@ -1514,6 +2430,29 @@ class MainWindow(QMainWindow):
         self.status_bar_label.setText(f"Synced: {scanned} files, removed: {removed}")
         self.reload_tree()
 
+    @staticmethod
+    def _run_rclone_copy(rclone_bin: str, source: Path) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [
+                rclone_bin,
+                "copy",
+                f"{DRIVE_REMOTE}:",
+                str(source),
+                "--drive-root-folder-id",
+                DRIVE_FOLDER_ID,
+                "--create-empty-src-dirs",
+                # One recursive listing instead of a Drive call per folder.
+                "--fast-list",
+                "--transfers",
+                "8",
+                "--checkers",
+                "16",
+            ],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
     def sync_drive_and_source(self) -> None:
         source = Path(self.source_input.text().strip()).expanduser()
         source.mkdir(parents=True, exist_ok=True)
@@ -1527,28 +2466,16 @@ class MainWindow(QMainWindow):
             return
 
         self.status_bar_label.setText("Syncing Google Drive...")
-        QApplication.processEvents()
+        self.sync_drive_btn.setEnabled(False)
+        future = self.drive_executor.submit(self._run_rclone_copy, rclone_bin, source)
+        future.add_done_callback(lambda done: self.drive_loader.finished.emit(source, done))
+
+    def on_drive_copy_finished(self, source: Path, future: Future) -> None:
+        self.sync_drive_btn.setEnabled(True)
         try:
-            result = subprocess.run(
-                [
-                    rclone_bin,
-                    "copy",
-                    f"{DRIVE_REMOTE}:",
-                    str(source),
-                    "--drive-root-folder-id",
-                    DRIVE_FOLDER_ID,
-                    "--create-empty-src-dirs",
-                    "--transfers",
-                    "4",
-                    "--checkers",
-                    "8",
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-        except FileNotFoundError:
-            self.show_error("Drive sync failed", f"Cannot execute rclone binary: {rclone_bin}")
+            result = future.result()
+        except FileNotFoundError as exc:
+            self.show_error("Drive sync failed", f"Cannot execute rclone binary: {exc.filename}")
             return
 
         if result.returncode != 0:
@@ -1556,6 +2483,7 @@ class MainWindow(QMainWindow):
             self.show_error("Drive sync failed", error_text[-4000:])
             return
 
+        # The database is only touched from the GUI thread.
         try:
             self.db.snapshot_non_incoming_statuses()
             scanned, removed = self.db.sync_source_dir(source)
@@ -1586,43 +2514,26 @@ class MainWindow(QMainWindow):
 
     def reload_tree(self) -> None:
         previous_id = self.selected_app_id
-        self.tree.clear()
-        counts = self.db.get_status_counts()
-
-        for status in STATUS_ORDER:
-            section = QTreeWidgetItem([f"{STATUS_TITLE[status]} ({counts[status]})"])
-            section.setData(0, Qt.UserRole, ("group", status))
-            self.tree.addTopLevelItem(section)
-
-            items = self.db.get_by_status(status)
-            for app in items:
-                caption = f"{app.company}"
-                if app.role:
-                    caption = f"{caption} | {app.role}"
-                if app.location:
-                    caption = f"{caption} | {app.location}"
-                child = QTreeWidgetItem([caption])
-                child.setToolTip(0, app.subject or app.file_name)
-                child.setData(0, Qt.UserRole, ("app", app.id))
-                section.addChild(child)
-
-            section.setExpanded(True)
-
-        if previous_id is not None:
-            self.select_app(previous_id)
+        grouped = self.db.get_tree_rows_grouped()
+        groups = [(status, grouped[status]) for status in STATUS_ORDER]
+        counts = {status: len(rows) for status, rows in groups}
+        # Reset, expansion and reselection repaint once, when updates resume.
+        self.tree.setUpdatesEnabled(False)
+        try:
+            self.tree_model.set_groups(groups, counts)
+            self.tree.expandAll()
+            if previous_id is not None:
+                self.select_app(previous_id)
+        finally:
+            self.tree.setUpdatesEnabled(True)
 
     def select_app(self, app_id: int) -> None:
-        root = self.tree.invisibleRootItem()
-        for i in range(root.childCount()):
-            group = root.child(i)
-            for j in range(group.childCount()):
-                child = group.child(j)
-                data = child.data(0, Qt.UserRole)
-                if data and data[0] == "app" and data[1] == app_id:
-                    self.tree.setCurrentItem(child)
-                    return
+        index = self.tree_model.index_for_app(app_id)
+        if index.isValid():
+            self.tree.setCurrentIndex(index)
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def format_date(date_raw: str) -> str:
         try:
             return datetime.strptime(date_raw, "%Y-%m-%d").strftime("%d.%m.%Y")
@@ -1630,11 +2541,11 @@ class MainWindow(QMainWindow):
             return date_raw
 
     def on_tree_selection(self) -> None:
-        item = self.tree.currentItem()
-        if not item:
+        index = self.tree.currentIndex()
+        if not index.isValid():
             return
 
-        data = item.data(0, Qt.UserRole)
+        data = index.data(Qt.UserRole)
         if not data or data[0] != "app":
             self.selected_app_id = None
             self.company_label.setText("-")
@@ -1669,33 +2580,72 @@ class MainWindow(QMainWindow):
         self.file_label.setText(app.file_name)
         self.link_state_label.setText("Available" if app.link_url else "Not found")
         self.open_job_btn.setEnabled(bool(app.link_url))
-        self.about_job_text.setPlainText("Loading About the job...")
-        QApplication.processEvents()
-
-        about_text = app.about_job_text
-        if not about_text:
-            try:
-                about_text = self.db.ensure_about_job_text(app.id)
-            except Exception as exc:
-                about_text = f"Failed to load About the job: {exc}"
-        self.about_job_text.setPlainText(about_text)
+        if app.about_job_text:
+            self.about_job_text.setPlainText(app.about_job_text)
+        else:
+            self.about_job_text.setPlainText("Loading About the job...")
+            self.load_about_job_async(app.id)
 
         mode = "manual" if app.manual_status else "auto"
         self.status_bar_label.setText(f"Selected #{app.id} ({mode})")
 
+    def load_about_job_async(self, app_id: int) -> None:
+        try:
+            source = self.db.load_about_job_source(app_id)
+        except Exception as exc:
+            self.about_job_text.setPlainText(f"Failed to load About the job: {exc}")
+            return
+        future = self.about_executor.submit(self.db.fetch_about_job, source)
+        future.add_done_callback(lambda done: self.about_loader.loaded.emit(app_id, source, done))
+
+    def on_about_job_loaded(self, app_id: int, source: AboutJobSource, future: Future) -> None:
+        try:
+            about_text = self.db.store_about_job(app_id, source, future.result())
+        except Exception as exc:
+            about_text = f"Failed to load About the job: {exc}"
+        if self.selected_app_id == app_id:
+            self.about_job_text.setPlainText(about_text)
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        self.about_executor.shutdown(wait=False, cancel_futures=True)
+        self.drive_executor.shutdown(wait=False, cancel_futures=True)
+        super().closeEvent(event)
+
+    def selected_app_ids(self) -> list[int]:
+        """Ids of every selected application row, in selection order."""
+        ids: list[int] = []
+        for index in self.tree.selectionModel().selectedRows():
+            data = index.data(Qt.UserRole)
+            if data and data[0] == "app":
+                ids.append(int(data[1]))
+        return ids
+
     def set_status(self, status: Optional[str]) -> None:
-        if self.selected_app_id is None:
+        app_ids = self.selected_app_ids()
+        if not app_ids and self.selected_app_id is not None:
+            app_ids = [self.selected_app_id]
+        if not app_ids:
             self.show_error("No selection", "Select an application first.")
             return
+        apps = [self.tree_model.app(app_id) for app_id in app_ids]
         try:
-            self.db.set_manual_status(self.selected_app_id, status)
+            self.db.set_manual_status_many(app_ids, status)
         except Exception as exc:
             self.show_error("Update failed", str(exc))
             return
 
-        self.reload_tree()
+        if any(app is None for app in apps):
+            self.reload_tree()
+            return
+        # Only the groups the rows leave and join change; the model keeps the
+        # selection on the moved rows, so the details are refreshed here.
+        changed = {app.current_status for app in apps} | {status or app.auto_status for app in apps}
+        self.tree_model.update_groups(
+            {group: self.db.get_tree_rows(group) for group in changed}, self.db.get_status_counts()
+        )
         if self.selected_app_id is not None:
-            self.select_app(self.selected_app_id)
+            self.tree.scrollTo(self.tree_model.index_for_app(self.selected_app_id))
+        self.on_tree_selection()
 
     def open_source_file(self) -> None:
         if self.selected_app_id is None:
@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
 import argparse
+import functools
 import html
+import json
+import os
 import re
+import time
 import unicodedata
 import urllib.request
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Pattern, Set, Tuple
 
 
 HOME = Path.home()
@@ -20,7 +26,138 @@ DEFAULT_ARCHIVE_DIR = WORK_ROOT / "LinkedIn" / "Archive"
 DEFAULT_MANUAL_DIR = WORK_ROOT / "Поданные и откланенные заявки" / "System_Administrator"
 DEFAULT_REVIEW_FILE = WORK_ROOT / "LinkedIn" / "Проверить_вручную.md"
 
-
+# Patterns are compiled once; main() applies them to every email.
+_RE_SUBJECT = re.compile(r"^(?:Тема|ТЕМА):\s*(.+)$", re.MULTILINE)
+_COMPANY_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for pattern in (
+        r"Ваша заявка была отправлена в компанию\s+([^\n]+)",
+        r"Ваша заявка на вакансию.+?в компании\s+([^\n]+)",
+        r"Ваша заявка была просмотрена в компании\s+([^\n]+)",
+        r"your application was sent to\s+([^\n!]+)",
+        r"Your application was viewed by\s+([^\n]+)",
+        r"Thank you for applying to\s+([^\n!]+)",
+        r"Thanks for applying to\s+([^\n!]+)",
+        r"Wow\s*-\s*thanks for applying to\s+([^\n!]+)",
+        r"Thank you for applying for.+?\sat\s+([^\n\.,!]+)",
+        r"Thanks for applying for.+?\sat\s+([^\n\.,!]+)",
+        r"Application to\s+([^\n\)]+)",
+        r"position at\s*([A-Za-z][A-Za-z0-9& .\-]{1,60})",
+        r"Your application at\s+([^\n]+)",
+    )
+]
+_RE_FILENAME_TIMESTAMP = re.compile(r"^\d{4}-\d{2}-\d{2}_\d{2}-\d{2}\s+-\s+")
+# classify() markers, matched as plain substrings of the lowercased email.
+# A marker containing another one is left out (e.g. "wow - thanks for
+# applying"): any() already matches it through the shorter marker.
+_NOISE_MARKERS = (
+    "оповещение о вакансиях linkedin",
+    "новая вакансия, соответствующая вашим предпочтениям",
+    "new jobs similar to",
+    "your full linkedin data archive is ready",
+    " and more",
+)
+_REJECTION_MARKERS = (
+    "application_rejected",
+    "move forward with other candidates",
+    "решили двигаться дальше",
+    "отклон",
+    "отказ",
+)
+_APPLICATION_MARKERS = (
+    "ваша заявка была отправлена в компанию",
+    "ваша заявка на вакансию",
+    "ваша заявка была просмотрена в компании",
+    "thank you for applying",
+    "thanks for applying",
+    "your application at",
+    "your application was viewed by",
+    "application to ",
+    "application has been received",
+    "your application was sent to",
+    "we now know that you’d like to join our team",
+    "we now know that you'd like to join our team",
+)
+# is_vacancy_digest() markers ("new jobs similar to" is covered by
+# "jobs similar to").
+_DIGEST_MARKERS = (
+    "linkedin job alerts",
+    "оповещения о вакансиях linkedin",
+    "your job alert for",
+    "ваше оповещение о вакансиях",
+    "jobs similar to",
+    "hired roles near you",
+    "apply now to",
+)
+_NON_JOB_NOISE_MARKERS = (
+    "your full linkedin data archive is ready",
+    "share their thoughts on linkedin",
+)
+# Every interview pattern contains one of these, so emails without them
+# skip the regexes.
+_INTERVIEW_KEYWORDS = ("interview", "собесед")
+_INTERVIEW_PATTERNS = [
+    re.compile(pattern)
+    for pattern in (
+        r"interview invitation",
+        r"invited to (an )?interview",
+        r"invite you to (an )?interview",
+        r"schedule (an )?interview",
+        r"приглаш[а-я]* на собесед",
+        r"приглашаем на собесед",
+        r"приглашение на собесед",
+        r"назначить собесед",
+    )
+]
+_RE_ISO_DATE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+_RE_OFFER_BLOCK = re.compile(
+    r"(?ms)^\s*(?P<role>[^\n]{2,120})\n"
+    r"(?P<company>[^\n]{2,120})\n"
+    r"[^\n]{0,120}\n"
+    r"(?:[^\n]*\n){0,5}?"
+    r"(?:View job|См\.\s*вакансию):\s*(?P<url>https?://\S+)"
+)
+# Fallback for lines like: "Jobs similar to ... at WalkMe https://..."
+_RE_OFFER_INLINE = re.compile(
+    r"(?im)^(?:Jobs similar to|Вакансии, похожие на).+?\bat\s+(.+?)\s+(https?://\S+)\s*$"
+)
+_RE_FILENAME_UNSAFE = re.compile(r"[\\\\/:*?\"<>|]+")
+# Also matches /comm/jobs/view/<id>: the id follows the same "/jobs/view/".
+_RE_JOB_ID = re.compile(r"/jobs/view/(\d+)")
+_RE_HTML_BR = re.compile(r"(?is)<br\\s*/?>")
+_RE_HTML_P_END = re.compile(r"(?is)</p>")
+_RE_HTML_LI_END = re.compile(r"(?is)</li>")
+_RE_HTML_LI_START = re.compile(r"(?is)<li[^>]*>")
+_RE_HTML_TAG = re.compile(r"(?is)<[^>]+>")
+_RE_BLANK_LINES = re.compile(r"\n{3,}")
+_RE_ABOUT_JOB_MARKUP = re.compile(r'(?is)<div class="show-more-less-html__markup[^>]*>(.*?)</div>')
+_RE_EMAIL_DATE_PREFIX = re.compile(r"^(\d{4}-\d{2}-\d{2})_")
+# Below this many emails, starting worker processes costs more than the scan.
+_PROCESS_POOL_MIN_FILES = 500
+# Concurrent About-the-job downloads in write_company_files.
+_ABOUT_FETCH_WORKERS = 8
+# Downloaded About-the-job texts are kept in the company directory between
+# runs; job descriptions rarely change, so entries live for 30 days.
+_ABOUT_CACHE_FILE_NAME = ".about_job_cache.json"
+_ABOUT_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+_ABOUT_FETCH_FAILED_PREFIX = "Не удалось получить описание автоматически: "
+_ABOUT_NOT_FOUND_TEXT = "Блок 'About the job' не найден автоматически. Откройте ссылку вручную."
+# Emails with a company but no status that mention one of these are listed
+# for manual review. Like the classify() markers, a marker containing a
+# shorter one is left out ("applying" is found through "apply").
+_SUSPECT_MARKERS = (
+    "apply",
+    "application",
+    "заявк",
+    "resume",
+    "cv",
+    "job",
+    "vacancy",
+    "position",
+)
+
+
+@functools.lru_cache(maxsize=8192)
 def normalize_company(name: str) -> str:
     normalized = unicodedata.normalize("NFKC", name)
     normalized = normalized.replace("\u00a0", " ").replace("\u202f", " ")
@@ -31,15 +168,15 @@ def normalize_company(name: str) -> str:
 
 
 def extract_subject(text: str) -> str:
-    match = re.search(r"^(?:Тема|ТЕМА):\s*(.+)$", text, flags=re.MULTILINE)
+    match = _RE_SUBJECT.search(text)
     if match:
         return match.group(1).strip()
     return ""
 
 
-def first_company_match(text: str, patterns: List[str]) -> Optional[str]:
+def first_company_match(text: str, patterns: List[Pattern[str]]) -> Optional[str]:
     for pattern in patterns:
-        match = re.search(pattern, text, flags=re.IGNORECASE | re.MULTILINE)
+        match = pattern.search(text)
         if match:
             company = normalize_company(match.group(1))
             if company:
@@ -51,155 +188,72 @@ def extract_company(text: str, filename: str) -> Optional[str]:
     subject = extract_subject(text)
     haystack = f"{subject}\n{text}\n{filename}"
 
-    patterns = [
-        r"Ваша заявка была отправлена в компанию\s+([^\n]+)",
-        r"Ваша заявка на вакансию.+?в компании\s+([^\n]+)",
-        r"Ваша заявка была просмотрена в компании\s+([^\n]+)",
-        r"your application was sent to\s+([^\n!]+)",
-        r"Your application was viewed by\s+([^\n]+)",
-        r"Thank you for applying to\s+([^\n!]+)",
-        r"Thanks for applying to\s+([^\n!]+)",
-        r"Wow\s*-\s*thanks for applying to\s+([^\n!]+)",
-        r"Thank you for applying for.+?\sat\s+([^\n\.,!]+)",
-        r"Thanks for applying for.+?\sat\s+([^\n\.,!]+)",
-        r"Application to\s+([^\n\)]+)",
-        r"position at\s*([A-Za-z][A-Za-z0-9& .\-]{1,60})",
-        r"Your application at\s+([^\n]+)",
-    ]
-
-    company = first_company_match(haystack, patterns)
+    company = first_company_match(haystack, _COMPANY_PATTERNS)
     if company:
         return company
 
     # Fallback: take last fragment after a dash in filename if it looks like a company.
-    fallback = re.sub(r"^\d{4}-\d{2}-\d{2}_\d{2}-\d{2}\s+-\s+", "", filename).replace(".txt", "")
+    fallback = _RE_FILENAME_TIMESTAMP.sub("", filename).replace(".txt", "")
     fallback = normalize_company(fallback)
     if fallback and "LinkedIn data archive" not in fallback:
         return fallback
     return None
 
 
-def classify(text: str) -> Tuple[bool, bool, bool]:
-    lowered = text.lower()
+def classify(text: str, lowered: Optional[str] = None) -> Tuple[bool, bool, bool]:
+    # Callers that already hold ``text.lower()`` pass it as ``lowered``.
+    if lowered is None:
+        lowered = text.lower()
 
-    is_noise = any(
-        marker in lowered
-        for marker in [
-            "оповещение о вакансиях linkedin",
-            "новая вакансия, соответствующая вашим предпочтениям",
-            "new jobs similar to",
-            "your full linkedin data archive is ready",
-            " and more",
-        ]
-    )
-    if is_noise:
+    if any(marker in lowered for marker in _NOISE_MARKERS):
         return False, False, False
 
-    is_rejection = any(
-        marker in lowered
-        for marker in [
-            "application_rejected",
-            "move forward with other candidates",
-            "decided to move forward with other candidates",
-            "решили двигаться дальше",
-            "отклон",
-            "отказ",
-        ]
-    )
-
-    interview_patterns = [
-        r"interview invitation",
-        r"invited to (an )?interview",
-        r"invite you to (an )?interview",
-        r"schedule (an )?interview",
-        r"приглаш[а-я]* на собесед",
-        r"приглашаем на собесед",
-        r"приглашение на собесед",
-        r"назначить собесед",
-    ]
-    is_interview = any(re.search(pattern, lowered) for pattern in interview_patterns)
-
-    is_application = any(
-        marker in lowered
-        for marker in [
-            "ваша заявка была отправлена в компанию",
-            "ваша заявка на вакансию",
-            "ваша заявка была просмотрена в компании",
-            "thank you for applying",
-            "thanks for applying",
-            "wow - thanks for applying",
-            "we got it: thanks for applying",
-            "your application at",
-            "your application was viewed by",
-            "application to ",
-            "application has been received",
-            "your application was sent to",
-            "we now know that you’d like to join our team",
-            "we now know that you'd like to join our team",
-        ]
+    is_rejection = any(marker in lowered for marker in _REJECTION_MARKERS)
+    is_interview = any(keyword in lowered for keyword in _INTERVIEW_KEYWORDS) and any(
+        pattern.search(lowered) for pattern in _INTERVIEW_PATTERNS
     )
+    is_application = any(marker in lowered for marker in _APPLICATION_MARKERS)
 
     return is_application, is_rejection, is_interview
 
 
-def is_vacancy_digest(text: str) -> bool:
-    lowered = text.lower()
-    return any(
-        marker in lowered
-        for marker in [
-            "linkedin job alerts",
-            "оповещения о вакансиях linkedin",
-            "your job alert for",
-            "ваше оповещение о вакансиях",
-            "new jobs similar to",
-            "jobs similar to",
-            "hired roles near you",
-            "apply now to",
-        ]
-    )
+def is_vacancy_digest(text: str, lowered: Optional[str] = None) -> bool:
+    if lowered is None:
+        lowered = text.lower()
+    return any(marker in lowered for marker in _DIGEST_MARKERS)
 
 
-def is_non_job_noise(text: str) -> bool:
-    lowered = text.lower()
-    return any(
-        marker in lowered
-        for marker in [
-            "your full linkedin data archive is ready",
-            "share their thoughts on linkedin",
-        ]
-    )
+def is_non_job_noise(text: str, lowered: Optional[str] = None) -> bool:
+    if lowered is None:
+        lowered = text.lower()
+    return any(marker in lowered for marker in _NON_JOB_NOISE_MARKERS)
 
 
+@functools.lru_cache(maxsize=4096)
 def format_date(date_raw: str) -> str:
-    match = re.match(r"^(\d{4})-(\d{2})-(\d{2})$", date_raw)
+    # Emails share dates, so the markdown writers hit the cache.
+    match = _RE_ISO_DATE.match(date_raw)
     if not match:
         return date_raw
     year, month, day = match.groups()
     return f"{day}.{month}.{year}"
 
 
-def extract_vacancy_offers(text: str, email_date: str) -> List[Tuple[str, str, str, str]]:
+def extract_vacancy_offers(
+    text: str, email_date: str, lowered: Optional[str] = None
+) -> List[Tuple[str, str, str, str]]:
     """
     Extract offers from job alert/recommendation emails.
     Returns tuples of (company, date, role, url).
     """
     offers: List[Tuple[str, str, str, str]] = []
     seen: Set[Tuple[str, str, str, str]] = set()
-    lowered = text.lower()
 
-    is_vacancy_mail = is_vacancy_digest(text)
+    is_vacancy_mail = is_vacancy_digest(text, lowered)
     if not is_vacancy_mail:
         return offers
 
-    block_pattern = re.compile(
-        r"(?ms)^\s*(?P<role>[^\n]{2,120})\n"
-        r"(?P<company>[^\n]{2,120})\n"
-        r"[^\n]{0,120}\n"
-        r"(?:[^\n]*\n){0,5}?"
-        r"(?:View job|См\.\s*вакансию):\s*(?P<url>https?://\S+)"
-    )
-
-    for match in block_pattern.finditer(text):
+    for match in _RE_OFFER_BLOCK.finditer(text):
         role = normalize_company(match.group("role"))
         company = normalize_company(match.group("company"))
         url = match.group("url").strip()
@@ -214,11 +268,7 @@ def extract_vacancy_offers(text: str, email_date: str) -> List[Tuple[str, str, s
             seen.add(item)
             offers.append(item)
 
-    # Fallback for lines like: "Jobs similar to ... at WalkMe https://..."
-    inline_pattern = re.compile(
-        r"(?im)^(?:Jobs similar to|Вакансии, похожие на).+?\bat\s+(.+?)\s+(https?://\S+)\s*$"
-    )
-    for match in inline_pattern.finditer(text):
+    for match in _RE_OFFER_INLINE.finditer(text):
         company = normalize_company(match.group(1))
         role = "Позиция по ссылке"
         url = match.group(2).strip()
@@ -248,31 +298,28 @@ def build_vacancies_markdown(vacancies: List[Tuple[str, str, str, str]]) -> str:
 
 def filename_from_company(company: str) -> str:
     cleaned = normalize_company(company)
-    cleaned = re.sub(r"[\\\\/:*?\"<>|]+", " ", cleaned)
+    cleaned = _RE_FILENAME_UNSAFE.sub(" ", cleaned)
     cleaned = " ".join(cleaned.split())
     return f"{cleaned}.md" if cleaned else "Компания.md"
 
 
 def extract_job_id(url: str) -> Optional[str]:
-    match = re.search(r"/jobs/view/(\d+)", url)
-    if match:
-        return match.group(1)
-    match = re.search(r"/comm/jobs/view/(\d+)", url)
-    if match:
-        return match.group(1)
-    return None
+    match = _RE_JOB_ID.search(url)
+    return match.group(1) if match else None
 
 
 def strip_html_to_text(raw_html: str) -> str:
-    text = re.sub(r"(?is)<br\\s*/?>", "\n", raw_html)
-    text = re.sub(r"(?is)</p>", "\n\n", text)
-    text = re.sub(r"(?is)</li>", "\n", text)
-    text = re.sub(r"(?is)<li[^>]*>", "- ", text)
-    text = re.sub(r"(?is)<[^>]+>", "", text)
+    # _RE_HTML_BR only matches a literal backslash after "<br", so plain
+    # <br> tags are dropped by _RE_HTML_TAG; skip its scan when it cannot hit.
+    text = _RE_HTML_BR.sub("\n", raw_html) if "\\" in raw_html else raw_html
+    text = _RE_HTML_P_END.sub("\n\n", text)
+    text = _RE_HTML_LI_END.sub("\n", text)
+    text = _RE_HTML_LI_START.sub("- ", text)
+    text = _RE_HTML_TAG.sub("", text)
     text = html.unescape(text)
     lines = [ln.rstrip() for ln in text.splitlines()]
     cleaned = "\n".join(lines)
-    cleaned = re.sub(r"\n{3,}", "\n\n", cleaned).strip()
+    cleaned = _RE_BLANK_LINES.sub("\n\n", cleaned).strip()
     return cleaned
 
 
@@ -289,14 +336,14 @@ def fetch_about_job_text(job_url: str, cache: Dict[str, str]) -> str:
         with urllib.request.urlopen(req, timeout=30) as response:
             raw = response.read().decode("utf-8", errors="ignore")
     except Exception as exc:  # pragma: no cover - network dependent
-        text = f"Не удалось получить описание автоматически: {exc}"
+        text = f"{_ABOUT_FETCH_FAILED_PREFIX}{exc}"
         cache[job_id] = text
         return text
 
     # Description block on LinkedIn public job page payload.
-    match = re.search(r'(?is)<div class="show-more-less-html__markup[^>]*>(.*?)</div>', raw)
+    match = _RE_ABOUT_JOB_MARKUP.search(raw)
     if not match:
-        text = "Блок 'About the job' не найден автоматически. Откройте ссылку вручную."
+        text = _ABOUT_NOT_FOUND_TEXT
         cache[job_id] = text
         return text
 
@@ -307,13 +354,95 @@ def fetch_about_job_text(job_url: str, cache: Dict[str, str]) -> str:
     return text
 
 
+def prefetch_about_job_texts(job_urls: List[str], cache: Dict[str, str]) -> None:
+    """Fill ``cache`` for every job in ``job_urls`` with parallel downloads.
+
+    Each job id is fetched once, through its first URL, exactly as the
+    sequential fetch_about_job_text calls would; those then hit the cache.
+    """
+    first_url_by_id: Dict[str, str] = {}
+    for url in job_urls:
+        job_id = extract_job_id(url)
+        if job_id and job_id not in cache:
+            first_url_by_id.setdefault(job_id, url)
+    if len(first_url_by_id) < 2:
+        return
+    # Workers write distinct keys into the shared cache.
+    with ThreadPoolExecutor(max_workers=_ABOUT_FETCH_WORKERS, thread_name_prefix="about-job") as pool:
+        list(pool.map(lambda url: fetch_about_job_text(url, cache), first_url_by_id.values()))
+
+
+def write_text_if_changed(path: Path, content: str) -> bool:
+    """Write ``content`` unless ``path`` already holds exactly these bytes.
+
+    The output folders are synced to iCloud, so untouched files should keep
+    their mtime. Returns True when the file was written.
+    """
+    data = content.encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+def load_about_cache(cache_path: Path) -> Dict[str, Dict[str, object]]:
+    """Return the unexpired entries of the on-disk About-the-job cache."""
+    try:
+        stored = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(stored, dict):
+        return {}
+    oldest = time.time() - _ABOUT_CACHE_MAX_AGE
+    entries: Dict[str, Dict[str, object]] = {}
+    for job_id, entry in stored.items():
+        if not isinstance(entry, dict) or not isinstance(entry.get("text"), str):
+            continue
+        ts = entry.get("ts")
+        if isinstance(ts, (int, float)) and ts >= oldest:
+            entries[job_id] = entry
+    return entries
+
+
+def save_about_cache(
+    cache_path: Path, entries: Dict[str, Dict[str, object]], fetched: Dict[str, str]
+) -> None:
+    """Write ``entries`` plus the successful downloads in ``fetched``.
+
+    Network errors and pages without the description block are not stored,
+    so the next run retries them.
+    """
+    now = time.time()
+    for job_id, text in fetched.items():
+        if job_id in entries:
+            continue
+        if text.startswith(_ABOUT_FETCH_FAILED_PREFIX) or text == _ABOUT_NOT_FOUND_TEXT:
+            continue
+        entries[job_id] = {"text": text, "ts": now}
+    data = json.dumps(entries, ensure_ascii=False).encode("utf-8")
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        if cache_path.exists() and cache_path.read_bytes() == data:
+            return
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        print(f"Could not save About-the-job cache {cache_path}: {exc}")
+
+
 def write_company_files(vacancies: List[Tuple[str, str, str, str]], company_dir: Path) -> Tuple[int, Set[str]]:
     grouped: Dict[str, List[Tuple[str, str, str]]] = {}
     for company, date_raw, role, url in vacancies:
         grouped.setdefault(company, []).append((date_raw, role, url))
 
     company_dir.mkdir(parents=True, exist_ok=True)
-    fetched_cache: Dict[str, str] = {}
+    cache_path = company_dir / _ABOUT_CACHE_FILE_NAME
+    cache_entries = load_about_cache(cache_path)
+    fetched_cache: Dict[str, str] = {job_id: entry["text"] for job_id, entry in cache_entries.items()}
+    prefetch_about_job_texts([url for _, _, _, url in vacancies], fetched_cache)
     created = 0
     generated_names: Set[str] = set()
 
@@ -332,27 +461,54 @@ def write_company_files(vacancies: List[Tuple[str, str, str, str]], company_dir:
 
         content = "\n".join(lines).rstrip() + "\n"
         path = company_dir / filename_from_company(company)
-        path.write_text(content, encoding="utf-8")
+        write_text_if_changed(path, content)
         generated_names.add(path.name)
         created += 1
 
+    save_about_cache(cache_path, cache_entries, fetched_cache)
     return created, generated_names
 
 
+@functools.lru_cache(maxsize=8192)
 def company_key(name: str) -> str:
     return normalize_company(name).casefold()
 
 
-def archived_companies_from_dir(archive_dir: Path) -> Set[str]:
+def dir_entries(directory: Path) -> List["os.DirEntry[str]"]:
+    """List ``directory`` with one scandir pass; a missing directory is empty.
+
+    DirEntry.is_file() answers from the listing's file type, so callers do
+    not stat every file again.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return list(it)
+    except FileNotFoundError:
+        return []
+
+
+def _note_stem(entry: "os.DirEntry[str]") -> Optional[str]:
+    """Return the stem of a .md/.txt file entry (as ``Path.stem``), else None."""
+    name = entry.name
+    i = name.rfind(".")
+    # Same suffix rule as pathlib: a leading or trailing dot is not one.
+    if not 0 < i < len(name) - 1 or name[i:].lower() not in {".md", ".txt"}:
+        return None
+    if not entry.is_file():
+        return None
+    return name[:i]
+
+
+def archived_companies_from_dir(
+    archive_dir: Path, entries: Optional[List["os.DirEntry[str]"]] = None
+) -> Set[str]:
     keys: Set[str] = set()
-    if not archive_dir.exists():
-        return keys
-    for p in archive_dir.iterdir():
-        if not p.is_file():
-            continue
-        if p.suffix.lower() not in {".md", ".txt"}:
-            continue
-        keys.add(company_key(p.stem))
+    if entries is None:
+        entries = dir_entries(archive_dir)
+    for entry in entries:
+        stem = _note_stem(entry)
+        if stem is not None:
+            keys.add(company_key(stem))
     return keys
 
 
@@ -382,12 +538,11 @@ def load_manual_status_overrides(
         names_target, keys_target = targets
         d = manual_dir / folder
         d.mkdir(parents=True, exist_ok=True)
-        for p in d.iterdir():
-            if not p.is_file():
+        for entry in dir_entries(d):
+            stem = _note_stem(entry)
+            if stem is None:
                 continue
-            if p.suffix.lower() not in {".md", ".txt"}:
-                continue
-            name = normalize_company(p.stem)
+            name = normalize_company(stem)
             if not name:
                 continue
             names_target.add(name)
@@ -432,6 +587,54 @@ def build_review_markdown(entries: List[Tuple[str, str, str]]) -> str:
     return "\n".join(lines)
 
 
+@dataclass
+class FileResult:
+    name: str
+    email_date: str
+    subject: str
+    offers: List[Tuple[str, str, str, str]]
+    company: Optional[str]
+    is_application: bool
+    is_rejection: bool
+    is_interview: bool
+    needs_review: bool
+
+
+def process_file(file_path: Path, archived_names: Set[str]) -> Optional[FileResult]:
+    """Scan one email; ``None`` when it cannot be read.
+
+    Pure function of its arguments, so main() may run it in worker processes.
+    """
+    try:
+        text = file_path.read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return None
+
+    date_match = _RE_EMAIL_DATE_PREFIX.match(file_path.name)
+    email_date = date_match.group(1) if date_match else ""
+    subject = extract_subject(text)
+    # Lowercased once for every marker check below.
+    lowered = text.lower()
+
+    if file_path.name in archived_names:
+        offers: List[Tuple[str, str, str, str]] = []
+    else:
+        offers = extract_vacancy_offers(text, email_date, lowered)
+
+    company = extract_company(text, file_path.name)
+    if not company:
+        return FileResult(file_path.name, email_date, subject, offers, None, False, False, False, False)
+
+    is_application, is_rejection, is_interview = classify(text, lowered)
+    needs_review = False
+    if not (is_application or is_rejection or is_interview):
+        suspect = any(marker in lowered for marker in _SUSPECT_MARKERS)
+        needs_review = suspect and not is_vacancy_digest(text, lowered) and not is_non_job_noise(text, lowered)
+    return FileResult(
+        file_path.name, email_date, subject, offers, company, is_application, is_rejection, is_interview, needs_review
+    )
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Analyze LinkedIn email .txt files and update markdown summary."
@@ -462,10 +665,10 @@ def main() -> None:
     vacancies: List[Tuple[str, str, str, str]] = []
     seen_vacancies: Set[Tuple[str, str, str, str]] = set()
     review_entries: List[Tuple[str, str, str]] = []
-    archived_names: Set[str] = set()
-    archived_company_keys: Set[str] = archived_companies_from_dir(archive_dir)
-    if archive_dir.exists():
-        archived_names = {p.name for p in archive_dir.glob("*.txt")}
+    # One listing of the archive serves both the company keys and the names.
+    archive_entries = dir_entries(archive_dir)
+    archived_company_keys: Set[str] = archived_companies_from_dir(archive_dir, archive_entries)
+    archived_names: Set[str] = {entry.name for entry in archive_entries if entry.name.endswith(".txt")}
     (
         manual_applied_names,
         manual_rejected_names,
@@ -475,69 +678,52 @@ def main() -> None:
         manual_interview_keys,
     ) = load_manual_status_overrides(manual_dir)
 
-    for file_path in sorted(source_dir.glob("*.txt")):
-        try:
-            text = file_path.read_text(encoding="utf-8", errors="ignore")
-        except OSError:
+    file_paths = sorted(source_dir / entry.name for entry in dir_entries(source_dir) if entry.name.endswith(".txt"))
+    scan = functools.partial(process_file, archived_names=archived_names)
+    results: Iterable[Optional[FileResult]]
+    if len(file_paths) >= _PROCESS_POOL_MIN_FILES and (os.cpu_count() or 1) > 1:
+        # Emails are independent and the scan is CPU-bound regex work; map()
+        # keeps file order, so the aggregation below is unchanged.
+        with ProcessPoolExecutor() as pool:
+            results = list(pool.map(scan, file_paths, chunksize=16))
+    else:
+        results = map(scan, file_paths)
+
+    for result in results:
+        if result is None:
             continue
 
-        date_match = re.match(r"^(\d{4}-\d{2}-\d{2})_", file_path.name)
-        email_date = date_match.group(1) if date_match else ""
-        subject = extract_subject(text)
-
-        if file_path.name in archived_names:
-            offers_from_file: List[Tuple[str, str, str, str]] = []
-        else:
-            offers_from_file = extract_vacancy_offers(text, email_date)
-
-        for offer in offers_from_file:
+        for offer in result.offers:
             if offer not in seen_vacancies:
                 seen_vacancies.add(offer)
                 vacancies.append(offer)
 
-        company = extract_company(text, file_path.name)
+        company = result.company
         if not company:
             continue
 
-        is_application, is_rejection, is_interview = classify(text)
-        if is_application or is_rejection or is_interview:
+        if result.is_application or result.is_rejection or result.is_interview:
             applied.add(company)
-        if is_rejection:
+        if result.is_rejection:
             rejected.add(company)
-        if is_interview:
+        if result.is_interview:
             interviews.add(company)
+        if result.needs_review:
+            review_entries.append((result.name, result.email_date, result.subject))
 
-        if not (is_application or is_rejection or is_interview):
-            suspect = any(
-                marker in text.lower()
-                for marker in [
-                    "apply",
-                    "applying",
-                    "application",
-                    "заявк",
-                    "resume",
-                    "cv",
-                    "job",
-                    "vacancy",
-                    "position",
-                ]
-            )
-            if suspect and not is_vacancy_digest(text) and not is_non_job_noise(text):
-                review_entries.append((file_path.name, email_date, subject))
-
-    status_companies: Set[str] = {company_key(c) for c in applied | rejected | interviews}
+    # Every rejected or interview company is also in ``applied`` (see the
+    # loop above), so it alone covers the union of the three sets.
+    status_companies: Set[str] = {company_key(c) for c in applied}
     status_companies |= manual_applied_keys | manual_rejected_keys | manual_interview_keys
+    excluded_keys = status_companies | archived_company_keys
     filtered_vacancies: List[Tuple[str, str, str, str]] = []
     excluded_companies: Set[str] = set()
-    for company, date_raw, role, url in vacancies:
-        ckey = company_key(company)
-        if ckey in status_companies:
-            excluded_companies.add(company)
-            continue
-        if ckey in archived_company_keys:
+    for vacancy in vacancies:
+        company = vacancy[0]
+        if company_key(company) in excluded_keys:
             excluded_companies.add(company)
             continue
-        filtered_vacancies.append((company, date_raw, role, url))
+        filtered_vacancies.append(vacancy)
 
     content = build_markdown(
         applied=sorted(manual_applied_names, key=lambda v: v.lower()),
@@ -546,9 +732,9 @@ def main() -> None:
     )
 
     target_file.parent.mkdir(parents=True, exist_ok=True)
-    target_file.write_text(content, encoding="utf-8")
+    write_text_if_changed(target_file, content)
     vacancies_file.parent.mkdir(parents=True, exist_ok=True)
-    vacancies_file.write_text(build_vacancies_markdown(filtered_vacancies), encoding="utf-8")
+    write_text_if_changed(vacancies_file, build_vacancies_markdown(filtered_vacancies))
     company_dir.mkdir(parents=True, exist_ok=True)
     for company in excluded_companies:
         excluded_path = company_dir / filename_from_company(company)
@@ -560,7 +746,7 @@ def main() -> None:
         if p.name not in keep_names and p.is_file():
             p.unlink()
     review_file.parent.mkdir(parents=True, exist_ok=True)
-    review_file.write_text(build_review_markdown(review_entries), encoding="utf-8")
+    write_text_if_changed(review_file, build_review_markdown(review_entries))
 
     print(f"Updated: {target_file}")
     print(f"Updated: {vacancies_file}")